@@ -1,7 +1,14 @@
 # nuke_importer/__init__.py
-from .ui.main_window import ProjectScannerTool
+try:
+    from .ui.main_window import ProjectScannerTool
+except ImportError as e:
+    # Core modules stay importable outside Nuke, e.g. by the tests
+    ProjectScannerTool = None
+    _import_error = e
 
 def start():
     """Initialize and show the main window"""
+    if ProjectScannerTool is None:
+        raise _import_error
     start.form = ProjectScannerTool()
-    start.form.show()
\ No newline at end of file
+    start.form.show()
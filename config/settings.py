@@ -2,6 +2,8 @@
 """
 Global configuration settings for nuke_importer.
 """
+import os
+
 # PC Mappings Configuration
 PC_USER_MAPPINGS = {
     'CGR-02': 'Faithcure',
@@ -117,7 +119,8 @@ GRID_COLUMNS = 5
 # Column widths for plate list
 PLATE_LIST_COLUMNS = [
     "Plate Name", "Version", "Frame Range",
-    "Resolution", "Format", "Colorspace", "Size", "Path"
+    "Resolution", "Format", "Colorspace", "Size", "Path",
+    "Missing Frames"
 ]
 
 COLUMN_WIDTHS = {
@@ -127,9 +130,71 @@ COLUMN_WIDTHS = {
     3: 100,  # Resolution
     4: 80,   # Format
     5: 100,  # Colorspace
-    6: 80    # Size
+    6: 80,   # Size
+    7: 300,  # Path
+    8: 200   # Missing Frames
 }
 
+# Plate scanning
+SCAN_WORKERS = 8                  # Directories listed concurrently (network storage)
+PLATE_SCAN_BATCH_SIZE = 50        # Plates per batch sent from the scan thread
+PLATE_SCAN_BATCH_INTERVAL = 0.1   # Seconds before a partial batch is sent anyway
+PLATE_LIST_CHUNK_SIZE = 20        # Rows added to the list per event loop pass
+FOLDER_TREE_BATCH_SIZE = 200      # Directories per batch sent to the folder tree
+FOLDER_TREE_LAZY = True           # List folders when expanded instead of walking the project
+
+# Filter settings
+SEARCH_DEBOUNCE = 150             # Milliseconds of typing pause before the list is filtered
+
+# Metadata settings
+METADATA_WORKERS = 8              # Header reads running concurrently
+METADATA_PLACEHOLDER = "..."      # Shown until a row's metadata arrives
+METADATA_LAZY = True              # Only read metadata of rows in the viewport
+METADATA_LOOKAHEAD = 20           # Rows below the viewport read ahead of scrolling
+METADATA_VIEWPORT_DELAY = 50      # Milliseconds to coalesce scroll and resize events
+
+# Watch mode settings
+WATCH_ENABLED = False             # Watch for changes when the tool opens
+WATCH_MODE = 'auto'               # 'auto', 'native' or 'poll'
+WATCH_POLL_INTERVAL = 5000        # Milliseconds between polls
+WATCH_DEBOUNCE = 500              # Milliseconds to coalesce change events
+WATCH_MAX_DIRECTORIES = 2000      # Upper bound of watched directories
+# Network mounts where native change events are not delivered
+WATCH_POLL_PREFIXES = ['//', '/mnt/', '/net/', '/Volumes/']
+
+# Cache settings
+CACHE_DIR = os.environ.get(
+    'NUKE_IMPORTER_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.nuke', 'nuke_importer_cache')
+)
+SCAN_INDEX_ENABLED = True
+SCAN_INDEX_FILE = 'scan_index.db'
+METADATA_CACHE_ENABLED = True
+METADATA_CACHE_FILE = 'metadata_cache.db'
+METADATA_CACHE_MEMORY_ENTRIES = 5000   # Entries kept in memory
+METADATA_CACHE_MAX_ENTRIES = 200000    # Entries kept on disk before eviction
+THUMBNAIL_CACHE_ENABLED = True
+# Point at show storage to share thumbnails between artists
+THUMBNAIL_CACHE_DIR = os.environ.get(
+    'NUKE_IMPORTER_THUMBNAIL_DIR',
+    os.path.join(CACHE_DIR, 'thumbnails')
+)
+THUMBNAIL_CACHE_MAX_BYTES = 2 * 1024 ** 3   # Budget before least recently used entries go
+
+# Thumbnail settings
+THUMBNAIL_SIZE = (320, 180)
+# Decode EXR thumbnails with OpenEXR, Nuke renders only if that fails
+THUMBNAIL_EXR_DIRECT = True
+THUMBNAIL_WORKERS = 2             # Background decodes running at once
+THUMBNAIL_LOADING_DELAY = 150     # Milliseconds before "Loading..." replaces the old thumbnail
+THUMBNAIL_PREFETCH_ROWS = 5       # Rows above and below the selection decoded ahead
+THUMBNAIL_PREFETCH_WORKERS = 1
+THUMBNAIL_MEMORY_BYTES = 64 * 1024 ** 2   # Decoded thumbnails kept in memory
+THUMBNAIL_VIDEO_POSITION = 0.1    # Share of a video skipped before the thumbnail frame
+THUMBNAIL_SCRUB_ENABLED = True    # Hover over a sequence thumbnail to scrub through it
+THUMBNAIL_SCRUB_SIZE = (160, 90)
+THUMBNAIL_SCRUB_MEMORY_BYTES = 64 * 1024 ** 2   # Scrub frames kept per sequence
+
 # Style settings
 STYLES = {
     'progress_bar': """
@@ -141,7 +206,7 @@ STYLES = {
         }
     """,
     'plate_list': """
-        QTreeWidget::item:hover {
+        QTreeView::item:hover {
             background-color: #404040;
         }
     """
@@ -0,0 +1,159 @@
+# nuke_importer/core/exr_thumbnail.py
+"""
+EXR thumbnail decoder.
+
+Builds a small 8-bit sRGB preview straight from an EXR with OpenEXR and
+numpy, without Nuke. Only the RGB channels are read as half floats, and only
+the scanlines the thumbnail samples, so the cost depends on the thumbnail
+size rather than on the plate's resolution or channel count. Compression
+blocks holding several sampled lines are decoded once.
+"""
+try:
+    import OpenEXR
+    import Imath
+    import numpy as np
+except ImportError:
+    # Callers fall back to rendering through Nuke
+    OpenEXR = None
+
+from .image_headers import EXR_COMPRESSION
+
+# Scanlines stored per compressed block
+EXR_BLOCK_LINES = {
+    'none': 1, 'rle': 1, 'zips': 1, 'zip': 16, 'pxr24': 16, 'piz': 32,
+    'b44': 32, 'b44a': 32, 'dwaa': 32, 'dwab': 256,
+}
+
+# Samples averaged per thumbnail pixel along each axis, smooths out aliasing
+SUPERSAMPLE = 2
+
+
+def is_available():
+    """Check whether OpenEXR and numpy can be imported"""
+    return OpenEXR is not None
+
+
+def read_exr_thumbnail(file_path, max_width, max_height):
+    """
+    Decode a thumbnail of an EXR
+
+    Args:
+        file_path (str): Path to a single EXR frame
+        max_width (int): Box the thumbnail is fitted into
+        max_height (int): Box the thumbnail is fitted into
+
+    Returns:
+        numpy.ndarray: Contiguous (height, width, 3) uint8 sRGB image, or None
+            if OpenEXR is missing or the file could not be decoded
+    """
+    if OpenEXR is None:
+        return None
+
+    try:
+        exr = OpenEXR.InputFile(file_path)
+    except (OSError, IOError) as e:
+        print(f"Error opening EXR {file_path}: {str(e)}")
+        return None
+
+    try:
+        header = exr.header()
+        window = header['dataWindow']
+        x0, y0 = window.min.x, window.min.y
+        src_width = window.max.x - x0 + 1
+        src_height = window.max.y - y0 + 1
+        names = _rgb_channels(list(header['channels']))
+        if not names:
+            return None
+
+        pixel_aspect = float(header.get('pixelAspectRatio', 1.0)) or 1.0
+        width, height = _fit(src_width * pixel_aspect, src_height, max_width, max_height)
+
+        # Source lines and columns sampled for every thumbnail pixel
+        rows = _samples(src_height, height * SUPERSAMPLE)
+        columns = _samples(src_width, width * SUPERSAMPLE)
+
+        compression = EXR_COMPRESSION.get(getattr(header['compression'], 'v', None), 'unknown')
+        block_lines = EXR_BLOCK_LINES.get(compression, 32)
+        planes = _read_rows(exr, names, rows, y0, src_width, block_lines)
+    except Exception as e:
+        print(f"Error decoding EXR thumbnail {file_path}: {str(e)}")
+        return None
+    finally:
+        exr.close()
+
+    # (rows, columns, 3), then box filter the supersamples
+    image = np.stack([plane[:, columns] for plane in planes], axis=-1).astype(np.float32)
+    image = image.reshape(height, SUPERSAMPLE, width, SUPERSAMPLE, 3).mean(axis=(1, 3))
+    return np.ascontiguousarray(_to_srgb8(image))
+
+
+def _rgb_channels(channels):
+    """Names of the red, green and blue channels, or luminance repeated"""
+    for prefix in ('', 'rgba.', 'rgb.'):
+        names = [prefix + c for c in 'RGB']
+        if all(name in channels for name in names):
+            return names
+
+    # First layer holding all three, e.g. multi-part "beauty.R"
+    for name in sorted(channels):
+        if name.endswith('.R'):
+            layer = name[:-1]
+            names = [layer + c for c in 'RGB']
+            if all(n in channels for n in names):
+                return names
+
+    for name in ('Y', 'R', 'A'):
+        if name in channels:
+            return [name] * 3
+    return [sorted(channels)[0]] * 3 if channels else []
+
+
+def _fit(width, height, max_width, max_height):
+    """Largest size with the source aspect that fits the box"""
+    scale = min(max_width / width, max_height / height, 1.0)
+    return max(1, int(round(width * scale))), max(1, int(round(height * scale)))
+
+
+def _samples(source, count):
+    """Evenly spaced source indexes, one per output sample"""
+    step = source / count
+    return np.minimum((np.arange(count) * step + step / 2).astype(np.intp), source - 1)
+
+
+def _read_rows(exr, names, rows, y0, width, block_lines):
+    """
+    Read some scanlines of the given channels as float16
+
+    Lines are requested one compression block at a time, so every block
+    holding sampled lines is decompressed exactly once.
+
+    Returns:
+        list: One (len(rows), width) array per channel name
+    """
+    half = Imath.PixelType(Imath.PixelType.HALF)
+    unique = list(dict.fromkeys(names))
+    planes = {name: np.empty((len(rows), width), dtype=np.float16) for name in unique}
+
+    start = 0
+    while start < len(rows):
+        block = rows[start] // block_lines
+        end = start
+        while end < len(rows) and rows[end] // block_lines == block:
+            end += 1
+
+        first, last = rows[start], rows[end - 1]
+        data = exr.channels(unique, half, y0 + first, y0 + last)
+        for name, raw in zip(unique, data):
+            lines = np.frombuffer(raw, dtype=np.float16).reshape(-1, width)
+            planes[name][start:end] = lines[rows[start:end] - first]
+        start = end
+
+    return [planes[name] for name in names]
+
+
+def _to_srgb8(image):
+    """Linear float image to 8-bit sRGB, same transfer Nuke's JPEG Write uses"""
+    image = np.clip(np.nan_to_num(image, nan=0.0, posinf=1.0, neginf=0.0), 0.0, 1.0)
+    srgb = np.where(image <= 0.0031308, image * 12.92,
+                    1.055 * np.power(image, 1.0 / 2.4) - 0.055)
+    return (srgb * 255.0 + 0.5).astype(np.uint8)
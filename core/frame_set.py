@@ -0,0 +1,166 @@
+# nuke_importer/core/frame_set.py
+"""
+Compact frame number set for image sequences.
+
+Frames are stored as sorted inclusive (first, last) ranges, so a complete
+10k frame sequence is a single range. Adds are O(1) amortized: in-order
+frames extend the last range directly, anything else is buffered and merged
+in one sort the next time the ranges are needed.
+"""
+from array import array
+
+
+class FrameSet:
+    __slots__ = ('_ranges', '_pending', '_min', '_max')
+
+    def __init__(self, frames=None):
+        self._ranges = []
+        self._pending = array('q')
+        self._min = None
+        self._max = None
+        if frames:
+            for frame in frames:
+                self.add(frame)
+
+    @classmethod
+    def from_ranges(cls, ranges):
+        """Build a frame set from (first, last) pairs, e.g. read from the scan index"""
+        frame_set = cls()
+        for first, last in ranges:
+            frame_set._ranges.append([first, last])
+        frame_set._normalize()
+        return frame_set
+
+    def add(self, frame):
+        """Add a frame number"""
+        if self._min is None or frame < self._min:
+            self._min = frame
+        if self._max is None or frame > self._max:
+            self._max = frame
+
+        # Fast path for frames arriving in order
+        if not self._pending:
+            if not self._ranges:
+                self._ranges = [[frame, frame]]
+                return
+            last = self._ranges[-1]
+            if frame == last[1] + 1:
+                last[1] = frame
+                return
+            if last[0] <= frame <= last[1]:
+                return
+
+        self._pending.append(frame)
+
+    @property
+    def first(self):
+        """Lowest frame, or None for an empty set"""
+        return self._min
+
+    @property
+    def last(self):
+        """Highest frame, or None for an empty set"""
+        return self._max
+
+    def ranges(self):
+        """Sorted list of inclusive (first, last) ranges"""
+        self._merge_pending()
+        return [(first, last) for first, last in self._ranges]
+
+    def gaps(self):
+        """Sorted list of inclusive (first, last) ranges missing between first and last"""
+        self._merge_pending()
+        return [(self._ranges[i][1] + 1, self._ranges[i + 1][0] - 1)
+                for i in range(len(self._ranges) - 1)]
+
+    def missing_count(self):
+        """Number of frames missing between first and last"""
+        if self._min is None:
+            return 0
+        return self._max - self._min + 1 - len(self)
+
+    def to_ranges(self):
+        """Ranges as nested lists, suitable for JSON"""
+        self._merge_pending()
+        return [[first, last] for first, last in self._ranges]
+
+    def format_range(self):
+        """Frame range as shown in the plate list (1001-1100)"""
+        if self._min is None:
+            return ""
+        return f"{self._min}-{self._max}"
+
+    def format_gaps(self, max_ranges=5):
+        """Missing frames as shown in the plate list (1005, 1010-1011 (3 missing))"""
+        gaps = self.gaps()
+        if not gaps:
+            return ""
+
+        parts = [str(first) if first == last else f"{first}-{last}"
+                 for first, last in gaps[:max_ranges]]
+        if len(gaps) > max_ranges:
+            parts.append("...")
+        return f"{', '.join(parts)} ({self.missing_count()} missing)"
+
+    def __len__(self):
+        self._merge_pending()
+        return sum(last - first + 1 for first, last in self._ranges)
+
+    def __bool__(self):
+        return self._min is not None
+
+    def __iter__(self):
+        for first, last in self.ranges():
+            yield from range(first, last + 1)
+
+    def __contains__(self, frame):
+        self._merge_pending()
+        for first, last in self._ranges:
+            if frame < first:
+                return False
+            if frame <= last:
+                return True
+        return False
+
+    def __eq__(self, other):
+        if not isinstance(other, FrameSet):
+            return NotImplemented
+        return self.ranges() == other.ranges()
+
+    def __repr__(self):
+        return f"FrameSet({self.ranges()})"
+
+    def _merge_pending(self):
+        """Fold buffered out-of-order frames into the ranges"""
+        if not self._pending:
+            return
+
+        pending = sorted(set(self._pending))
+        self._pending = array('q')
+
+        # Turn the buffered frames into runs, then merge with the existing ranges
+        runs = []
+        for frame in pending:
+            if runs and frame == runs[-1][1] + 1:
+                runs[-1][1] = frame
+            else:
+                runs.append([frame, frame])
+
+        self._ranges.extend(runs)
+        self._normalize()
+
+    def _normalize(self):
+        """Sort ranges and merge the ones that overlap or touch"""
+        self._ranges.sort()
+        merged = []
+        for first, last in self._ranges:
+            if merged and first <= merged[-1][1] + 1:
+                if last > merged[-1][1]:
+                    merged[-1][1] = last
+            else:
+                merged.append([first, last])
+        self._ranges = merged
+
+        if merged:
+            self._min = merged[0][0]
+            self._max = merged[-1][1]
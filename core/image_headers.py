@@ -0,0 +1,312 @@
+# nuke_importer/core/image_headers.py
+"""
+Header-only image metadata readers.
+
+Reads resolution, channels, compression, pixel aspect and data window from
+the first few KB of EXR, DPX, Cineon, PNG, JPEG and TIFF files without
+decoding any pixels and without Nuke.
+"""
+import os
+import struct
+
+# Upper bound of header bytes read for formats parsed from one buffer
+MAX_HEADER_BYTES = 256 * 1024
+
+EXR_COMPRESSION = {
+    0: 'none', 1: 'rle', 2: 'zips', 3: 'zip', 4: 'piz', 5: 'pxr24',
+    6: 'b44', 7: 'b44a', 8: 'dwaa', 9: 'dwab',
+}
+
+TIFF_COMPRESSION = {
+    1: 'none', 2: 'ccitt', 5: 'lzw', 6: 'jpeg', 7: 'jpeg', 8: 'zip',
+    32773: 'packbits', 32946: 'zip', 34925: 'lzma',
+}
+
+DPX_DESCRIPTORS = {
+    1: ['R'], 2: ['G'], 3: ['B'], 4: ['A'], 6: ['Y'],
+    50: ['R', 'G', 'B'], 51: ['R', 'G', 'B', 'A'], 52: ['A', 'B', 'G', 'R'],
+}
+
+PNG_CHANNELS = {
+    0: ['Y'], 2: ['R', 'G', 'B'], 3: ['R', 'G', 'B'], 4: ['Y', 'A'], 6: ['R', 'G', 'B', 'A'],
+}
+
+
+class HeaderError(Exception):
+    """Raised when a file does not look like the format it claims to be"""
+
+
+def read_image_header(file_path):
+    """
+    Read image metadata from the file header only
+
+    Args:
+        file_path (str): Path to a single image file (not a %04d pattern)
+
+    Returns:
+        dict: 'format', 'width', 'height', 'channels', 'compression',
+            'pixel_aspect', 'data_window' and 'display_window', or None if
+            the format is not supported or the header could not be parsed
+    """
+    ext = os.path.splitext(file_path)[1].lower()
+    reader = _READERS.get(ext)
+    if reader is None:
+        return None
+
+    try:
+        with open(file_path, 'rb') as f:
+            return reader(f)
+    except (OSError, HeaderError, struct.error, IndexError, ValueError) as e:
+        print(f"Error reading header of {file_path}: {str(e)}")
+        return None
+
+
+def _header(fmt, width, height, channels=None, compression=None, pixel_aspect=1.0,
+            data_window=None, display_window=None, bit_depth=None):
+    """Build the header dict returned by all readers"""
+    full_window = (0, 0, width - 1, height - 1)
+    return {
+        'format': fmt,
+        'width': width,
+        'height': height,
+        'channels': channels or [],
+        'compression': compression,
+        'pixel_aspect': pixel_aspect or 1.0,
+        'data_window': data_window or full_window,
+        'display_window': display_window or full_window,
+        'bit_depth': bit_depth,
+    }
+
+
+def _read_exr(f):
+    """OpenEXR: attributes are name\\0 type\\0 size value, ending with an empty name"""
+    data = f.read(MAX_HEADER_BYTES)
+    if data[:4] != b'\x76\x2f\x31\x01':
+        raise HeaderError("not an OpenEXR file")
+
+    pos = 8
+    attributes = {}
+    while True:
+        end = data.index(b'\0', pos)
+        name = data[pos:end].decode('latin-1')
+        pos = end + 1
+        if not name:
+            break
+
+        end = data.index(b'\0', pos)
+        attr_type = data[pos:end].decode('latin-1')
+        pos = end + 1
+        size = struct.unpack_from('<i', data, pos)[0]
+        pos += 4
+        if pos + size > len(data):
+            raise HeaderError("header larger than the read buffer")
+        attributes[name] = (attr_type, data[pos:pos + size])
+        pos += size
+
+    for key in ('dataWindow', 'displayWindow', 'channels', 'compression'):
+        if key not in attributes:
+            raise HeaderError(f"missing required attribute {key}")
+
+    data_window = struct.unpack('<4i', attributes['dataWindow'][1])
+    display_window = struct.unpack('<4i', attributes['displayWindow'][1])
+
+    channels = []
+    chlist = attributes['channels'][1]
+    cpos = 0
+    while cpos < len(chlist) and chlist[cpos:cpos + 1] != b'\0':
+        end = chlist.index(b'\0', cpos)
+        channels.append(chlist[cpos:end].decode('latin-1'))
+        # pixel type, pLinear + reserved, x/y sampling
+        cpos = end + 1 + 16
+
+    pixel_aspect = 1.0
+    if 'pixelAspectRatio' in attributes:
+        pixel_aspect = struct.unpack('<f', attributes['pixelAspectRatio'][1])[0]
+
+    compression = EXR_COMPRESSION.get(attributes['compression'][1][0], 'unknown')
+
+    return _header(
+        'exr',
+        display_window[2] - display_window[0] + 1,
+        display_window[3] - display_window[1] + 1,
+        channels=channels,
+        compression=compression,
+        pixel_aspect=pixel_aspect,
+        data_window=data_window,
+        display_window=display_window,
+    )
+
+
+def _read_dpx(f):
+    """DPX: fixed offset file, image and orientation headers"""
+    data = f.read(1664)
+    if data[:4] == b'SDPX':
+        endian = '>'
+    elif data[:4] == b'XPDS':
+        endian = '<'
+    else:
+        raise HeaderError("not a DPX file")
+
+    width, height = struct.unpack_from(endian + '2I', data, 772)
+    descriptor, _, _, bit_depth = struct.unpack_from('4B', data, 800)
+    _, encoding = struct.unpack_from(endian + '2H', data, 804)
+
+    pixel_aspect = 1.0
+    if len(data) >= 1636:
+        aspect_h, aspect_v = struct.unpack_from(endian + '2I', data, 1628)
+        if aspect_h and aspect_v and aspect_h != 0xFFFFFFFF and aspect_v != 0xFFFFFFFF:
+            pixel_aspect = aspect_h / float(aspect_v)
+
+    return _header(
+        'dpx', width, height,
+        channels=DPX_DESCRIPTORS.get(descriptor, []),
+        compression='rle' if encoding == 1 else 'none',
+        pixel_aspect=pixel_aspect,
+        bit_depth=bit_depth,
+    )
+
+
+def _read_cineon(f):
+    """Cineon: image information header with per channel sizes"""
+    data = f.read(228)
+    if data[:4] == b'\x80\x2a\x5f\xd7':
+        endian = '>'
+    elif data[:4] == b'\xd7\x5f\x2a\x80':
+        endian = '<'
+    else:
+        raise HeaderError("not a Cineon file")
+
+    channel_count = data[193]
+    bit_depth = data[198]
+    width, height = struct.unpack_from(endian + '2I', data, 200)
+
+    return _header(
+        'cin', width, height,
+        channels=['R', 'G', 'B'][:channel_count] if channel_count else [],
+        compression='none',
+        bit_depth=bit_depth,
+    )
+
+
+def _read_png(f):
+    """PNG: IHDR chunk, plus pHYs for the pixel aspect when it comes before IDAT"""
+    data = f.read(8 + 25)
+    if data[:8] != b'\x89PNG\r\n\x1a\n' or data[12:16] != b'IHDR':
+        raise HeaderError("not a PNG file")
+
+    width, height, bit_depth, color_type = struct.unpack_from('>2I2B', data, 16)
+
+    # Walk the ancillary chunks up to the image data
+    pixel_aspect = 1.0
+    f.seek(8 + 25)
+    while True:
+        chunk = f.read(8)
+        if len(chunk) < 8:
+            break
+        length, chunk_type = struct.unpack('>I4s', chunk)
+        if chunk_type in (b'IDAT', b'IEND'):
+            break
+        if chunk_type == b'pHYs':
+            ppu_x, ppu_y = struct.unpack('>2I', f.read(8))
+            if ppu_x and ppu_y:
+                pixel_aspect = ppu_y / float(ppu_x)
+            break
+        f.seek(length + 4, os.SEEK_CUR)
+
+    return _header(
+        'png', width, height,
+        channels=PNG_CHANNELS.get(color_type, []),
+        compression='deflate',
+        pixel_aspect=pixel_aspect,
+        bit_depth=bit_depth,
+    )
+
+
+def _read_jpeg(f):
+    """JPEG: skip marker segments until the start of frame"""
+    if f.read(2) != b'\xff\xd8':
+        raise HeaderError("not a JPEG file")
+
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            raise HeaderError("no start of frame marker")
+
+        code = marker[1]
+        if code == 0xFF:
+            # Fill byte, the marker code follows
+            f.seek(-1, os.SEEK_CUR)
+            continue
+        if code in (0xD8, 0x01) or 0xD0 <= code <= 0xD7:
+            continue
+
+        length = struct.unpack('>H', f.read(2))[0]
+        # SOF0..SOF15, except DHT (C4), JPG (C8) and DAC (CC)
+        if 0xC0 <= code <= 0xCF and code not in (0xC4, 0xC8, 0xCC):
+            bit_depth, height, width, components = struct.unpack('>BHHB', f.read(6))
+            return _header(
+                'jpeg', width, height,
+                channels=['Y'] if components == 1 else ['R', 'G', 'B', 'K'][:components],
+                compression='progressive' if code in (0xC2, 0xC6, 0xCA, 0xCE) else 'baseline',
+                bit_depth=bit_depth,
+            )
+        if code == 0xDA:
+            raise HeaderError("no start of frame before scan data")
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+def _read_tiff(f):
+    """TIFF: first IFD entries only"""
+    data = f.read(8)
+    if data[:4] == b'II*\0':
+        endian = '<'
+    elif data[:4] == b'MM\0*':
+        endian = '>'
+    else:
+        raise HeaderError("not a classic TIFF file")
+
+    f.seek(struct.unpack_from(endian + 'I', data, 4)[0])
+    entry_count = struct.unpack(endian + 'H', f.read(2))[0]
+    entries = f.read(entry_count * 12)
+
+    tags = {}
+    value_offsets = {}
+    for i in range(entry_count):
+        tag, tag_type, count, value = struct.unpack_from(endian + 'HHI4s', entries, i * 12)
+        if tag_type == 3 and count > 2:
+            # Per channel values (bits per sample) live at an offset
+            value_offsets[tag] = struct.unpack_from(endian + 'I', value)[0]
+        elif tag_type == 3:
+            tags[tag] = struct.unpack_from(endian + 'H', value)[0]
+        elif tag_type == 4 and count == 1:
+            tags[tag] = struct.unpack_from(endian + 'I', value)[0]
+
+    if 258 in value_offsets:
+        f.seek(value_offsets[258])
+        tags[258] = struct.unpack(endian + 'H', f.read(2))[0]
+
+    if 256 not in tags or 257 not in tags:
+        raise HeaderError("missing image size tags")
+
+    samples = tags.get(277, 1)
+    channels = (['Y', 'A'] if samples == 2 else ['Y']) if samples < 3 else ['R', 'G', 'B', 'A'][:samples]
+
+    return _header(
+        'tiff', tags[256], tags[257],
+        channels=channels,
+        compression=TIFF_COMPRESSION.get(tags.get(259, 1), 'unknown'),
+        bit_depth=tags.get(258),
+    )
+
+
+_READERS = {
+    '.exr': _read_exr,
+    '.sxr': _read_exr,
+    '.dpx': _read_dpx,
+    '.cin': _read_cineon,
+    '.png': _read_png,
+    '.jpg': _read_jpeg,
+    '.jpeg': _read_jpeg,
+    '.tif': _read_tiff,
+    '.tiff': _read_tiff,
+}
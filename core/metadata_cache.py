@@ -0,0 +1,214 @@
+# nuke_importer/core/metadata_cache.py
+"""
+Persistent plate metadata cache for the Nuke Importer.
+
+Resolution, colorspace and header fields are stored per sample file, keyed
+by (normalized path, size, mtime), so reopening the tool or clicking a folder
+again does not read headers or create Read nodes for files that have not
+changed. Recently used entries are kept in memory, everything else lives in a
+SQLite database next to the scan index.
+"""
+import os
+import json
+import time
+import sqlite3
+import threading
+from collections import OrderedDict
+from ..config.settings import (CACHE_DIR, METADATA_CACHE_ENABLED, METADATA_CACHE_FILE,
+                               METADATA_CACHE_MEMORY_ENTRIES, METADATA_CACHE_MAX_ENTRIES)
+
+# Bumped whenever the stored metadata format changes, older caches are rebuilt
+CACHE_VERSION = 1
+
+# Number of writes buffered before a commit
+COMMIT_INTERVAL = 200
+
+# Share of the entries kept when the disk store is over its cap
+EVICT_KEEP_RATIO = 0.9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metadata (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    accessed REAL NOT NULL,
+    data TEXT NOT NULL
+)
+"""
+
+
+def metadata_key(file_path):
+    """
+    Build the cache key of a file from its stat data
+
+    Returns:
+        tuple: (normalized path, size, mtime), or None if the file is missing
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return (os.path.normcase(os.path.normpath(file_path)), stat.st_size, stat.st_mtime)
+
+
+class MetadataCache:
+    def __init__(self, db_path, memory_entries=METADATA_CACHE_MEMORY_ENTRIES,
+                 max_entries=METADATA_CACHE_MAX_ENTRIES):
+        self.db_path = db_path
+        self.memory_entries = memory_entries
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._pending_writes = 0
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir, exist_ok=True)
+
+        # Shared between the metadata workers, access is serialized by _lock
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != CACHE_VERSION:
+            self._conn.execute("DROP TABLE IF EXISTS metadata")
+            self._conn.execute(f"PRAGMA user_version = {CACHE_VERSION}")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        self._entry_count = self._conn.execute("SELECT COUNT(*) FROM metadata").fetchone()[0]
+
+    def get(self, key):
+        """
+        Get the cached metadata of a file
+
+        Args:
+            key (tuple): Key built by metadata_key
+
+        Returns:
+            dict: Stored metadata, or None if the file is unknown or changed
+        """
+        if key is None:
+            return None
+        path, size, mtime = key
+
+        with self._lock:
+            entry = self._memory.get(path)
+            if entry is not None and entry[0] == size and entry[1] == mtime:
+                self._memory.move_to_end(path)
+                self.hits += 1
+                return dict(entry[2])
+
+            row = self._conn.execute(
+                "SELECT size, mtime, data FROM metadata WHERE path = ?", (path,)
+            ).fetchone()
+            if row is None or row[0] != size or row[1] != mtime:
+                self.misses += 1
+                return None
+
+            try:
+                data = json.loads(row[2])
+            except ValueError:
+                self.misses += 1
+                return None
+
+            # Refresh the LRU position on disk as well, written with the next commit
+            self._conn.execute("UPDATE metadata SET accessed = ? WHERE path = ?",
+                               (time.time(), path))
+            self._pending_writes += 1
+            self._remember(path, size, mtime, data)
+            self.hits += 1
+            return dict(data)
+
+    def put(self, key, data):
+        """Store the metadata of a file"""
+        if key is None:
+            return
+        path, size, mtime = key
+
+        with self._lock:
+            exists = self._conn.execute(
+                "SELECT 1 FROM metadata WHERE path = ?", (path,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO metadata (path, size, mtime, accessed, data) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (path, size, mtime, time.time(), json.dumps(data))
+            )
+            if not exists:
+                self._entry_count += 1
+            self._remember(path, size, mtime, dict(data))
+            self._pending_writes += 1
+            if self._entry_count > self.max_entries:
+                self._evict()
+            if self._pending_writes >= COMMIT_INTERVAL:
+                self._commit()
+
+    def hit_rate(self):
+        """Share of lookups answered from the cache since it was opened"""
+        lookups = self.hits + self.misses
+        return self.hits / float(lookups) if lookups else 0.0
+
+    def stats(self):
+        """Hit and miss counters, e.g. to verify the cache on a new share"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate(),
+            'memory_entries': len(self._memory),
+            'disk_entries': self._entry_count,
+        }
+
+    def flush(self):
+        """Commit buffered writes"""
+        with self._lock:
+            self._commit()
+
+    def close(self):
+        """Commit and close the database"""
+        with self._lock:
+            self._commit()
+            self._conn.close()
+
+    def _remember(self, path, size, mtime, data):
+        """Put an entry in the in-memory LRU, dropping the least recently used"""
+        self._memory[path] = (size, mtime, data)
+        self._memory.move_to_end(path)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict(self):
+        """Drop the least recently used entries from the disk store"""
+        keep = int(self.max_entries * EVICT_KEEP_RATIO)
+        self._conn.execute(
+            "DELETE FROM metadata WHERE path IN "
+            "(SELECT path FROM metadata ORDER BY accessed LIMIT ?)",
+            (self._entry_count - keep,)
+        )
+        self._entry_count = self._conn.execute("SELECT COUNT(*) FROM metadata").fetchone()[0]
+        self._pending_writes += 1
+
+    def _commit(self):
+        if self._pending_writes:
+            self._conn.commit()
+            self._pending_writes = 0
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_metadata_cache():
+    """Get the shared metadata cache, or None if it is disabled or unavailable"""
+    global _cache
+    if not METADATA_CACHE_ENABLED:
+        return None
+
+    with _cache_lock:
+        if _cache is None:
+            try:
+                _cache = MetadataCache(os.path.join(CACHE_DIR, METADATA_CACHE_FILE))
+            except (OSError, sqlite3.Error) as e:
+                print(f"Metadata cache unavailable: {str(e)}")
+                _cache = False
+        return _cache or None
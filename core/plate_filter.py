@@ -0,0 +1,151 @@
+# nuke_importer/core/plate_filter.py
+"""
+Filter engine for the plate list.
+
+Per plate filter keys and the latest version of every plate are
+computed once from a PlateStore, so applying any combination of search,
+format, version and sequence filters is a single pass over the rows.
+Name searches go through a trigram index and narrow the previous result
+when the query is extended, so they only look at candidate rows.
+"""
+from array import array
+from ..utils.frame_pattern_utils import version_number, strip_version
+
+ALL_FORMATS = 'All Formats'
+ALL_VERSIONS = 'All Versions'
+LATEST_VERSION = 'Latest Version'
+
+
+class PlateFilterIndex:
+    def __init__(self, store):
+        self.store = store
+        self.changes = store.changes
+        self.names = [name.lower() for name in store.names]
+        self.ext_codes = store.ext_codes
+        self.version_codes = store.version_codes
+        self.is_sequence = store.is_sequence
+
+        # Latest version per plate, grouped in one pass on the path without
+        # version tokens, the display name of each version differs
+        plate_keys = [strip_version(path) for path in store.paths]
+        latest = {}
+        for key, number in zip(plate_keys, store.version_numbers):
+            if number > latest.get(key, -2):
+                latest[key] = number
+        self.is_latest = bytearray(
+            number == latest[key] for key, number in zip(plate_keys, store.version_numbers)
+        )
+
+        # Versions of a plate share its name, searches run over distinct names
+        self.name_rows = {}
+        for row, name in enumerate(self.names):
+            rows = self.name_rows.get(name)
+            if rows is None:
+                rows = self.name_rows[name] = array('l')
+            rows.append(row)
+        self.unique_names = list(self.name_rows)
+
+        self._trigrams = None
+        self._last_search = ('', None)
+        self._base = (None, None)
+
+    def build_search_index(self):
+        """Map every trigram of the distinct lowercased names to the names containing it"""
+        if self._trigrams is not None:
+            return
+        trigrams = {}
+        for name_id, name in enumerate(self.unique_names):
+            for gram in {name[i:i + 3] for i in range(len(name) - 2)}:
+                ids = trigrams.get(gram)
+                if ids is None:
+                    ids = trigrams[gram] = array('l')
+                ids.append(name_id)
+        self._trigrams = trigrams
+
+    def search(self, text):
+        """
+        Rows whose name contains a lowercase substring
+
+        Returns:
+            list: Matching rows
+        """
+        last_text, last_ids = self._last_search
+        if last_ids is not None and last_text and last_text in text:
+            # Extended query, the new matches are a subset of the last ones
+            candidates = last_ids
+        elif len(text) >= 3:
+            self.build_search_index()
+            grams = {text[i:i + 3] for i in range(len(text) - 2)}
+            postings = sorted((self._trigrams.get(gram, ()) for gram in grams), key=len)
+            candidates = postings[0]
+            if len(postings) > 1 and candidates:
+                others = set(postings[1])
+                candidates = [name_id for name_id in candidates if name_id in others]
+        else:
+            candidates = range(len(self.unique_names))
+
+        names = self.unique_names
+        name_ids = [name_id for name_id in candidates if text in names[name_id]]
+        self._last_search = (text, name_ids)
+
+        rows = []
+        for name_id in name_ids:
+            rows.extend(self.name_rows[names[name_id]])
+        return rows
+
+    def is_stale(self):
+        """Check whether the store changed since the index was built"""
+        return self.changes != self.store.changes
+
+    def versions(self):
+        """Distinct versions in the list, sorted numerically (v9 before v10)"""
+        return sorted({self.store.strings[code] for code in self.version_codes},
+                      key=lambda version: (version_number(version), version))
+
+    def match(self, search='', format_filter=ALL_FORMATS, version_filter=ALL_VERSIONS,
+              sequence_only=False):
+        """
+        Rows passing all filters
+
+        Args:
+            search (str): Lowercase substring of the plate name
+            format_filter (str): Extension, or 'All Formats'
+            version_filter (str): Version, 'Latest Version' or 'All Versions'
+            sequence_only (bool): Hide single frames and movies
+
+        Returns:
+            bytearray: 1 for every row to show, indexed like the store
+        """
+        key = (format_filter, version_filter, sequence_only)
+        if self._base[0] != key:
+            self._base = (key, self._match_keys(format_filter, version_filter, sequence_only))
+        base = self._base[1]
+        if not search:
+            return bytearray(base)
+
+        visible = bytearray(len(base))
+        for row in self.search(search):
+            visible[row] = base[row]
+        return visible
+
+    def _match_keys(self, format_filter, version_filter, sequence_only):
+        """Rows passing the format, version and sequence filters"""
+        visible = bytearray(b'\x01') * len(self.names)
+
+        if format_filter != ALL_FORMATS:
+            # Compare against the few distinct extensions, not every row
+            codes = {code for code, ext in enumerate(self.store.strings.values)
+                     if ext.endswith(format_filter)}
+            visible = bytearray(v and code in codes for v, code in zip(visible, self.ext_codes))
+
+        if version_filter == LATEST_VERSION:
+            visible = bytearray(v and latest for v, latest in zip(visible, self.is_latest))
+        elif version_filter != ALL_VERSIONS:
+            code = self.store.strings.find(version_filter)
+            visible = bytearray(v and c == code for v, c in zip(visible, self.version_codes))
+
+        if sequence_only:
+            visible = bytearray(v and s for v, s in zip(visible, self.is_sequence))
+
+        return visible
+
@@ -1,26 +1,154 @@
 # nuke_importer/core/plate_info.py
 import os
-import nuke
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from .image_headers import read_image_header
+from .metadata_cache import get_metadata_cache, metadata_key
+from ..config.settings import METADATA_WORKERS
+
+try:
+    import nuke
+except ImportError:
+    # Header readers work without a Nuke session
+    nuke = None
 
 class PlateInfo:
-    def __init__(self, file_path):
+    def __init__(self, file_path, sample_path=None):
         self.file_path = file_path.replace('\\', '/')
+        # Real file on disk (first frame of a sequence) used for header reads
+        self.sample_path = (sample_path or file_path).replace('\\', '/')
         self.extension = os.path.splitext(self.file_path)[1].lower()
         self.resolution = None
         self.frame_range = None
         self.version = None
         self.colorspace = None
         self.size = None
+        self.channels = None
+        self.compression = None
+        self.pixel_aspect = None
+        self.data_window = None
+        self.header_read = False
+        self.from_cache = False
+
+    @classmethod
+    def analyze_batch(cls, plates, workers=METADATA_WORKERS, executor=None):
+        """
+        Read header metadata for many plates concurrently
+
+        Header reads are I/O bound, so a thread pool scales them with the
+        storage instead of paying each round trip in turn. Nuke is never
+        touched here, plates whose headers cannot be read come back with
+        header_read False so the caller can fall back on the main thread.
+
+        Args:
+            plates (list): File paths, or (file_path, sample_path) tuples
+            workers (int, optional): Pool size when no executor is given
+            executor (Executor, optional): Pool to reuse across batches
+
+        Yields:
+            PlateInfo: In completion order
+        """
+        infos = [cls(*plate) if isinstance(plate, (tuple, list)) else cls(plate)
+                 for plate in plates]
+        if not infos:
+            return
+
+        own_executor = executor is None
+        if own_executor:
+            executor = ThreadPoolExecutor(max_workers=max(1, min(workers, len(infos))))
+
+        try:
+            futures = {executor.submit(info._read_without_nuke): info for info in infos}
+            for future in as_completed(futures):
+                info = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"Error analyzing metadata of {info.sample_path}: {str(e)}")
+                    info.header_read = False
+                yield info
+        finally:
+            if own_executor:
+                executor.shutdown(wait=False)
 
     def analyze_metadata(self, current_first=None, current_last=None):
         """Analyze and extract metadata from the plate"""
+        if not os.path.exists(self.sample_path):
+            return
+
+        # Cheap paths: the metadata cache, then the file header
+        if self._read_without_nuke():
+            return
+
+        if nuke is not None:
+            self.analyze_with_nuke(current_first, current_last)
+
+    def load_cached(self):
+        """Fill metadata from the metadata cache, returns False on a miss"""
+        cache = get_metadata_cache()
+        if cache is None:
+            return False
+
+        data = cache.get(metadata_key(self.sample_path))
+        if data is None:
+            return False
+
+        self.resolution = data.get('resolution')
+        self.colorspace = data.get('colorspace')
+        self.channels = data.get('channels')
+        self.compression = data.get('compression')
+        self.pixel_aspect = data.get('pixel_aspect')
+        self.data_window = data.get('data_window')
+        self.header_read = data.get('header_read', False)
+        self.from_cache = True
+        return True
+
+    def store_cached(self):
+        """Store the current metadata in the metadata cache"""
+        cache = get_metadata_cache()
+        if cache is None:
+            return
+
+        cache.put(metadata_key(self.sample_path), {
+            'resolution': self.resolution,
+            'colorspace': self.colorspace,
+            'channels': self.channels,
+            'compression': self.compression,
+            'pixel_aspect': self.pixel_aspect,
+            'data_window': list(self.data_window) if self.data_window else None,
+            'header_read': self.header_read,
+        })
+
+    def _read_without_nuke(self):
+        """Cached metadata or the file header, returns False if Nuke is needed"""
+        if self.load_cached():
+            return True
+        self.header_read = self.read_header()
+        if self.header_read:
+            self.store_cached()
+        return self.header_read
+
+    def read_header(self):
+        """Fill metadata from the file header, returns False if the format is not supported"""
+        if not os.path.exists(self.sample_path):
+            return False
+
+        header = read_image_header(self.sample_path)
+        if header is None:
+            return False
+
+        self.resolution = f"{header['width']} x {header['height']}"
+        self.channels = header['channels']
+        self.compression = header['compression']
+        self.pixel_aspect = header['pixel_aspect']
+        self.data_window = header['data_window']
+        # Same value a fresh Read node reports before any override
+        self.colorspace = "default"
+        return True
+
+    def analyze_with_nuke(self, current_first=None, current_last=None):
+        """Extract metadata through a temporary Read node"""
         temp_node = None
         try:
-            # Replace frame pattern for first frame if it exists
-            test_path = self.file_path.replace('%04d', '0001')
-            if not os.path.exists(test_path):
-                return
-
             temp_node = nuke.createNode('Read', inpanel=False)
             temp_node['file'].fromUserText(self.file_path)
 
@@ -40,6 +168,7 @@ class PlateInfo:
 
             # Get colorspace
             self.colorspace = temp_node['colorspace'].value()
+            self.store_cached()
 
         except Exception as e:
             print(f"Error analyzing metadata: {str(e)}")
@@ -62,4 +191,4 @@ class PlateInfo:
             return f"{format_node.width()} x {format_node.height()}"
         except Exception as e:
             print(f"Error getting format from project: {str(e)}")
-            return "N/A"
\ No newline at end of file
+            return "N/A"
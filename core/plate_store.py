@@ -0,0 +1,210 @@
+# nuke_importer/core/plate_store.py
+"""
+Columnar storage for plate rows.
+
+One array or list per column instead of one dict or widget item per plate.
+Numbers (frames, sizes, numeric versions) live in typed arrays, and columns
+with few distinct values (version, format, resolution, colorspace) are
+dictionary encoded as small integer codes, so a million rows stay compact
+and sort on plain integer keys.
+"""
+from array import array
+from ..utils.format_utils import format_size
+from ..utils.frame_pattern_utils import version_number
+
+# Column indexes, same order as PLATE_LIST_COLUMNS
+COL_NAME, COL_VERSION, COL_FRAME_RANGE, COL_RESOLUTION, COL_FORMAT, \
+    COL_COLORSPACE, COL_SIZE, COL_PATH, COL_MISSING = range(9)
+
+# Code stored for metadata that has not been read yet
+NO_VALUE = -1
+
+
+class ValueTable:
+    """Dictionary encoding of a low cardinality string column"""
+
+    def __init__(self):
+        self.values = []
+        self._codes = {}
+
+    def code(self, value):
+        """Code of a value, added on first use"""
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def find(self, value):
+        """Code of a value, or None if it was never added"""
+        return self._codes.get(value)
+
+    def __getitem__(self, code):
+        return self.values[code]
+
+
+class PlateStore:
+    def __init__(self):
+        self.strings = ValueTable()
+        self.names = []
+        self.paths = []
+        self.first_frame_paths = []
+        self.version_codes = array('l')
+        self.version_numbers = array('l')
+        self.ext_codes = array('l')
+        self.first_frames = array('q')
+        self.last_frames = array('q')
+        self.sizes = array('q')
+        self.resolution_codes = array('l')
+        self.colorspace_codes = array('l')
+        self.is_sequence = bytearray()
+        # Missing frames are rare, kept sparse as row -> (text, count)
+        self.missing = {}
+        self._rows = {}
+        # Bumped on every row change, lets derived indexes notice they are stale
+        self.changes = 0
+
+    def __len__(self):
+        return len(self.paths)
+
+    def row(self, plate_path):
+        """Row of a plate path, or None"""
+        return self._rows.get(plate_path)
+
+    def append(self, plate):
+        """
+        Add a plate record from the scanner
+
+        Returns:
+            int: Row of the plate, an existing row is updated in place
+        """
+        row = self._rows.get(plate['path'])
+        if row is not None:
+            self.update(row, plate)
+            return row
+
+        row = len(self.paths)
+        self.changes += 1
+        self._rows[plate['path']] = row
+        self.names.append(plate['display_name'])
+        self.paths.append(plate['path'])
+        self.first_frame_paths.append(plate['first_frame_path'])
+        self.version_codes.append(self.strings.code(plate['version']))
+        self.version_numbers.append(version_number(plate['version']))
+        self.ext_codes.append(self.strings.code(plate['ext']))
+        self.first_frames.append(0)
+        self.last_frames.append(0)
+        self.sizes.append(0)
+        self.resolution_codes.append(NO_VALUE)
+        self.colorspace_codes.append(NO_VALUE)
+        self.is_sequence.append(0)
+        self.update(row, plate)
+        return row
+
+    def update(self, row, plate):
+        """Refresh the scan derived columns of a row (frames, size, missing frames)"""
+        self.changes += 1
+        frames = plate.get('frames')
+        if plate.get('is_sequence') and frames:
+            self.first_frames[row] = frames.first
+            self.last_frames[row] = frames.last
+            self.is_sequence[row] = 1
+        else:
+            self.is_sequence[row] = 0
+        self.first_frame_paths[row] = plate['first_frame_path']
+        self.sizes[row] = plate.get('size', 0)
+        if plate.get('missing_frames'):
+            self.missing[row] = (plate['missing_frames'], frames.missing_count() if frames else 0)
+        else:
+            self.missing.pop(row, None)
+
+    def remove(self, plate_path):
+        """Remove a plate, rows after it move up by one"""
+        row = self._rows.pop(plate_path, None)
+        if row is None:
+            return None
+
+        self.changes += 1
+        for column in (self.names, self.paths, self.first_frame_paths, self.version_codes,
+                       self.version_numbers, self.ext_codes, self.first_frames,
+                       self.last_frames, self.sizes, self.resolution_codes,
+                       self.colorspace_codes, self.is_sequence):
+            del column[row]
+        self.missing = {r - 1 if r > row else r: value
+                        for r, value in self.missing.items() if r != row}
+        for path in self.paths[row:]:
+            self._rows[path] -= 1
+        return row
+
+    def set_metadata(self, row, resolution, colorspace):
+        """Store the resolution and colorspace read for a row"""
+        self.resolution_codes[row] = self.strings.code(resolution or "N/A")
+        self.colorspace_codes[row] = self.strings.code(colorspace or "N/A")
+
+    def has_metadata(self, row):
+        return self.resolution_codes[row] != NO_VALUE
+
+    def text(self, row, column, placeholder=""):
+        """Display text of a cell, same values the plate list shows"""
+        if column == COL_NAME:
+            return self.names[row]
+        if column == COL_VERSION:
+            return self.strings[self.version_codes[row]]
+        if column == COL_FRAME_RANGE:
+            if self.is_sequence[row]:
+                return f"{self.first_frames[row]}-{self.last_frames[row]}"
+            return "Single Frame"
+        if column == COL_RESOLUTION:
+            code = self.resolution_codes[row]
+            return placeholder if code == NO_VALUE else self.strings[code]
+        if column == COL_FORMAT:
+            return self.strings[self.ext_codes[row]]
+        if column == COL_COLORSPACE:
+            code = self.colorspace_codes[row]
+            return placeholder if code == NO_VALUE else self.strings[code]
+        if column == COL_SIZE:
+            return format_size(self.sizes[row])
+        if column == COL_PATH:
+            return self.paths[row]
+        if column == COL_MISSING:
+            return self.missing.get(row, ("", 0))[0]
+        return ""
+
+    def sort_keys(self, column):
+        """
+        Sort key of every row for a column
+
+        Numeric columns sort by value (v9 before v10, 2 GB after 900 MB),
+        text columns case insensitively.
+        """
+        if column == COL_VERSION:
+            return self.version_numbers
+        if column == COL_FRAME_RANGE:
+            return self.first_frames
+        if column == COL_SIZE:
+            return self.sizes
+        if column == COL_MISSING:
+            counts = [0] * len(self.paths)
+            for row, (_, count) in self.missing.items():
+                counts[row] = count
+            return counts
+        if column in (COL_RESOLUTION, COL_FORMAT, COL_COLORSPACE):
+            codes = {COL_RESOLUTION: self.resolution_codes, COL_FORMAT: self.ext_codes,
+                     COL_COLORSPACE: self.colorspace_codes}[column]
+            value_key = _resolution_key if column == COL_RESOLUTION else str.lower
+            # Rank each distinct value once instead of comparing strings per row
+            ranked = sorted(range(len(self.strings.values)),
+                            key=lambda code: value_key(self.strings[code]))
+            ranks = {code: rank for rank, code in enumerate(ranked)}
+            return [ranks.get(code, -1) for code in codes]
+        values = self.names if column == COL_NAME else self.paths
+        return [value.lower() for value in values]
+
+
+def _resolution_key(text):
+    """Sort "1920 x 1080" by pixel count, unknown values first"""
+    try:
+        width, height = text.split(' x ')
+        return (int(width) * int(height), text)
+    except ValueError:
+        return (-1, text)
@@ -0,0 +1,341 @@
+# nuke_importer/core/scan_index.py
+"""
+Persistent scan index for the Nuke Importer.
+
+Stores the listing of every scanned directory (mtime, sub directories,
+supported files and grouped plates) in a SQLite database so a rescan only
+has to re-list directories whose mtime changed. Plates are also kept one
+row each with a trigram full text index over their names, which answers
+project wide searches without walking any directory.
+"""
+import os
+import json
+import time
+import sqlite3
+import threading
+from ..config.settings import CACHE_DIR, SCAN_INDEX_FILE, SCAN_INDEX_ENABLED
+from .frame_set import FrameSet
+from ..utils.frame_pattern_utils import version_number, strip_version
+
+# Bumped whenever the stored listing format changes, older indexes are rebuilt
+INDEX_VERSION = 4
+
+# Listings taken this close to the directory mtime are not trusted, a change
+# in the same mtime tick would otherwise go unnoticed
+MTIME_GRACE = 2.0
+
+# Number of writes buffered before a commit
+COMMIT_INTERVAL = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS directories (
+    path TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    scanned REAL NOT NULL,
+    subdirs TEXT NOT NULL,
+    files TEXT NOT NULL,
+    plates TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS plates (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    dir TEXT NOT NULL,
+    name TEXT NOT NULL,
+    base TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    plate TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS plates_dir ON plates (dir);
+CREATE TABLE IF NOT EXISTS walks (
+    path TEXT PRIMARY KEY,
+    directories INTEGER NOT NULL
+);
+"""
+
+# Trigram full text index kept in sync with the plates table, needs SQLite 3.34+
+_SEARCH_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS plate_search
+    USING fts5(name, content='plates', content_rowid='id', tokenize='trigram');
+CREATE TRIGGER IF NOT EXISTS plates_insert AFTER INSERT ON plates BEGIN
+    INSERT INTO plate_search (rowid, name) VALUES (new.id, new.name);
+END;
+CREATE TRIGGER IF NOT EXISTS plates_delete AFTER DELETE ON plates BEGIN
+    INSERT INTO plate_search (plate_search, rowid, name) VALUES ('delete', old.id, old.name);
+END;
+"""
+
+# Upper bound of results returned by a project wide search
+SEARCH_LIMIT = 500
+
+
+class ScanIndex:
+    """Directory paths are stored normalized, callers may pass them in any form"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._pending_writes = 0
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir, exist_ok=True)
+
+        # Shared between the scan threads, access is serialized by _lock
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != INDEX_VERSION:
+            self._conn.executescript(
+                "DROP TABLE IF EXISTS plate_search; DROP TABLE IF EXISTS plates; "
+                "DROP TABLE IF EXISTS directories; DROP TABLE IF EXISTS walks;"
+            )
+            self._conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+        self._conn.executescript(_SCHEMA)
+        try:
+            self._conn.executescript(_SEARCH_SCHEMA)
+            self._full_text = True
+        except sqlite3.OperationalError:
+            # No FTS5 or no trigram tokenizer, searches fall back to LIKE
+            self._full_text = False
+        self._conn.commit()
+
+    def get(self, path, mtime):
+        """
+        Get the cached listing of a directory
+
+        Args:
+            path (str): Directory path
+            mtime (float): Current mtime of the directory
+
+        Returns:
+            dict: Listing with subdirs, files and plates, or None if the
+                directory is unknown or has changed since it was indexed
+        """
+        path = os.path.normpath(path)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mtime, scanned, subdirs, files, plates FROM directories WHERE path = ?",
+                (path,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        cached_mtime, scanned, subdirs, files, plates = row
+        if cached_mtime != mtime or scanned - mtime < MTIME_GRACE:
+            return None
+
+        try:
+            return {
+                'path': path,
+                'subdirs': json.loads(subdirs),
+                'files': json.loads(files),
+                'plates': [_decode_plate(p) for p in json.loads(plates)],
+            }
+        except ValueError:
+            return None
+
+    def put(self, listing, mtime):
+        """Store a fresh directory listing"""
+        path = os.path.normpath(listing['path'])
+        plates = [_encode_plate(p) for p in listing['plates']]
+        values = (
+            path,
+            mtime,
+            time.time(),
+            json.dumps(listing['subdirs']),
+            json.dumps(listing['files']),
+            json.dumps(plates),
+        )
+        # Versions of a plate share the base name they are ranked under
+        plate_rows = [
+            (plate['path'], path, plate['display_name'].lower(),
+             strip_version(plate['display_name'].lower()),
+             version_number(plate['version']), json.dumps(plate))
+            for plate in plates
+        ]
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO directories "
+                "(path, mtime, scanned, subdirs, files, plates) VALUES (?, ?, ?, ?, ?, ?)",
+                values
+            )
+            self._conn.execute("DELETE FROM plates WHERE dir = ?", (path,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO plates (path, dir, name, base, version, plate) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                plate_rows
+            )
+            self._pending_writes += 1
+            if self._pending_writes >= COMMIT_INTERVAL:
+                self._commit()
+
+    def get_subdirs(self, path):
+        """Get the indexed sub directory names of a directory, without mtime checks"""
+        path = os.path.normpath(path)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT subdirs FROM directories WHERE path = ?", (path,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_walk_size(self, path):
+        """Directory count of the last complete walk of path, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT directories FROM walks WHERE path = ?", (path,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_walk_size(self, path, directories):
+        """Remember how many directories a complete walk of path listed"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO walks (path, directories) VALUES (?, ?)",
+                (path, directories)
+            )
+            self._pending_writes += 1
+
+    def peek(self, path):
+        """
+        Get the indexed sub directories and files of a directory without mtime checks
+
+        Cheap hint for what a directory contained the last time it was listed,
+        e.g. to decide whether a folder tree item can be expanded.
+
+        Returns:
+            dict: 'subdirs' and 'files', or None if the directory is unknown
+        """
+        path = os.path.normpath(path)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT subdirs, files FROM directories WHERE path = ?", (path,)
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return {'subdirs': json.loads(row[0]), 'files': json.loads(row[1])}
+        except ValueError:
+            return None
+
+    def remove_tree(self, path):
+        """Forget a directory and everything below it"""
+        path = os.path.normpath(path)
+        prefix = path.rstrip('/\\') + os.sep
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM directories WHERE path = ? OR substr(path, 1, ?) = ?",
+                (path, len(prefix), prefix)
+            )
+            self._conn.execute(
+                "DELETE FROM plates WHERE dir = ? OR substr(dir, 1, ?) = ?",
+                (path, len(prefix), prefix)
+            )
+            self._pending_writes += 1
+
+    def search_plates(self, text, root=None, limit=SEARCH_LIMIT):
+        """
+        Search plate names across every indexed directory
+
+        Results are ranked exact name first, then on the name without its
+        version: exact match, names starting with the text, shorter names,
+        and newest version first within a name.
+
+        Args:
+            text (str): Substring of the plate name, case insensitive
+            root (str, optional): Only return plates below this directory
+            limit (int, optional): Maximum number of results
+
+        Returns:
+            list: Plate records, best match first
+        """
+        text = text.strip().lower()
+        if not text:
+            return []
+
+        conditions = []
+        params = []
+        if self._full_text and len(text) >= 3:
+            # Quoted so the text is matched literally, not parsed as a query
+            conditions.append("id IN (SELECT rowid FROM plate_search WHERE plate_search MATCH ?)")
+            params.append('"' + text.replace('"', '""') + '"')
+        else:
+            conditions.append("instr(name, ?) > 0")
+            params.append(text)
+
+        if root:
+            root = os.path.normpath(root)
+            prefix = root.rstrip('/\\') + os.sep
+            conditions.append("(dir = ? OR substr(dir, 1, ?) = ?)")
+            params.extend([root, len(prefix), prefix])
+
+        query = (
+            "SELECT plate FROM plates WHERE " + " AND ".join(conditions) +
+            " ORDER BY name = ? DESC, base = ? DESC, substr(base, 1, ?) = ? DESC,"
+            " length(base), base, version DESC, name LIMIT ?"
+        )
+        params.extend([text, text, len(text), text, limit])
+
+        # Flush first so plates listed by a running scan are found as well
+        with self._lock:
+            self._commit()
+            rows = self._conn.execute(query, params).fetchall()
+
+        plates = []
+        for (plate,) in rows:
+            try:
+                plates.append(_decode_plate(json.loads(plate)))
+            except ValueError:
+                continue
+        return plates
+
+    def flush(self):
+        """Commit buffered writes"""
+        with self._lock:
+            self._commit()
+
+    def close(self):
+        """Commit and close the database"""
+        with self._lock:
+            self._commit()
+            self._conn.close()
+
+    def _commit(self):
+        if self._pending_writes:
+            self._conn.commit()
+            self._pending_writes = 0
+
+
+def _encode_plate(plate):
+    """Make a plate record JSON serializable"""
+    if 'frames' in plate:
+        plate = dict(plate)
+        plate['frames'] = plate['frames'].to_ranges()
+    return plate
+
+
+def _decode_plate(plate):
+    """Restore a plate record read from the index"""
+    if 'frames' in plate:
+        plate['frames'] = FrameSet.from_ranges(plate['frames'])
+    return plate
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_scan_index():
+    """Get the shared scan index, or None if it is disabled or unavailable"""
+    global _index
+    if not SCAN_INDEX_ENABLED:
+        return None
+
+    with _index_lock:
+        if _index is None:
+            try:
+                _index = ScanIndex(os.path.join(CACHE_DIR, SCAN_INDEX_FILE))
+            except (OSError, sqlite3.Error) as e:
+                print(f"Scan index unavailable: {str(e)}")
+                _index = False
+        return _index or None
@@ -0,0 +1,97 @@
+# nuke_importer/core/scan_pool.py
+"""
+Shared, prioritized worker pool for directory listings.
+
+Every walk submits its listings here, so the folder the user just clicked
+is listed ahead of background tree population instead of queueing behind
+it. Jobs of the same priority run in submission order, or in the order a
+walk will consume them, cancelled jobs are skipped without touching the
+disk.
+"""
+import heapq
+import itertools
+import threading
+from concurrent.futures import Future
+from ..config.settings import SCAN_WORKERS
+
+# Lower runs first
+PRIORITY_FOREGROUND = 0   # Plate scan of the folder the user picked
+PRIORITY_BROWSE = 1       # Folder tree items the user expands
+PRIORITY_BACKGROUND = 2   # Tree population and look-ahead
+
+
+class PriorityExecutor:
+    def __init__(self, workers=SCAN_WORKERS):
+        self.workers = workers
+        self._queue = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._threads = []
+
+    def submit(self, priority, fn, *args, **kwargs):
+        """
+        Queue a call
+
+        Args:
+            priority (int): One of the PRIORITY_* values, lower runs first
+            fn (callable): Called on a worker thread with args and kwargs
+
+        Returns:
+            Future: Cancelling it before it starts drops the job
+        """
+        return self.submit_ordered(priority, (), fn, *args, **kwargs)
+
+    def submit_ordered(self, priority, order, fn, *args, **kwargs):
+        """
+        Queue a call ahead of same priority jobs with a larger order
+
+        Args:
+            priority (int): One of the PRIORITY_* values, lower runs first
+            order (tuple): Compared between jobs of the same priority, e.g.
+                the sibling indexes leading to a directory, which sort in
+                depth first walk order. Plain submits use ()
+            fn (callable): Called on a worker thread with args and kwargs
+
+        Returns:
+            Future: Cancelling it before it starts drops the job
+        """
+        future = Future()
+        with self._condition:
+            heapq.heappush(self._queue,
+                           (priority, order, next(self._counter), future, fn, args, kwargs))
+            if len(self._threads) < self.workers:
+                # Daemon threads, an idle pool must never keep Nuke from exiting
+                thread = threading.Thread(target=self._work, name="scan-pool", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+            self._condition.notify()
+        return future
+
+    def _work(self):
+        while True:
+            with self._condition:
+                while not self._queue:
+                    self._condition.wait()
+                _, _, _, future, fn, args, kwargs = heapq.heappop(self._queue)
+
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_scan_pool():
+    """Get the pool shared by all scans"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = PriorityExecutor(SCAN_WORKERS)
+        return _pool
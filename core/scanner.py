@@ -1,9 +1,401 @@
+# nuke_importer/core/scanner.py
 """
 Core scanning functionality for the Nuke Importer.
+
+Walks a folder with a single os.scandir pass per directory and groups the
+files it finds into plate records (image sequences and single files) that
+the UI only has to render.
 """
 import os
-from config.settings import SUPPORTED_FORMATS
+import threading
+from ..config.settings import SUPPORTED_FORMATS
+from ..utils.frame_pattern_utils import tokenize_filename, split_frame, sequence_padding
+from .frame_set import FrameSet
+from .scan_pool import get_scan_pool, PRIORITY_BACKGROUND
+
+VIDEO_FORMATS = ['.mov', '.mp4', '.mkv', '.avi', '.wmv']
+GEO_FORMATS = ['.fbx', '.obj', '.abc']
+
+_SUPPORTED_FORMATS = frozenset(SUPPORTED_FORMATS)
+_VIDEO_FORMATS = frozenset(VIDEO_FORMATS)
+_GEO_FORMATS = frozenset(GEO_FORMATS)
+
+
+def scan_directory(path, progress_callback=None, should_stop=None, index=None, workers=1,
+                   priority=PRIORITY_BACKGROUND):
+    """
+    Scan directory for supported files and group them into plates
+
+    Args:
+        path (str): Folder to scan recursively
+        progress_callback (callable, optional): Called once per directory
+            with (scanned_dirs, expected_dirs, current_dir). expected_dirs is
+            the directory count of the last complete walk of path when the
+            index knows it, and never less than the directories seen so far
+        should_stop (callable, optional): Polled before each directory,
+            the scan stops early when it returns True
+        index (ScanIndex, optional): Persistent index used to skip
+            directories that have not changed since the last scan
+        workers (int, optional): More than one lists directories
+            concurrently on the shared scan pool
+        priority (int, optional): Scan pool priority of the listings
+
+    Returns:
+        list: Plate records (dicts) in directory order
+    """
+    plates = []
+    for _, dir_plates in iter_directory_plates(path, progress_callback, should_stop,
+                                               index, workers, priority):
+        plates.extend(dir_plates)
+    return plates
+
+
+def iter_directory_plates(path, progress_callback=None, should_stop=None, index=None,
+                          workers=1, priority=PRIORITY_BACKGROUND):
+    """
+    Walk path and yield (directory, plate records) for directories with plates
+
+    Sequences never span directories, so a directory's plates are complete
+    as soon as it has been listed.
+    """
+    for listing in walk_directories(path, progress_callback, should_stop, index, workers,
+                                    priority):
+        if listing['plates']:
+            yield listing['path'], listing['plates']
+
+
+def walk_directories(path, progress_callback=None, should_stop=None, index=None, workers=1,
+                     priority=PRIORITY_BACKGROUND):
+    """
+    Walk path depth first and yield one listing per directory
+
+    Each directory is listed exactly once with os.scandir, or not at all when
+    the index holds a listing taken at the same mtime. With more than one
+    worker, directories are listed ahead of the walk on the shared scan pool
+    at the given priority while listings are still yielded in the same depth
+    first order.
+
+    Yields:
+        dict: Listing with 'path', 'subdirs', 'files' and 'plates'
+    """
+    if not path or not os.path.isdir(path):
+        return
+
+    # Previous complete walks tell how many directories to expect
+    walk_key = os.path.normpath(path)
+    expected_dirs = index.get_walk_size(walk_key) if index else None
+    report = progress_callback
+    if progress_callback and expected_dirs:
+        def report(scanned_dirs, known_dirs, current_dir):
+            progress_callback(scanned_dirs, max(known_dirs, expected_dirs), current_dir)
+
+    scanned_dirs = 0
+    try:
+        if workers and workers > 1:
+            listings = _walk_parallel(path, report, should_stop, index, priority)
+        else:
+            listings = _walk_serial(path, report, should_stop, index)
+        for listing in listings:
+            scanned_dirs += 1
+            yield listing
+
+        if index and not (should_stop and should_stop()):
+            index.set_walk_size(walk_key, scanned_dirs)
+    finally:
+        if index:
+            index.flush()
+
+
+def _walk_serial(path, progress_callback, should_stop, index):
+    """Depth first walk listing one directory at a time"""
+    pending = [path]
+    scanned_dirs = 0
+
+    while pending:
+        if should_stop and should_stop():
+            return
+
+        listing = list_directory(pending.pop(), index)
+        root = listing['path']
+
+        # Reverse so the stack pops subdirectories in name order
+        pending.extend(os.path.join(root, d) for d in reversed(listing['subdirs']))
+        scanned_dirs += 1
+
+        if progress_callback:
+            progress_callback(scanned_dirs, scanned_dirs + len(pending), root)
+
+        yield listing
+
+
+def _walk_parallel(path, progress_callback, should_stop, index, priority):
+    """Depth first walk that lists directories ahead of time on the scan pool"""
+    pool = get_scan_pool()
+    # Futures not consumed yet, cancelled when the walk stops early
+    queued = set()
+    lock = threading.Lock()
+    stopped = []
+
+    def submit(dir_path, order):
+        """Queue a listing, or return None once the walk has stopped"""
+        # Checked and recorded under one lock so the cancel loop sees every job
+        with lock:
+            if stopped:
+                return None
+            # The order keeps the pool on the listings the walk needs next
+            future = pool.submit_ordered(priority, order, list_ahead, dir_path, order)
+            queued.add(future)
+        return future
+
+    def list_ahead(dir_path, order):
+        # Children are queued as soon as their parent is listed, not when
+        # the walk reaches it, so latency overlaps at every depth
+        listing = list_directory(dir_path, index)
+        children = [submit(os.path.join(listing['path'], d), order + (i,))
+                    for i, d in enumerate(listing['subdirs'])]
+        return listing, children
+
+    # Stack of futures, popped in the same order as the serial walk
+    pending = [submit(path, ())]
+    scanned_dirs = 0
+
+    try:
+        while pending:
+            if should_stop and should_stop():
+                return
+
+            future = pending.pop()
+            listing, children = future.result()
+            with lock:
+                queued.discard(future)
+            pending.extend(reversed(children))
+            scanned_dirs += 1
+
+            if progress_callback:
+                progress_callback(scanned_dirs, scanned_dirs + len(pending), listing['path'])
+
+            yield listing
+    finally:
+        # A stopped walk leaves nothing queued behind it
+        with lock:
+            stopped.append(True)
+            for future in queued:
+                future.cancel()
+
+
+def relist_directories(paths, index=None):
+    """
+    List directories reported as changed again, for watch mode
+
+    Sub directories that appeared since the indexed listing are walked as
+    well. Listings equal to the indexed ones are dropped, so callers only
+    patch what actually changed.
+
+    Args:
+        paths (list): Changed directories
+        index (ScanIndex, optional): Holds the previous listings
+
+    Returns:
+        list: Listings in walk order, a removed directory gets one with
+            'subdirs' None
+    """
+    listings = []
+    for path in paths:
+        path = os.path.normpath(path)
+        if not os.path.isdir(path):
+            listings.append({'path': path, 'subdirs': None, 'files': [], 'plates': []})
+            continue
+
+        before = index.peek(path) if index else None
+        listing = list_directory(path, index)
+        if before is not None and before['subdirs'] == listing['subdirs'] \
+                and before['files'] == listing['files']:
+            continue
+        listings.append(listing)
+
+        # Without a previous listing nothing is known to be new
+        known = set(before['subdirs']) if before is not None else set(listing['subdirs'])
+        for name in listing['subdirs']:
+            if name not in known:
+                listings.extend(walk_directories(os.path.join(path, name), index=index))
+
+    if index:
+        index.flush()
+    return listings
+
+
+def list_directory(root, index=None):
+    """
+    List a single directory and group its plates
+
+    Args:
+        root (str): Directory to list
+        index (ScanIndex, optional): Index consulted before touching the
+            directory contents and updated after a fresh listing
+
+    Returns:
+        dict: Listing with 'path', 'subdirs', 'files' and 'plates'
+    """
+    mtime = None
+    if index:
+        try:
+            mtime = os.stat(root).st_mtime
+        except OSError:
+            mtime = None
+
+        if mtime is not None:
+            cached = index.get(root, mtime)
+            if cached is not None:
+                return cached
+
+    subdirs, files, sizes = _scan_entries(root)
+    listing = {
+        'path': root,
+        'subdirs': subdirs,
+        'files': files,
+        'plates': group_files(root, files, sizes) if files else [],
+    }
+
+    if index and mtime is not None:
+        # Drop sub trees that disappeared since the last listing
+        previous = index.get_subdirs(root)
+        if previous:
+            for name in set(previous) - set(subdirs):
+                index.remove_tree(os.path.join(root, name))
+        index.put(listing, mtime)
+
+    return listing
+
+
+def _scan_entries(root):
+    """
+    List a directory once
+
+    Returns:
+        tuple: (sorted subdirectory names, sorted supported file names,
+            file sizes in bytes aligned with the file names)
+    """
+    subdirs = []
+    files = []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                try:
+                    # DirEntry caches the file type from the listing itself
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    elif entry.is_file():
+                        if os.path.splitext(entry.name)[1].lower() in _SUPPORTED_FORMATS:
+                            # Cached by the listing on Windows, one stat elsewhere
+                            files.append((entry.name, entry.stat().st_size))
+                except OSError:
+                    continue
+    except OSError as e:
+        print(f"Error scanning directory {root}: {str(e)}")
+
+    subdirs.sort()
+    files.sort()
+    return subdirs, [name for name, _ in files], [size for _, size in files]
+
+
+def group_files(root, files, sizes=None):
+    """
+    Group the supported files of a single directory into plate records
+
+    Args:
+        root (str): Directory containing the files
+        files (list): File names (already filtered to supported formats)
+        sizes (list, optional): File sizes in bytes, aligned with files.
+            Summed per plate into the record's 'size'
+
+    Returns:
+        list: Plate records, sequences and single files
+    """
+    plates = []
+    sequences = {}
+    # Per sequence: digit widths seen (decides the padding), lowest frame
+    # and the file name holding it
+    widths = {}
+    lowest = {}
+
+    if sizes is None:
+        sizes = [0] * len(files)
+
+    # Same as normpath(join(root, file)) for plain file names, built once
+    root_prefix = os.path.join(os.path.normpath(root), '')
+
+    for file, size in zip(files, sizes):
+        try:
+            prefix, digits, suffix, extension = split_frame(file)
+            ext = extension.lower()
+
+            # Video and 3D files are never sequences
+            if digits is None or ext in _VIDEO_FORMATS or ext in _GEO_FORMATS:
+                version = "v001" if ext in _VIDEO_FORMATS else tokenize_filename(file).version
+                plates.append(_single_record(root_prefix + file, os.path.splitext(file)[0],
+                                             version or "v001", size))
+                continue
+
+            frame_num = int(digits)
+
+            # Frames of one sequence may differ in digit width (a.9, a.10),
+            # name and version are the same for all of them
+            plate_key = (prefix, suffix, extension)
+            sequence = sequences.get(plate_key)
+            if sequence is None:
+                token = tokenize_filename(file)
+                sequences[plate_key] = {
+                    'display_name': token.base_name or os.path.splitext(file)[0],
+                    'version': token.version or "v001",
+                    'ext': extension,
+                    'first_frame_path': root_prefix + file,
+                    'frames': FrameSet([frame_num]),
+                    'size': size,
+                }
+                widths[plate_key] = {len(digits)}
+                lowest[plate_key] = (frame_num, file)
+            else:
+                if frame_num < lowest[plate_key][0]:
+                    sequence['first_frame_path'] = root_prefix + file
+                    lowest[plate_key] = (frame_num, file)
+                sequence['frames'].add(frame_num)
+                sequence['size'] += size
+                widths[plate_key].add(len(digits))
+
+        except Exception as e:
+            print(f"Error processing file {file}: {str(e)}")
+
+    for plate_key, sequence in sequences.items():
+        token = tokenize_filename(lowest[plate_key][1])
+        padding = sequence_padding(token, widths[plate_key])
+        sequence['path'] = os.path.join(root, token._replace(padding=padding).pattern_name)
+
+        frames = sequence['frames']
+        if frames.first != frames.last:
+            sequence['is_sequence'] = True
+            sequence['frame_range'] = frames.format_range()
+            sequence['missing_frames'] = frames.format_gaps()
+            plates.append(sequence)
+        else:
+            # A lone numbered file is just a single frame
+            file_path = sequence['first_frame_path']
+            display_name = os.path.splitext(os.path.basename(file_path))[0]
+            plates.append(_single_record(file_path, display_name, sequence['version'],
+                                         sequence['size']))
+
+    return plates
+
 
-def scan_directory(path):
-    """Scan directory for supported files"""
-    pass
+def _single_record(file_path, display_name, version, size=0):
+    """Build a plate record for a single file"""
+    return {
+        'display_name': display_name,
+        'version': version,
+        'ext': os.path.splitext(file_path)[1],
+        'path': file_path,
+        'first_frame_path': file_path,
+        'is_sequence': False,
+        'frame_range': "Single Frame",
+        'missing_frames': "",
+        'size': size,
+    }
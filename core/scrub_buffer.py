@@ -0,0 +1,105 @@
+# nuke_importer/core/scrub_buffer.py
+"""
+Frame buffer for scrubbing through image sequences.
+
+Decoded low resolution frames are kept up to a byte budget, whatever the
+sequence length. Frames are filled coarse to fine: a handful spread over
+the whole range first, then the midpoints between them, so the first hover
+already covers the sequence and detail follows. Coarse frames are pinned in
+half of the slots, frames refined around the scrub position cycle through
+the other half as a ring, oldest overwritten first.
+"""
+import bisect
+import threading
+from collections import deque
+
+# Frames of the first, coarsest pass are spread this far apart at most
+COARSE_FRAMES = 8
+
+
+def coarse_to_fine(first, last):
+    """
+    Yield every frame of a range once, coarsest sampling first
+
+    The first pass takes every stride-th frame (8 to 16 frames), each
+    following pass the midpoints of the previous one, down to every frame.
+    """
+    count = last - first + 1
+    stride = 1
+    while count > COARSE_FRAMES * stride * 2:
+        stride *= 2
+
+    yield from range(first, last + 1, stride)
+    if (last - first) % stride:
+        yield last
+
+    while stride > 1:
+        half = stride // 2
+        for frame in range(first + half, last + 1, stride):
+            if frame != last:
+                yield frame
+        stride = half
+
+
+class ScrubBuffer:
+    def __init__(self, max_bytes, frame_bytes):
+        self.capacity = max(2, max_bytes // max(1, frame_bytes))
+        self.pinned_capacity = self.capacity // 2
+        self._images = {}
+        # Decoded frame numbers, sorted for nearest frame lookups
+        self._frames = []
+        # Unpinned frames, oldest first
+        self._ring = deque()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._images)
+
+    def __contains__(self, frame):
+        return frame in self._images
+
+    def pinned_full(self):
+        """Check whether coarse frames have used up their half of the budget"""
+        return len(self._images) - len(self._ring) >= self.pinned_capacity
+
+    def put(self, frame, image, pinned=False):
+        """
+        Store a decoded frame, overwriting the oldest unpinned one when full
+
+        Returns:
+            bool: False if there was no room for it
+        """
+        with self._lock:
+            if frame in self._images:
+                return True
+            if pinned and self.pinned_full():
+                pinned = False
+            while len(self._images) >= self.capacity and self._ring:
+                self._remove(self._ring.popleft())
+            if len(self._images) >= self.capacity:
+                return False
+
+            self._images[frame] = image
+            bisect.insort(self._frames, frame)
+            if not pinned:
+                self._ring.append(frame)
+            return True
+
+    def nearest(self, frame):
+        """
+        Decoded frame closest to a frame number
+
+        Returns:
+            tuple: (frame, image), or None while the buffer is empty
+        """
+        with self._lock:
+            if not self._frames:
+                return None
+            index = bisect.bisect_left(self._frames, frame)
+            candidates = self._frames[max(0, index - 1):index + 1]
+            nearest = min(candidates, key=lambda f: abs(f - frame))
+            return nearest, self._images[nearest]
+
+    def _remove(self, frame):
+        del self._images[frame]
+        del self._frames[bisect.bisect_left(self._frames, frame)]
@@ -0,0 +1,182 @@
+# nuke_importer/core/thumbnail_cache.py
+"""
+Disk thumbnail cache for the Nuke Importer.
+
+Thumbnails are stored as JPEG files named after a hash of the source path,
+mtime, size and thumbnail size, so a changed plate gets a new entry and
+identical requests from several artists resolve to the same file. The cache
+directory can point at show storage to share thumbnails between artists.
+Entries are written atomically and the least recently used ones are evicted
+once the directory grows past its byte budget.
+"""
+import os
+import time
+import hashlib
+import threading
+from ..config.settings import (THUMBNAIL_CACHE_ENABLED, THUMBNAIL_CACHE_DIR,
+                               THUMBNAIL_CACHE_MAX_BYTES)
+
+# Share of the budget kept after an eviction pass
+EVICT_KEEP_RATIO = 0.8
+
+# Skip refreshing the LRU timestamp of entries used this recently, saves
+# a metadata write per hit on network storage
+TOUCH_INTERVAL = 3600
+
+
+class ThumbnailCache:
+    def __init__(self, cache_dir, max_bytes=THUMBNAIL_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Bytes in the cache directory, counted on the first write
+        self._total_bytes = None
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, file_path, width, height):
+        """
+        Cache key of a thumbnail
+
+        Returns:
+            str: Hex digest, or None if the source file is missing
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        source = f"{os.path.normpath(file_path)}|{stat.st_mtime}|{stat.st_size}|{width}x{height}"
+        return hashlib.sha1(source.encode('utf-8')).hexdigest()
+
+    def entry_path(self, key):
+        """Path of a cache entry, fanned out over 256 sub directories"""
+        return os.path.join(self.cache_dir, key[:2], key[2:] + '.jpg')
+
+    def get(self, file_path, width, height):
+        """
+        Get the cached thumbnail of a file
+
+        Returns:
+            str: Path of the cached JPEG, or None on a miss
+        """
+        key = self.key(file_path, width, height)
+        if key is None:
+            return None
+
+        path = self.entry_path(key)
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            return None
+
+        # Entry mtime is the LRU clock
+        now = time.time()
+        if now - mtime > TOUCH_INTERVAL:
+            try:
+                os.utime(path, (now, now))
+            except OSError:
+                pass
+        return path
+
+    def put(self, file_path, width, height, writer):
+        """
+        Store a thumbnail
+
+        Args:
+            file_path (str): Source file the thumbnail shows
+            width (int): Thumbnail width
+            height (int): Thumbnail height
+            writer (callable): Called with a temporary .jpg path to write the
+                thumbnail to, returns False if it could not
+
+        Returns:
+            str: Path of the cached JPEG, or None if nothing was stored
+        """
+        key = self.key(file_path, width, height)
+        if key is None:
+            return None
+
+        path = self.entry_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Unique temporary name in the same directory, renamed into place so
+        # readers never see a partial file
+        temp_path = f"{path[:-4]}.{os.getpid()}.{threading.get_ident()}.tmp.jpg"
+        try:
+            if writer(temp_path) is False or not os.path.exists(temp_path):
+                return None
+            size = os.path.getsize(temp_path)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"Error writing thumbnail cache entry: {str(e)}")
+            return None
+        finally:
+            if os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+
+        self._account(size)
+        return path
+
+    def _account(self, size):
+        """Track the cache size and evict when it goes over budget"""
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._entries())
+            else:
+                self._total_bytes += size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        """Yield (path, size, mtime) of every cache entry"""
+        try:
+            subdirs = [e.path for e in os.scandir(self.cache_dir) if e.is_dir()]
+        except OSError:
+            return
+        for subdir in subdirs:
+            try:
+                with os.scandir(subdir) as entries:
+                    for entry in entries:
+                        if entry.name.endswith('.jpg') and not entry.name.endswith('.tmp.jpg'):
+                            stat = entry.stat()
+                            yield entry.path, stat.st_size, stat.st_mtime
+            except OSError:
+                continue
+
+    def _evict(self):
+        """Delete least recently used entries until the cache is back under budget"""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * EVICT_KEEP_RATIO
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                # Another artist evicted it first
+                pass
+            total -= size
+        self._total_bytes = total
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_thumbnail_cache():
+    """Get the shared thumbnail cache, or None if it is disabled or unavailable"""
+    global _cache
+    if not THUMBNAIL_CACHE_ENABLED:
+        return None
+
+    with _cache_lock:
+        if _cache is None:
+            try:
+                _cache = ThumbnailCache(THUMBNAIL_CACHE_DIR)
+            except OSError as e:
+                print(f"Thumbnail cache unavailable: {str(e)}")
+                _cache = False
+        return _cache or None
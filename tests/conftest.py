@@ -0,0 +1,16 @@
+# nuke_importer/tests/conftest.py
+"""
+Make the package importable as nuke_importer without running its
+__init__, which builds the Qt UI. Only the Qt free core and utils
+modules are tested here.
+"""
+import os
+import sys
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if 'nuke_importer' not in sys.modules:
+    package = types.ModuleType('nuke_importer')
+    package.__path__ = [ROOT]
+    sys.modules['nuke_importer'] = package
@@ -0,0 +1,51 @@
+# nuke_importer/tests/filename_corpus.py
+"""
+Labelled real-world VFX file names.
+
+Each entry is (file name, prefix, frame, padding, suffix, version, extension)
+as tokenize_filename must split it. Shared by the tokenizer tests and
+tools/bench_tokenizer.py.
+"""
+
+FILENAME_CORPUS = [
+    # Plain frame after a separator
+    ('sh010_comp_v003.1001.exr', 'sh010_comp_v003.', 1001, 4, '', 'v003', '.exr'),
+    ('sh010_plate_v001_1001.dpx', 'sh010_plate_v001_', 1001, 4, '', 'v001', '.dpx'),
+    ('render-beauty-0001.tif', 'render-beauty-', 1, 4, '', None, '.tif'),
+    ('frame_0001.jpg', 'frame_', 1, 4, '', None, '.jpg'),
+    ('sh030.bg.v001.1010.dpx', 'sh030.bg.v001.', 1010, 4, '', 'v001', '.dpx'),
+    ('matte.v010.1001.sxr', 'matte.v010.', 1001, 4, '', 'v010', '.sxr'),
+    ('comp_1920x1080_v001.1001.exr', 'comp_1920x1080_v001.', 1001, 4, '', 'v001', '.exr'),
+    ('shot_040_roto_v12.0101.png', 'shot_040_roto_v12.', 101, 4, '', 'v12', '.png'),
+    ('lighting_v2.1001.exr', 'lighting_v2.', 1001, 4, '', 'v2', '.exr'),
+    # Camera originals with long frame counters
+    ('A001C003_190512_R1AB.0086400.exr', 'A001C003_190512_R1AB.', 86400, 7, '', None, '.exr'),
+    # Padding kept as written, unpadded and past the padding
+    ('plate.8.exr', 'plate.', 8, 1, '', None, '.exr'),
+    ('plate.10.exr', 'plate.', 10, 2, '', None, '.exr'),
+    ('plate.10000.exr', 'plate.', 10000, 5, '', None, '.exr'),
+    ('plate.001.exr', 'plate.', 1, 3, '', None, '.exr'),
+    # Frame glued to the name
+    ('img0042.jpg', 'img', 42, 4, '', None, '.jpg'),
+    # Version after the frame
+    ('bg_plate.1001_v002.exr', 'bg_plate.', 1001, 4, '_v002', 'v002', '.exr'),
+    # No frame number
+    ('sh020_cleanplate.exr', 'sh020_cleanplate', None, 0, '', None, '.exr'),
+    ('camera_track_v004.abc', 'camera_track_v004', None, 0, '', 'v004', '.abc'),
+    ('ref_v003.mov', 'ref_v003', None, 0, '', 'v003', '.mov'),
+    ('README', 'README', None, 0, '', None, ''),
+]
+
+# Directory listings and the (pattern name, frame range) plates they group into
+GROUPING_CORPUS = [
+    (['a.8.exr', 'a.9.exr', 'a.10.exr'], [('a.%d.exr', '8-10')]),
+    (['a.1.exr', 'a.2.exr', 'a.3.exr'], [('a.%d.exr', '1-3')]),
+    (['b.9998.exr', 'b.9999.exr', 'b.10000.exr'], [('b.%d.exr', '9998-10000')]),
+    (['c.0999.exr', 'c.1000.exr', 'c.10000.exr'], [('c.%04d.exr', '999-10000')]),
+    (['d.001.dpx', 'd.002.dpx', 'd.003.dpx'], [('d.%03d.dpx', '1-3')]),
+    (['sh010_v001.1001.exr', 'sh010_v001.1002.exr', 'sh010_v002.1001.exr',
+      'sh010_v002.1002.exr'],
+     [('sh010_v001.%04d.exr', '1001-1002'), ('sh010_v002.%04d.exr', '1001-1002')]),
+    (['bg.1001_v001.exr', 'bg.1002_v001.exr', 'bg.1001_v002.exr', 'bg.1002_v002.exr'],
+     [('bg.%04d_v001.exr', '1001-1002'), ('bg.%04d_v002.exr', '1001-1002')]),
+]
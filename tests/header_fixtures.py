@@ -0,0 +1,108 @@
+# nuke_importer/tests/header_fixtures.py
+"""
+Minimal image headers built byte by byte.
+
+Each builder returns the bytes of a file that is complete up to where
+core.image_headers stops reading, laid out as the format specifications
+describe. No pixel data, no image libraries.
+"""
+import struct
+import zlib
+
+
+def exr(channels, data_window, display_window, compression=4, pixel_aspect=None):
+    """Scanline OpenEXR header, compression uses the EXR codes (4 = piz)"""
+    def attribute(name, attr_type, value):
+        return name.encode() + b'\0' + attr_type.encode() + b'\0' + struct.pack('<i', len(value)) + value
+
+    # name, pixel type (1 = half), pLinear, 3 reserved, x and y sampling
+    chlist = b''.join(name.encode() + b'\0' + struct.pack('<iB3xii', 1, 0, 1, 1)
+                      for name in sorted(channels)) + b'\0'
+    header = b'\x76\x2f\x31\x01' + struct.pack('<I', 2)
+    header += attribute('channels', 'chlist', chlist)
+    header += attribute('compression', 'compression', bytes([compression]))
+    header += attribute('dataWindow', 'box2i', struct.pack('<4i', *data_window))
+    header += attribute('displayWindow', 'box2i', struct.pack('<4i', *display_window))
+    header += attribute('lineOrder', 'lineOrder', b'\0')
+    if pixel_aspect is not None:
+        header += attribute('pixelAspectRatio', 'float', struct.pack('<f', pixel_aspect))
+    return header + b'\0'
+
+
+def dpx(width, height, endian='>', descriptor=50, bit_depth=10, encoding=0, aspect=(1, 1)):
+    """DPX file and image headers, big endian files start with SDPX, little endian with XPDS"""
+    data = bytearray(1664)
+    data[0:4] = b'SDPX' if endian == '>' else b'XPDS'
+    struct.pack_into(endian + 'I', data, 4, 8192)
+    struct.pack_into(endian + '2I', data, 772, width, height)
+    # Image element 1: descriptor, transfer, colorimetric, bit depth, packing, encoding
+    struct.pack_into(endian + '4B2H', data, 800, descriptor, 0, 0, bit_depth, 1, encoding)
+    struct.pack_into(endian + '2I', data, 1628, *aspect)
+    return bytes(data)
+
+
+def cineon(width, height, endian='>', channel_count=3, bit_depth=10):
+    """Cineon file and image information headers"""
+    data = bytearray(228)
+    data[0:4] = b'\x80\x2a\x5f\xd7' if endian == '>' else b'\xd7\x5f\x2a\x80'
+    data[193] = channel_count
+    # First channel: 2 byte designator, bits per pixel, padding, pixels per line, lines
+    data[198] = bit_depth
+    struct.pack_into(endian + '2I', data, 200, width, height)
+    return bytes(data)
+
+
+def png(width, height, color_type=6, bit_depth=8, ppu=None):
+    """PNG with IHDR, a text chunk, optional pHYs and an empty image"""
+    def chunk(chunk_type, body):
+        return (struct.pack('>I', len(body)) + chunk_type + body
+                + struct.pack('>I', zlib.crc32(chunk_type + body) & 0xFFFFFFFF))
+
+    data = b'\x89PNG\r\n\x1a\n'
+    data += chunk(b'IHDR', struct.pack('>2I5B', width, height, bit_depth, color_type, 0, 0, 0))
+    data += chunk(b'tEXt', b'Software\0test')
+    if ppu is not None:
+        data += chunk(b'pHYs', struct.pack('>2IB', ppu[0], ppu[1], 1))
+    data += chunk(b'IDAT', zlib.compress(b''))
+    return data + chunk(b'IEND', b'')
+
+
+def jpeg(width, height, components=3, progressive=True):
+    """JPEG with JFIF, quantization and Huffman segments ahead of its start of frame"""
+    def segment(code, body):
+        return bytes([0xFF, code]) + struct.pack('>H', len(body) + 2) + body
+
+    data = b'\xff\xd8'
+    data += segment(0xE0, b'JFIF\0\x01\x01\0\0\x01\0\x01\0\0')
+    data += segment(0xDB, b'\0' + bytes(64))
+    data += segment(0xC4, b'\0' + bytes(16))
+    # Fill byte ahead of the frame marker
+    data += b'\xff'
+    frame = struct.pack('>BHHB', 8, height, width, components)
+    frame += b''.join(bytes([i + 1, 0x11, 0]) for i in range(components))
+    data += segment(0xC2 if progressive else 0xC0, frame)
+    data += segment(0xDA, bytes([components]) + bytes(2 * components) + b'\0\x3f\0')
+    return data + b'\xff\xd9'
+
+
+def tiff(width, height, bits_per_sample=(16, 16, 16), compression=5, endian='<'):
+    """Classic TIFF, BitsPerSample has one value per channel stored after the IFD"""
+    samples = len(bits_per_sample)
+    entry_count = 5
+    ifd_offset = 8
+    bits_offset = ifd_offset + 2 + entry_count * 12 + 4
+
+    def entry(tag, tag_type, count, value):
+        if tag_type == 3 and count == 1:
+            return struct.pack(endian + 'HHIH2x', tag, tag_type, count, value)
+        return struct.pack(endian + 'HHII', tag, tag_type, count, value)
+
+    data = (b'II*\0' if endian == '<' else b'MM\0*') + struct.pack(endian + 'I', ifd_offset)
+    data += struct.pack(endian + 'H', entry_count)
+    data += entry(256, 3, 1, width)
+    data += entry(257, 4, 1, height)
+    data += entry(258, 3, samples, bits_offset)
+    data += entry(259, 3, 1, compression)
+    data += entry(277, 3, 1, samples)
+    data += struct.pack(endian + 'I', 0)
+    return data + struct.pack(endian + f'{samples}H', *bits_per_sample)
@@ -0,0 +1,25 @@
+# nuke_importer/tests/test_frame_pattern.py
+import os
+import pytest
+from nuke_importer.core.scanner import group_files
+from nuke_importer.utils.frame_pattern_utils import tokenize_filename
+from filename_corpus import FILENAME_CORPUS, GROUPING_CORPUS
+
+
+@pytest.mark.parametrize('filename, prefix, frame, padding, suffix, version, extension',
+                         FILENAME_CORPUS)
+def test_tokenize_filename(filename, prefix, frame, padding, suffix, version, extension):
+    assert tuple(tokenize_filename(filename)) == (prefix, frame, padding, suffix, version,
+                                                  extension)
+
+
+@pytest.mark.parametrize('files, expected', GROUPING_CORPUS)
+def test_group_files(files, expected):
+    plates = group_files('/show/plates', files)
+    grouped = sorted((os.path.basename(plate['path']), plate['frame_range']) for plate in plates)
+    assert grouped == sorted(expected)
+
+
+def test_group_files_first_frame_of_mixed_widths():
+    plates = group_files('/show/plates', ['a.10.exr', 'a.9.exr', 'a.8.exr'])
+    assert [os.path.basename(plate['first_frame_path']) for plate in plates] == ['a.8.exr']
@@ -0,0 +1,47 @@
+# nuke_importer/tests/test_frame_set.py
+from nuke_importer.core.frame_set import FrameSet
+
+
+def test_in_order_adds_extend_one_range():
+    frames = FrameSet([1001])
+    for frame in range(1002, 1010):
+        frames.add(frame)
+    assert frames._ranges == [[1001, 1009]]
+    assert len(frames._pending) == 0
+    assert (frames.first, frames.last, len(frames)) == (1001, 1009, 9)
+
+
+def test_out_of_order_adds():
+    frames = FrameSet([1010, 1003, 1001, 1002, 1003, 1008])
+    assert frames.ranges() == [(1001, 1003), (1008, 1008), (1010, 1010)]
+    assert (frames.first, frames.last) == (1001, 1010)
+    assert 1002 in frames and 1005 not in frames
+    assert list(frames) == [1001, 1002, 1003, 1008, 1010]
+
+
+def test_gaps_and_missing():
+    frames = FrameSet([1001, 1002, 1005, 1009, 1010])
+    assert frames.gaps() == [(1003, 1004), (1006, 1008)]
+    assert frames.missing_count() == 5
+    assert frames.format_gaps() == "1003-1004, 1006-1008 (5 missing)"
+    assert frames.format_range() == "1001-1010"
+
+
+def test_format_gaps_truncates():
+    frames = FrameSet(range(1, 20, 2))
+    assert frames.format_gaps(max_ranges=2) == "2, 4, ... (9 missing)"
+
+
+def test_complete_and_empty_sets():
+    assert FrameSet(range(1, 101)).format_gaps() == ""
+    empty = FrameSet()
+    assert not empty
+    assert (empty.first, empty.missing_count(), empty.format_range()) == (None, 0, "")
+
+
+def test_ranges_round_trip():
+    frames = FrameSet([5, 1, 2, 3, 9, 10])
+    restored = FrameSet.from_ranges(frames.to_ranges())
+    assert restored == frames
+    assert restored.to_ranges() == [[1, 3], [5, 5], [9, 10]]
+    assert (restored.first, restored.last) == (1, 10)
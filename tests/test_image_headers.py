@@ -0,0 +1,111 @@
+# nuke_importer/tests/test_image_headers.py
+import pytest
+
+from nuke_importer.core.image_headers import read_image_header
+
+import header_fixtures
+
+
+def read(tmp_path, name, data):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return read_image_header(str(path))
+
+
+def test_exr_data_window_and_pixel_aspect(tmp_path):
+    data = header_fixtures.exr(['R', 'G', 'B', 'A'], data_window=(-16, -8, 2063, 1087),
+                               display_window=(0, 0, 2047, 1079), compression=8, pixel_aspect=2.0)
+    header = read(tmp_path, 'plate.1001.exr', data)
+    assert header['format'] == 'exr'
+    assert (header['width'], header['height']) == (2048, 1080)
+    assert header['data_window'] == (-16, -8, 2063, 1087)
+    assert header['display_window'] == (0, 0, 2047, 1079)
+    assert header['channels'] == ['A', 'B', 'G', 'R']
+    assert header['compression'] == 'dwaa'
+    assert header['pixel_aspect'] == 2.0
+
+
+def test_exr_without_pixel_aspect(tmp_path):
+    data = header_fixtures.exr(['Y'], data_window=(0, 0, 99, 49), display_window=(0, 0, 99, 49),
+                               compression=0)
+    header = read(tmp_path, 'plate.exr', data)
+    assert (header['width'], header['height']) == (100, 50)
+    assert header['compression'] == 'none'
+    assert header['pixel_aspect'] == 1.0
+
+
+@pytest.mark.parametrize('endian', ['>', '<'])
+def test_dpx_byte_orders(tmp_path, endian):
+    data = header_fixtures.dpx(4096, 1716, endian=endian, bit_depth=10, encoding=1, aspect=(2, 1))
+    header = read(tmp_path, 'scan.0001.dpx', data)
+    assert header['format'] == 'dpx'
+    assert (header['width'], header['height']) == (4096, 1716)
+    assert header['channels'] == ['R', 'G', 'B']
+    assert header['bit_depth'] == 10
+    assert header['compression'] == 'rle'
+    assert header['pixel_aspect'] == 2.0
+    assert header['data_window'] == header['display_window'] == (0, 0, 4095, 1715)
+
+
+def test_dpx_unset_aspect(tmp_path):
+    data = header_fixtures.dpx(1920, 1080, descriptor=51, aspect=(0xFFFFFFFF, 0xFFFFFFFF))
+    header = read(tmp_path, 'scan.dpx', data)
+    assert header['channels'] == ['R', 'G', 'B', 'A']
+    assert header['compression'] == 'none'
+    assert header['pixel_aspect'] == 1.0
+
+
+@pytest.mark.parametrize('endian', ['>', '<'])
+def test_cineon(tmp_path, endian):
+    header = read(tmp_path, 'scan.0001.cin', header_fixtures.cineon(2048, 1556, endian=endian))
+    assert header['format'] == 'cin'
+    assert (header['width'], header['height']) == (2048, 1556)
+    assert header['channels'] == ['R', 'G', 'B']
+    assert header['bit_depth'] == 10
+
+
+def test_png_pixel_aspect_after_other_chunks(tmp_path):
+    header = read(tmp_path, 'matte.png', header_fixtures.png(640, 480, color_type=6, ppu=(2835, 5670)))
+    assert header['format'] == 'png'
+    assert (header['width'], header['height']) == (640, 480)
+    assert header['channels'] == ['R', 'G', 'B', 'A']
+    assert header['bit_depth'] == 8
+    assert header['pixel_aspect'] == 2.0
+
+
+def test_png_without_phys(tmp_path):
+    header = read(tmp_path, 'matte.png', header_fixtures.png(64, 32, color_type=2, bit_depth=16))
+    assert header['channels'] == ['R', 'G', 'B']
+    assert header['bit_depth'] == 16
+    assert header['pixel_aspect'] == 1.0
+
+
+@pytest.mark.parametrize('progressive, compression', [(True, 'progressive'), (False, 'baseline')])
+def test_jpeg_start_of_frame(tmp_path, progressive, compression):
+    header = read(tmp_path, 'ref.jpg', header_fixtures.jpeg(1920, 804, progressive=progressive))
+    assert header['format'] == 'jpeg'
+    assert (header['width'], header['height']) == (1920, 804)
+    assert header['channels'] == ['R', 'G', 'B']
+    assert header['compression'] == compression
+    assert header['bit_depth'] == 8
+
+
+def test_jpeg_greyscale(tmp_path):
+    header = read(tmp_path, 'ref.jpeg', header_fixtures.jpeg(320, 240, components=1))
+    assert header['channels'] == ['Y']
+
+
+@pytest.mark.parametrize('endian', ['<', '>'])
+def test_tiff_bits_per_sample_at_offset(tmp_path, endian):
+    data = header_fixtures.tiff(3840, 2160, bits_per_sample=(16, 16, 16, 16), endian=endian)
+    header = read(tmp_path, 'texture.tif', data)
+    assert header['format'] == 'tiff'
+    assert (header['width'], header['height']) == (3840, 2160)
+    assert header['channels'] == ['R', 'G', 'B', 'A']
+    assert header['compression'] == 'lzw'
+    assert header['bit_depth'] == 16
+
+
+def test_wrong_magic_is_rejected(tmp_path):
+    assert read(tmp_path, 'plate.exr', header_fixtures.png(8, 8)) is None
+    assert read(tmp_path, 'notes.txt', b'plain text') is None
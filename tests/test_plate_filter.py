@@ -0,0 +1,39 @@
+# nuke_importer/tests/test_plate_filter.py
+from nuke_importer.core.frame_set import FrameSet
+from nuke_importer.core.plate_filter import PlateFilterIndex, LATEST_VERSION, ALL_VERSIONS
+from nuke_importer.core.plate_store import PlateStore
+from nuke_importer.utils.frame_pattern_utils import strip_version
+
+
+def plate(directory, name, version):
+    path = f"{directory}/{name}.%04d.exr"
+    return {
+        'display_name': name,
+        'version': version,
+        'ext': '.exr',
+        'path': path,
+        'first_frame_path': path.replace('%04d', '1001'),
+        'is_sequence': True,
+        'frames': FrameSet.from_ranges([(1001, 1010)]),
+        'missing_frames': "",
+        'size': 0,
+    }
+
+
+def test_strip_version():
+    assert strip_version('shot_comp_v003') == 'shot_comp'
+    assert strip_version('shot_v12_comp.%04d.exr') == 'shot_comp.%04d.exr'
+    assert strip_version('/show/sh010/v002/plate_v002') == strip_version('/show/sh010/v003/plate_v003')
+    assert strip_version('review.mov') == 'review.mov'
+
+
+def test_latest_version_keeps_newest_row():
+    store = PlateStore()
+    store.append(plate('/show/sh010', 'comp_v003', 'v003'))
+    store.append(plate('/show/sh010', 'comp_v004', 'v004'))
+    # Same name in another shot is a different plate
+    store.append(plate('/show/sh020', 'comp_v001', 'v001'))
+
+    index = PlateFilterIndex(store)
+    assert list(index.match(version_filter=LATEST_VERSION)) == [0, 1, 1]
+    assert list(index.match(version_filter=ALL_VERSIONS)) == [1, 1, 1]
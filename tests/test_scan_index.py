@@ -0,0 +1,45 @@
+# nuke_importer/tests/test_scan_index.py
+import os
+from nuke_importer.core.scan_index import ScanIndex
+
+
+def listing(path, *names):
+    plates = [{
+        'display_name': name,
+        'version': name.rsplit('_', 1)[-1],
+        'ext': '.exr',
+        'path': os.path.join(path, name + '.%04d.exr'),
+        'first_frame_path': os.path.join(path, name + '.1001.exr'),
+        'is_sequence': False,
+        'frame_range': "Single Frame",
+        'missing_frames': "",
+        'size': 0,
+    } for name in names]
+    return {'path': path, 'subdirs': [], 'files': [], 'plates': plates}
+
+
+def test_paths_are_normalized(tmp_path):
+    index = ScanIndex(str(tmp_path / 'index.db'))
+    root = str(tmp_path / 'show')
+    index.put(listing(root + '/sh010/', 'plate_v001'), 1.0)
+
+    assert index.get_subdirs(os.path.join(root, 'sh010')) == []
+    assert index.peek(root + '/./sh010') is not None
+    assert [p['display_name'] for p in index.search_plates('plate', root + '/')] == ['plate_v001']
+
+    index.remove_tree(root + '/')
+    assert index.peek(os.path.join(root, 'sh010')) is None
+    assert index.search_plates('plate') == []
+    index.close()
+
+
+def test_search_ranks_newest_version_first(tmp_path):
+    index = ScanIndex(str(tmp_path / 'index.db'))
+    root = str(tmp_path / 'show')
+    index.put(listing(root, 'comp_v009', 'comp_v010', 'comp_precomp_v001'), 1.0)
+
+    names = [p['display_name'] for p in index.search_plates('comp')]
+    assert names == ['comp_v010', 'comp_v009', 'comp_precomp_v001']
+    # A full name typed with its version comes first
+    assert index.search_plates('comp_v009')[0]['display_name'] == 'comp_v009'
+    index.close()
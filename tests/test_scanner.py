@@ -0,0 +1,81 @@
+# nuke_importer/tests/test_scanner.py
+import os
+import time
+from nuke_importer.core.scan_index import ScanIndex
+from nuke_importer.core.scanner import list_directory, relist_directories, walk_directories
+
+
+def touch(path):
+    open(path, 'w').close()
+
+
+def test_relist_directories_returns_changed_listings(tmp_path):
+    index = ScanIndex(str(tmp_path / 'index.db'))
+    root = tmp_path / 'show'
+    (root / 'sh010').mkdir(parents=True)
+    (root / 'sh020').mkdir()
+    touch(root / 'sh010' / 'plate.1001.exr')
+    for path in (root, root / 'sh010', root / 'sh020'):
+        list_directory(os.path.normpath(str(path)), index)
+
+    # New frame in sh010, new shot with a plate, sh020 removed
+    touch(root / 'sh010' / 'plate.1002.exr')
+    (root / 'sh030').mkdir()
+    touch(root / 'sh030' / 'bg.exr')
+    os.rmdir(root / 'sh020')
+
+    paths = [str(root), str(root / 'sh010'), str(root / 'sh020')]
+    listings = {os.path.basename(listing['path']): listing
+                for listing in relist_directories(paths, index)}
+
+    assert set(listings) == {'show', 'sh010', 'sh020', 'sh030'}
+    assert listings['sh010']['plates'][0]['frame_range'] == '1001-1002'
+    assert listings['sh020']['subdirs'] is None
+    assert listings['sh030']['files'] == ['bg.exr']
+
+    # Nothing changed since, nothing is reported
+    assert relist_directories([str(root / 'sh010')], index) == []
+    index.close()
+
+
+def test_parallel_walk_matches_serial(tmp_path):
+    for shot in ('sh010', 'sh020', 'sh030'):
+        for department in ('comp', 'plate'):
+            path = tmp_path / shot / department / 'v001'
+            path.mkdir(parents=True)
+            touch(path / 'plate.1001.exr')
+
+    serial = [listing['path'] for listing in walk_directories(str(tmp_path), workers=1)]
+    parallel = [listing['path'] for listing in walk_directories(str(tmp_path), workers=4)]
+    assert len(serial) == 1 + 3 + 6 + 6
+    assert parallel == serial
+
+
+def test_stopped_parallel_walk_lists_nothing_more(tmp_path, monkeypatch):
+    from nuke_importer.core import scanner, scan_pool
+    for i in range(50):
+        (tmp_path / f"sh{i:03d}" / 'plate').mkdir(parents=True)
+
+    listed = []
+    list_directory = scanner.list_directory
+
+    def slow_list_directory(path, index=None):
+        listed.append(path)
+        time.sleep(0.01)
+        return list_directory(path, index)
+
+    monkeypatch.setattr(scanner, 'list_directory', slow_list_directory)
+    monkeypatch.setattr(scan_pool, '_pool', scan_pool.PriorityExecutor(4))
+
+    # Stops once the root is yielded, its 50 children are queued by then
+    walked = []
+    walk = walk_directories(str(tmp_path), should_stop=lambda: bool(walked), workers=4)
+    walked.extend(listing['path'] for listing in walk)
+    assert walked == [str(tmp_path)]
+
+    # Listings already running finish, the queued ones never start
+    time.sleep(0.2)
+    settled = len(listed)
+    time.sleep(0.2)
+    assert len(listed) == settled
+    assert settled <= 1 + 4
@@ -0,0 +1,137 @@
+# nuke_importer/tools/bench_exr_thumbnail.py
+"""
+EXR thumbnail decode times on synthetic plates.
+
+Writes half float plates with several compressions and channel counts,
+then times a full decode of every channel, core.exr_thumbnail and, when
+the nuke module can be imported (nuke -t), the Read / Reformat / Write
+render the viewer falls back to. Needs OpenEXR and numpy.
+
+    python tools/bench_exr_thumbnail.py [width height]
+    nuke -t tools/bench_exr_thumbnail.py [width height]
+"""
+import os
+import sys
+import time
+import shutil
+import tempfile
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if 'nuke_importer' not in sys.modules:
+    package = types.ModuleType('nuke_importer')
+    package.__path__ = [ROOT]
+    sys.modules['nuke_importer'] = package
+
+from nuke_importer.config.settings import THUMBNAIL_SIZE  # noqa: E402
+from nuke_importer.core.exr_thumbnail import read_exr_thumbnail, is_available  # noqa: E402
+
+try:
+    import nuke
+except ImportError:
+    nuke = None
+
+COMPRESSIONS = ['PIZ', 'DWAA', 'ZIP', 'ZIPS']
+LAYOUTS = {
+    'RGBA': ['R', 'G', 'B', 'A'],
+    '16 channels': ['R', 'G', 'B', 'A'] + [f"{layer}.{c}" for layer in ('diffuse', 'specular', 'depth')
+                                            for c in 'RGBA'],
+}
+REPEATS = 3
+
+
+def write_plate(path, width, height, channels, compression):
+    """Noisy gradient plate, compresses like a real one rather than a flat color"""
+    import numpy as np
+    import OpenEXR
+    import Imath
+
+    header = OpenEXR.Header(width, height)
+    half = Imath.Channel(Imath.PixelType(Imath.PixelType.HALF))
+    header['channels'] = {name: half for name in channels}
+    header['compression'] = Imath.Compression(getattr(Imath.Compression, compression + '_COMPRESSION'))
+
+    ramp = np.linspace(0.0, 1.0, width, dtype=np.float32)[None, :].repeat(height, axis=0)
+    rng = np.random.default_rng(0)
+    data = {}
+    for i, name in enumerate(channels):
+        plane = ramp * (0.5 + 0.1 * i) + rng.normal(0.0, 0.02, (height, width)).astype(np.float32)
+        data[name] = plane.astype(np.float16).tobytes()
+
+    out = OpenEXR.OutputFile(path, header)
+    out.writePixels(data)
+    out.close()
+
+
+def full_decode(path):
+    """Every channel at full resolution, what a plain reader does"""
+    import OpenEXR
+    import Imath
+
+    exr = OpenEXR.InputFile(path)
+    try:
+        exr.channels(list(exr.header()['channels']), Imath.PixelType(Imath.PixelType.HALF))
+    finally:
+        exr.close()
+
+
+def nuke_render(path, jpg_path):
+    """Same node chain as ThumbnailViewer.render_exr_thumbnail"""
+    read = nuke.nodes.Read()
+    read['file'].fromUserText(path)
+    reformat = nuke.nodes.Reformat(inputs=[read])
+    reformat['type'].setValue('to box')
+    reformat['box_fixed'].setValue(True)
+    reformat['box_width'].setValue(THUMBNAIL_SIZE[0])
+    reformat['box_height'].setValue(THUMBNAIL_SIZE[1])
+    reformat['resize'].setValue('fit')
+    write = nuke.nodes.Write(inputs=[reformat])
+    write['file'].setValue(jpg_path.replace('\\', '/'))
+    write['file_type'].setValue('jpeg')
+    write['channels'].setValue('rgb')
+    try:
+        frame = int(read['first'].value())
+        nuke.execute(write, frame, frame, continueOnError=True)
+    finally:
+        for node in (write, reformat, read):
+            nuke.delete(node)
+
+
+def best_of(fn, *args):
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    if not is_available():
+        print("OpenEXR and numpy are needed")
+        return
+    width, height = (int(sys.argv[1]), int(sys.argv[2])) if len(sys.argv) > 2 else (4096, 2160)
+
+    temp_dir = tempfile.mkdtemp(prefix='bench_exr_')
+    try:
+        print(f"{width}x{height} half float, best of {REPEATS}"
+              + ("" if nuke else ", no nuke module so the Nuke render is not timed"))
+        print(f"{'compression':12} {'channels':12} {'full':>8} {'direct':>8} {'nuke':>8}")
+        for compression in COMPRESSIONS:
+            for layout, channels in LAYOUTS.items():
+                path = os.path.join(temp_dir, f"{compression}_{len(channels)}.exr")
+                write_plate(path, width, height, channels, compression)
+
+                full = best_of(full_decode, path)
+                direct = best_of(read_exr_thumbnail, path, *THUMBNAIL_SIZE)
+                rendered = "-"
+                if nuke is not None:
+                    jpg_path = os.path.join(temp_dir, 'thumbnail.jpg')
+                    rendered = f"{best_of(nuke_render, path, jpg_path):7.2f}s"
+                print(f"{compression:12} {layout:12} {full:7.2f}s {direct:7.2f}s {rendered:>8}")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+# nuke_importer/tools/bench_parallel_walk.py
+"""
+Serial against parallel directory walks on a synthetic show tree.
+
+Every os.scandir call sleeps first to stand in for the round trip of a
+network mount, so the numbers show how well the walker hides latency
+rather than how fast the local disk is. The scan index is not used.
+
+    python tools/bench_parallel_walk.py [latency ms] [worker count ...]
+"""
+import os
+import sys
+import time
+import shutil
+import tempfile
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if 'nuke_importer' not in sys.modules:
+    package = types.ModuleType('nuke_importer')
+    package.__path__ = [ROOT]
+    sys.modules['nuke_importer'] = package
+
+from nuke_importer.core import scan_pool  # noqa: E402
+from nuke_importer.core.scanner import walk_directories  # noqa: E402
+
+# sequences / shots / departments / versions, 1 + 4 + 40 + 120 + 360 directories
+TREE_SHAPE = [('sq', 4), ('sh', 10), ('', 3), ('v', 3)]
+DEPARTMENTS = ['plate', 'comp', 'roto']
+FRAMES_PER_VERSION = 20
+
+
+def build_tree(root):
+    """Create the show tree, frames only in the version folders"""
+    level = [root]
+    for depth, (prefix, count) in enumerate(TREE_SHAPE):
+        next_level = []
+        for parent in level:
+            for index in range(count):
+                name = DEPARTMENTS[index] if not prefix else f"{prefix}{index + 1:03d}"
+                path = os.path.join(parent, name)
+                os.mkdir(path)
+                next_level.append(path)
+        level = next_level
+
+    for path in level:
+        for frame in range(1001, 1001 + FRAMES_PER_VERSION):
+            open(os.path.join(path, f"plate.{frame}.exr"), 'w').close()
+
+
+def with_latency(scandir, latency):
+    def slow_scandir(*args, **kwargs):
+        time.sleep(latency)
+        return scandir(*args, **kwargs)
+    return slow_scandir
+
+
+def measure(label, root, workers):
+    start = time.perf_counter()
+    directories = sum(1 for _ in walk_directories(root, workers=workers))
+    elapsed = time.perf_counter() - start
+    print(f"{label:12} {directories:>5} dirs  {elapsed:7.2f}s  {directories / elapsed:8.0f} dirs/s")
+    return elapsed
+
+
+def main():
+    latency = float(sys.argv[1]) / 1000 if len(sys.argv) > 1 else 0.005
+    worker_counts = [int(arg) for arg in sys.argv[2:]] or [4, 8, 16]
+
+    root = tempfile.mkdtemp(prefix='bench_walk_')
+    scandir = os.scandir
+    try:
+        build_tree(root)
+        os.scandir = with_latency(scandir, latency)
+        print(f"{latency * 1000:.1f} ms per listing")
+
+        serial = measure('serial', root, 1)
+        for workers in worker_counts:
+            # Fresh pool of the wanted size, the shared one is sized from settings
+            scan_pool._pool = scan_pool.PriorityExecutor(workers)
+            elapsed = measure(f"{workers} workers", root, workers)
+            print(f"{'':12} {serial / elapsed:.1f}x serial")
+    finally:
+        os.scandir = scandir
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+# nuke_importer/tools/bench_plate_list.py
+"""
+Memory and scroll latency of the plate list views.
+
+Fills the QTreeWidget the plate list used to be, one item per plate, and
+the QTreeView over PlateTableModel it is now, then scrolls both to spread
+out positions and times each repaint. Every view is measured in its own
+process so resident memory is not shared between runs. Runs offscreen
+unless QT_QPA_PLATFORM says otherwise. Needs PySide2.
+
+    python tools/bench_plate_list.py [row count ...]
+"""
+import os
+import sys
+import time
+import subprocess
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if 'nuke_importer' not in sys.modules:
+    package = types.ModuleType('nuke_importer')
+    package.__path__ = [ROOT]
+    sys.modules['nuke_importer'] = package
+
+VIEWS = ['widget', 'model']
+SCROLL_STEPS = 50
+VIEW_SIZE = (1200, 800)
+
+
+def plate_records(count):
+    """Scanner records of count sequences, made one at a time so only the view keeps them"""
+    from nuke_importer.core.frame_set import FrameSet
+
+    for index in range(count):
+        shot, version = divmod(index, 4)
+        name = f"sh{shot:06d}_plate_v{version + 1:03d}"
+        path = f"/show/seq{shot // 100:04d}/sh{shot:06d}/{name}.%04d.exr"
+        yield {
+            'display_name': name,
+            'version': f"v{version + 1:03d}",
+            'ext': '.exr',
+            'path': path,
+            'first_frame_path': path.replace('%04d', '1001'),
+            'is_sequence': True,
+            'frames': FrameSet.from_ranges([(1001, 1100)]),
+            'frame_range': "1001-1100",
+            'missing_frames': "",
+            'size': 1024 * 1024 * 100,
+        }
+
+
+def resident_mb():
+    """Resident set size of this process"""
+    with open('/proc/self/statm') as f:
+        pages = int(f.read().split()[1])
+    return pages * os.sysconf('SC_PAGE_SIZE') / 1024 / 1024
+
+
+def widget_view(count):
+    """One QTreeWidgetItem per plate, filled like the item based plate list did"""
+    from PySide2.QtCore import Qt
+    from PySide2.QtWidgets import QTreeWidget, QTreeWidgetItem
+    from nuke_importer.config.settings import PLATE_LIST_COLUMNS, METADATA_PLACEHOLDER
+    from nuke_importer.utils.format_utils import format_size
+
+    view = QTreeWidget()
+    view.setHeaderLabels(PLATE_LIST_COLUMNS)
+    for plate in plate_records(count):
+        item = QTreeWidgetItem(view)
+        item.setText(0, plate['display_name'])
+        item.setText(1, plate['version'])
+        item.setText(2, plate['frame_range'])
+        item.setText(3, METADATA_PLACEHOLDER)
+        item.setText(4, plate['ext'])
+        item.setText(5, METADATA_PLACEHOLDER)
+        item.setText(6, format_size(plate['size']))
+        item.setData(6, Qt.UserRole, plate['size'])
+        item.setText(7, plate['path'])
+        item.setText(8, plate['missing_frames'])
+        item.setData(0, Qt.UserRole, plate['first_frame_path'])
+    return view
+
+
+def model_view(count):
+    """QTreeView over PlateTableModel, set up like PlateList"""
+    from PySide2.QtWidgets import QTreeView
+    from nuke_importer.ui.plate_model import PlateTableModel
+
+    model = PlateTableModel()
+    view = QTreeView()
+    view.setModel(model)
+    view.setRootIsDecorated(False)
+    view.setUniformRowHeights(True)
+    for plate in plate_records(count):
+        model.add_plate(plate)
+    return view
+
+
+def measure(view_name, count):
+    """Fill one view and print its row memory and scroll repaint times"""
+    from PySide2.QtWidgets import QApplication
+
+    app = QApplication([])
+    baseline = resident_mb()
+
+    start = time.perf_counter()
+    view = {'widget': widget_view, 'model': model_view}[view_name](count)
+    fill = time.perf_counter() - start
+    memory = resident_mb() - baseline
+
+    view.resize(*VIEW_SIZE)
+    view.show()
+    app.processEvents()
+    scroll_bar = view.verticalScrollBar()
+    times = []
+    for step in range(SCROLL_STEPS):
+        # Jump back and forth across the list, every step paints rows not painted before
+        position = (step * 7919) % SCROLL_STEPS
+        start = time.perf_counter()
+        scroll_bar.setValue(scroll_bar.maximum() * position // (SCROLL_STEPS - 1))
+        view.viewport().repaint()
+        app.processEvents()
+        times.append((time.perf_counter() - start) * 1000)
+    times.sort()
+
+    print(f"{view_name:8} {count:>9} rows  fill {fill:7.2f}s  {memory:8.1f} MB  "
+          f"scroll median {times[len(times) // 2]:6.2f} ms  max {times[-1]:6.2f} ms", flush=True)
+
+
+def main():
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    if len(sys.argv) > 2 and sys.argv[1] in VIEWS:
+        measure(sys.argv[1], int(sys.argv[2]))
+        return
+
+    counts = [int(arg) for arg in sys.argv[1:]] or [100000, 1000000]
+    for count in counts:
+        for view_name in VIEWS:
+            subprocess.run([sys.executable, os.path.abspath(__file__), view_name, str(count)])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+# nuke_importer/tools/bench_plate_store.py
+"""
+Memory and speed of PlateStore against one dict per row.
+
+The dict rows stand in for the per plate records the list kept before the
+columnar store, the views over it are measured by tools/bench_plate_list.py.
+Times appending scanner records, sorting by name and version, and a latest
+version filter.
+
+    python tools/bench_plate_store.py [row count ...]
+"""
+import os
+import sys
+import time
+import tracemalloc
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if 'nuke_importer' not in sys.modules:
+    package = types.ModuleType('nuke_importer')
+    package.__path__ = [ROOT]
+    sys.modules['nuke_importer'] = package
+
+from nuke_importer.core.frame_set import FrameSet  # noqa: E402
+from nuke_importer.core.plate_store import PlateStore, COL_NAME, COL_VERSION  # noqa: E402
+from nuke_importer.core.plate_filter import PlateFilterIndex, LATEST_VERSION  # noqa: E402
+from nuke_importer.utils.frame_pattern_utils import version_number  # noqa: E402
+
+VERSIONS_PER_PLATE = 4
+
+
+def build_records(count):
+    """Scanner records of count sequences, a few versions per plate"""
+    records = []
+    for index in range(count):
+        shot, version = divmod(index, VERSIONS_PER_PLATE)
+        name = f"sh{shot:06d}_plate_v{version + 1:03d}"
+        path = f"/show/seq{shot // 100:04d}/sh{shot:06d}/{name}.%04d.exr"
+        records.append({
+            'display_name': name,
+            'version': f"v{version + 1:03d}",
+            'ext': '.exr',
+            'path': path,
+            'first_frame_path': path.replace('%04d', '1001'),
+            'is_sequence': True,
+            'frames': FrameSet.from_ranges([(1001, 1100)]),
+            'missing_frames': "",
+            'size': 1024 * 1024 * 100,
+        })
+    return records
+
+
+def dict_rows(records):
+    rows = []
+    for plate in records:
+        row = dict(plate)
+        row['version_number'] = version_number(plate['version'])
+        rows.append(row)
+
+    order = sorted(range(len(rows)), key=lambda r: rows[r]['display_name'].lower())
+    order = sorted(range(len(rows)), key=lambda r: rows[r]['version_number'])
+    latest = {}
+    for row in rows:
+        base = row['path'].rsplit('_v', 1)[0]
+        latest[base] = max(latest.get(base, -1), row['version_number'])
+    visible = [row['version_number'] == latest[row['path'].rsplit('_v', 1)[0]]
+               for row in rows]
+    return rows, order, visible
+
+
+def store_rows(records):
+    store = PlateStore()
+    for plate in records:
+        store.append(plate)
+
+    keys = store.sort_keys(COL_NAME)
+    order = sorted(range(len(store)), key=keys.__getitem__)
+    keys = store.sort_keys(COL_VERSION)
+    order = sorted(range(len(store)), key=keys.__getitem__)
+    visible = PlateFilterIndex(store).match(version_filter=LATEST_VERSION)
+    return store, order, visible
+
+
+def measure(label, fn, records):
+    # Timed without tracemalloc, which slows allocations down several times
+    start = time.perf_counter()
+    fn(records)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    result = fn(records)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    print(f"{label:8} {len(records):>9} rows  {elapsed:7.2f}s  {current / 1024 / 1024:9.1f} MB")
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [100000, 1000000]
+    for count in counts:
+        records = build_records(count)
+        measure('dicts', dict_rows, records)
+        measure('store', store_rows, records)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+# nuke_importer/tools/bench_tokenizer.py
+"""
+Throughput of sequence detection on file names built from the labelled corpus.
+
+Compares the per-file regex loop PlateList._process_file used before the
+shared tokenizer with core.scanner.group_files. Only names are processed,
+no file system access.
+
+    python tools/bench_tokenizer.py [file count]
+"""
+import os
+import re
+import sys
+import time
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'tests'))
+if 'nuke_importer' not in sys.modules:
+    package = types.ModuleType('nuke_importer')
+    package.__path__ = [ROOT]
+    sys.modules['nuke_importer'] = package
+
+from nuke_importer.core.scanner import group_files  # noqa: E402
+from filename_corpus import FILENAME_CORPUS  # noqa: E402
+
+# Patterns of the old PlateList._process_file, tried in order per file
+LEGACY_FRAME_PATTERNS = [
+    r'_(\d+)\.([\w]+)$',
+    r'\.(\d+)\.([\w]+)$',
+    r'(\d{2,})\.([\w]+)$',
+    r'[._](\d{2,})[._]',
+    r'(\d{2,})_v\d+\.([\w]+)$',
+    r'_v\d+_(\d+)\.([\w]+)$',
+]
+
+
+def legacy_group(root, files):
+    """Old grouping: version search, then the first matching frame pattern"""
+    plates = {}
+    for file in files:
+        version_match = re.search(r'v(\d+)', file, re.IGNORECASE)
+        version = f"v{version_match.group(1)}" if version_match else "v001"
+        for pattern in LEGACY_FRAME_PATTERNS:
+            match = re.search(pattern, file)
+            if match:
+                frame_num = int(match.group(1))
+                full_match = match.group(0)
+                base_name = file[:file.index(full_match)] + \
+                    file[file.index(full_match):].replace(match.group(1), '%04d')
+                plate = plates.setdefault((root, base_name, version),
+                                          {'min_frame': frame_num, 'max_frame': frame_num})
+                plate['min_frame'] = min(plate['min_frame'], frame_num)
+                plate['max_frame'] = max(plate['max_frame'], frame_num)
+                break
+    return plates
+
+
+def build_listing(count):
+    """Frames of every numbered corpus name until count names exist"""
+    templates = [(prefix, padding, suffix, ext)
+                 for _, prefix, frame, padding, suffix, _, ext in FILENAME_CORPUS
+                 if frame is not None]
+    frames_per_sequence = max(1, count // len(templates))
+    files = []
+    for prefix, padding, suffix, ext in templates:
+        for frame in range(1001, 1001 + frames_per_sequence):
+            files.append(f"{prefix}{str(frame).zfill(padding)}{suffix}{ext}")
+    return files[:count]
+
+
+def measure(label, fn, files):
+    start = time.perf_counter()
+    fn('/show/plates', files)
+    elapsed = time.perf_counter() - start
+    print(f"{label:10} {len(files):>9} names  {elapsed:7.3f}s  {len(files) / elapsed:>12,.0f} files/s")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    files = build_listing(count)
+    measure('before', legacy_group, files)
+    measure('after', group_files, files)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,8 @@
 # filter_panel.py
 from PySide2.QtWidgets import (QWidget, QHBoxLayout, QLabel, 
                              QLineEdit, QComboBox, QCheckBox, QGroupBox)
-from ..config.settings import FORMAT_FILTERS, VERSION_FILTERS
+from PySide2.QtCore import QTimer
+from ..config.settings import FORMAT_FILTERS, VERSION_FILTERS, SEARCH_DEBOUNCE
 
 class FilterPanel(QWidget):
     def __init__(self, parent=None):
@@ -20,6 +21,11 @@ class FilterPanel(QWidget):
         self.search_filter = QLineEdit()
         self.search_filter.setPlaceholderText("Search in plate names...")
 
+        # Filter once typing pauses instead of on every keystroke
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE)
+
         # Format filter
         self.format_filter = QComboBox()
         self.format_filter.addItems(FORMAT_FILTERS)
@@ -31,6 +37,9 @@ class FilterPanel(QWidget):
         # Sequence filter
         self.sequence_only = QCheckBox("Sequences Only")
 
+        # Search every indexed folder of the project instead of the listed one
+        self.project_search = QCheckBox("Whole Project")
+
         # Add components to layout
         filter_layout.addWidget(QLabel("Search:"))
         filter_layout.addWidget(self.search_filter)
@@ -39,29 +48,38 @@ class FilterPanel(QWidget):
         filter_layout.addWidget(QLabel("Version:"))
         filter_layout.addWidget(self.version_filter)
         filter_layout.addWidget(self.sequence_only)
+        filter_layout.addWidget(self.project_search)
 
         # Add group to main layout
         main_layout.addWidget(filter_group)
 
     def setup_connections(self, plate_list):
         """Setup signal connections with plate list"""
-        self.search_filter.textChanged.connect(plate_list.apply_filters)
+        self.search_filter.textChanged.connect(self.search_timer.start)
+        self.search_timer.timeout.connect(plate_list.apply_filters)
         self.format_filter.currentTextChanged.connect(plate_list.apply_filters)
         self.version_filter.currentTextChanged.connect(plate_list.apply_filters)
         self.sequence_only.stateChanged.connect(plate_list.apply_filters)
+        self.project_search.stateChanged.connect(plate_list.apply_filters)
 
     def update_filters(self, plate_list):
         """Update version filter based on available versions"""
         if not plate_list:
             return
 
-        current_versions = set()
-        for i in range(plate_list.topLevelItemCount()):
-            item = plate_list.topLevelItem(i)
-            current_versions.add(item.text(1))
+        current = self.version_filter.currentText()
+        versions = plate_list.filter_index().versions()
 
+        # Refill without a filter pass per inserted entry, keep the selection if it still exists
+        self.version_filter.blockSignals(True)
         self.version_filter.clear()
-        self.version_filter.addItems(VERSION_FILTERS + sorted(list(current_versions)))
+        self.version_filter.addItems(VERSION_FILTERS + versions)
+        index = self.version_filter.findText(current)
+        self.version_filter.setCurrentIndex(max(index, 0))
+        self.version_filter.blockSignals(False)
+
+        if index < 0:
+            plate_list.apply_filters()
 
     def get_filter_values(self):
         """Get current filter values"""
@@ -69,5 +87,6 @@ class FilterPanel(QWidget):
             'search': self.search_filter.text().lower(),
             'format': self.format_filter.currentText(),
             'version': self.version_filter.currentText(),
-            'sequence_only': self.sequence_only.isChecked()
+            'sequence_only': self.sequence_only.isChecked(),
+            'project_search': self.project_search.isChecked()
         }
\ No newline at end of file
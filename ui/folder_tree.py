@@ -2,39 +2,142 @@
 from PySide2.QtCore import QThread, Signal, Qt
 from PySide2.QtWidgets import QTreeWidget, QTreeWidgetItem
 import os
-from ..config.settings import FOLDER_TREE_WIDTH, SUPPORTED_FORMATS
+import time
+import threading
+from collections import deque
+from ..config.settings import (FOLDER_TREE_WIDTH, SCAN_WORKERS, FOLDER_TREE_BATCH_SIZE,
+                               PLATE_SCAN_BATCH_INTERVAL, FOLDER_TREE_LAZY)
+from ..core.scan_index import get_scan_index
+from ..core.scanner import walk_directories, list_directory
+from ..core.scan_pool import get_scan_pool, PRIORITY_BROWSE, PRIORITY_BACKGROUND
 from ..utils.file_utils import get_file_extensions
 
 class ScannerThread(QThread):
     progress = Signal(int)
-    directory_found = Signal(str, list)
+    directories_found = Signal(list)
     scan_complete = Signal()
     
-    def __init__(self, path):
+    def __init__(self, path, index_only=False):
         super().__init__()
         self.path = path
+        # Only fill the scan index, e.g. for project search behind the lazy tree
+        self.index_only = index_only
         self.total_dirs = 0
         self.scanned_dirs = 0
-        
+        self._cancelled = False
+
+    def cancel(self):
+        """Ask the walk to stop at the next directory"""
+        self._cancelled = True
+
+    def is_cancelled(self):
+        return self._cancelled
+
+    def _on_progress(self, scanned_dirs, expected_dirs, current_dir):
+        self.scanned_dirs = scanned_dirs
+        self.total_dirs = expected_dirs
+
     def run(self):
-        for root, dirs, files in os.walk(self.path):
-            extensions = {os.path.splitext(f)[1].lower() for f in files 
-                        if os.path.splitext(f)[1].lower() in SUPPORTED_FORMATS}
+        # Directories go to the tree in batches, one signal per directory floods the event loop
+        batch = []
+        last_emit = time.monotonic()
+
+        # Unchanged directories come straight from the persistent index, tree
+        # population yields to the plate scan of the folder the user picked
+        listings = walk_directories(self.path, self._on_progress, self.is_cancelled,
+                                    get_scan_index(), SCAN_WORKERS, PRIORITY_BACKGROUND)
+        for listing in listings:
+            if self.index_only:
+                continue
+            extensions = get_file_extensions(listing['files'])
             if extensions:
-                self.directory_found.emit(root, list(extensions))
-            
-            self.scanned_dirs += 1
-            progress = int((self.scanned_dirs / max(1, self.total_dirs)) * 100)
-            self.progress.emit(progress)
-            
+                batch.append((listing['path'], list(extensions)))
+
+            now = time.monotonic()
+            if batch and (len(batch) >= FOLDER_TREE_BATCH_SIZE
+                          or now - last_emit >= PLATE_SCAN_BATCH_INTERVAL):
+                self.directories_found.emit(batch)
+                batch = []
+                last_emit = now
+                self.progress.emit(int(self.scanned_dirs / max(1, self.total_dirs) * 100))
+
+        if self._cancelled:
+            return
+
+        if batch:
+            self.directories_found.emit(batch)
         self.scan_complete.emit()
 
+
+class ListingThread(QThread):
+    """Lists single directories on request, for the lazy folder tree"""
+    listed = Signal(list)
+
+    def __init__(self):
+        super().__init__()
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = False
+
+    def request(self, paths):
+        """Queue directories to list, most recent requests first"""
+        with self._lock:
+            self._queue.extendleft(reversed(paths))
+        self._wake.set()
+
+    def clear(self):
+        with self._lock:
+            self._queue.clear()
+
+    def stop(self):
+        self._stopped = True
+        self._wake.set()
+
+    def _next_batch(self):
+        with self._lock:
+            return [self._queue.popleft() for _ in range(min(SCAN_WORKERS, len(self._queue)))]
+
+    def _list(self, path):
+        try:
+            listing = list_directory(path, self._index)
+        except OSError:
+            return (path, None, [])
+        return (path, listing['subdirs'], sorted(get_file_extensions(listing['files'])))
+
+    def run(self):
+        self._index = get_scan_index()
+        pool = get_scan_pool()
+        while not self._stopped:
+            batch = self._next_batch()
+            if not batch:
+                if self._index:
+                    self._index.flush()
+                self._wake.wait()
+                self._wake.clear()
+                continue
+            # Expanded folders go ahead of background tree population
+            futures = [pool.submit(PRIORITY_BROWSE, self._list, path) for path in batch]
+            self.listed.emit([future.result() for future in futures])
+
+
 class FolderTree(QTreeWidget):
     def __init__(self, current_first=None, current_last=None):
         super().__init__()
         self.current_first = current_first
         self.current_last = current_last
         self.scanner_thread = None
+        # Index only walk of the lazy tree, started by project search
+        self.index_thread = None
+        self._old_scanner_threads = []
+        # Normalized directory path -> tree item
+        self._items = {}
+        # Lazy mode: directories whose children have been added to the tree,
+        # directories listed from disk this session and listings in flight
+        self._populated = set()
+        self._listed = set()
+        self._requested = set()
+        self.listing_thread = None
         self.setup_ui()
         self.total_dirs = 0
         self.current_dir = 0
@@ -43,26 +146,37 @@ class FolderTree(QTreeWidget):
         """Setup the folder tree UI"""
         self.setHeaderLabels(["Project Folders", "File Types"])
         self.setColumnWidth(0, FOLDER_TREE_WIDTH)
+        self.itemExpanded.connect(self._on_item_expanded)
 
     def scan_directory(self, path, status_bar=None):
         """Scan directory and create tree structure"""
         if not path or not os.path.exists(path):
             return
 
+        self.cancel_scan()
         self.clear()
+        self._items = {}
+        self._populated = set()
+        self._listed = set()
+        self._requested = set()
         self.status_bar = status_bar
 
         # Create root item
         self.root_item = QTreeWidgetItem(self)
         self.root_item.setText(0, os.path.basename(path))
         self.root_item.setData(0, Qt.UserRole, path)
+        self._items[os.path.normpath(path)] = self.root_item
+
+        if FOLDER_TREE_LAZY:
+            self._start_lazy(path)
+            return
 
         # Initialize scanner thread
         self.scanner_thread = ScannerThread(path)
         self.scanner_thread.progress.connect(
             lambda p: status_bar.setValue(p) if status_bar else None
         )
-        self.scanner_thread.directory_found.connect(self._add_directory_item)
+        self.scanner_thread.directories_found.connect(self._add_directory_items)
         self.scanner_thread.scan_complete.connect(self._on_scan_complete)
 
         # Scan root directory files
@@ -76,37 +190,273 @@ class FolderTree(QTreeWidget):
             status_bar.setFormat("Scanning directories...")
         self.scanner_thread.start()
 
+    def index_project(self):
+        """
+        Walk the whole project into the scan index, for project wide search
+
+        The lazy tree only lists what is expanded, so the rest of the show is
+        walked once, on first use, at background priority. The walk reports
+        nothing, the tree and status bar stay as they are. The eager tree
+        indexes everything as it builds.
+        """
+        if not FOLDER_TREE_LAZY or self.index_thread is not None \
+                or not hasattr(self, 'root_item'):
+            return
+        self.index_thread = ScannerThread(self.root_item.data(0, Qt.UserRole), index_only=True)
+        self.index_thread.start()
+
+    def cancel_scan(self):
+        """Stop the running tree walk, its late results are dropped"""
+        if self.scanner_thread:
+            self.scanner_thread.cancel()
+            self.scanner_thread.progress.disconnect()
+            self.scanner_thread.directories_found.disconnect(self._add_directory_items)
+            self.scanner_thread.scan_complete.disconnect(self._on_scan_complete)
+
+            # Keep a reference until the thread has actually stopped
+            if self.scanner_thread.isRunning():
+                self._old_scanner_threads.append(self.scanner_thread)
+            self.scanner_thread = None
+
+        if self.index_thread is not None:
+            self.index_thread.cancel()
+            if self.index_thread.isRunning():
+                self._old_scanner_threads.append(self.index_thread)
+            self.index_thread = None
+
+        self._old_scanner_threads = [t for t in self._old_scanner_threads if t.isRunning()]
+        if self.listing_thread is not None:
+            self.listing_thread.clear()
+
+    def _start_lazy(self, path):
+        """List only the root now, everything below is listed when it is expanded"""
+        if self.listing_thread is None:
+            self.listing_thread = ListingThread()
+            self.listing_thread.listed.connect(self._on_listed)
+            self.listing_thread.start()
+        self.listing_thread.clear()
+
+        listing = list_directory(path, get_scan_index())
+        root_path = os.path.normpath(path)
+        self._populated.add(root_path)
+        self._apply_listing(root_path, listing['subdirs'],
+                            sorted(get_file_extensions(listing['files'])))
+        self.root_item.setExpanded(True)
+
+        if self.status_bar:
+            self.status_bar.setFormat("Ready")
+            self.status_bar.setValue(100)
+
+    def stop_threads(self):
+        """Stop the background walk and listing, used when the tool closes"""
+        self.cancel_scan()
+        for thread in self._old_scanner_threads:
+            thread.wait()
+        self._old_scanner_threads = []
+        if self.listing_thread is not None:
+            self.listing_thread.stop()
+            self.listing_thread.wait()
+            self.listing_thread = None
+
+    def _on_item_expanded(self, item):
+        """Add the children of a lazily listed directory the first time it opens"""
+        if not FOLDER_TREE_LAZY or self.listing_thread is None:
+            return
+        path = os.path.normpath(item.data(0, Qt.UserRole))
+        if path in self._populated:
+            return
+
+        # Show what the index remembers right away, the fresh listing follows
+        index = get_scan_index()
+        cached = index.peek(path) if index else None
+        if cached is not None:
+            self._apply_listing(path, cached['subdirs'],
+                                sorted(get_file_extensions(cached['files'])), fresh=False)
+        else:
+            self._populated.add(path)
+        self._request_listings([path])
+
+    def _request_listings(self, paths):
+        """List directories in the background, skipping the ones already listed or queued"""
+        paths = [p for p in paths if p not in self._requested
+                 and (p not in self._listed or p in self._populated)]
+        if paths and self.listing_thread is not None:
+            self._requested.update(paths)
+            self.listing_thread.request(paths)
+
+    def _on_listed(self, listings):
+        """Apply directory listings coming from the listing thread"""
+        self.setUpdatesEnabled(False)
+        try:
+            for path, subdirs, extensions in listings:
+                path = os.path.normpath(path)
+                self._requested.discard(path)
+                if subdirs is None:
+                    item = self._items.get(path)
+                    if item is not None and item is not self.root_item:
+                        self._remove_item(item)
+                    continue
+                self._apply_listing(path, subdirs, extensions)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _apply_listing(self, path, subdirs, extensions, fresh=True):
+        """
+        Update a directory item from its listing
+
+        Expanded directories get their children synced, the others only get
+        the File Types column and a child indicator hint.
+
+        Args:
+            fresh (bool): The listing comes from disk, not from the index hint.
+                Children of a freshly listed expanded directory are listed one
+                level ahead so their hints are correct before they are opened.
+        """
+        item = self._items.get(path)
+        if item is None:
+            return
+        item.setText(1, ", ".join(extensions))
+        if fresh:
+            self._listed.add(path)
+
+        if path not in self._populated and not item.isExpanded():
+            item.setChildIndicatorPolicy(
+                QTreeWidgetItem.ShowIndicator if subdirs
+                else QTreeWidgetItem.DontShowIndicatorWhenChildless)
+            return
+
+        self._populated.add(path)
+        item.setChildIndicatorPolicy(QTreeWidgetItem.DontShowIndicatorWhenChildless)
+
+        wanted = set(subdirs)
+        for j in reversed(range(item.childCount())):
+            child = item.child(j)
+            if child.text(0) in wanted:
+                wanted.discard(child.text(0))
+            else:
+                self._remove_item(child)
+
+        index = get_scan_index()
+        for name in sorted(wanted):
+            child_path = os.path.join(path, name)
+            child = QTreeWidgetItem(item)
+            child.setText(0, name)
+            child.setData(0, Qt.UserRole, os.path.join(item.data(0, Qt.UserRole), name))
+            self._items[child_path] = child
+
+            # Indexed hint until the look-ahead listing arrives
+            cached = index.peek(child_path) if index else None
+            if cached is not None:
+                child.setText(1, ", ".join(sorted(get_file_extensions(cached['files']))))
+                child.setChildIndicatorPolicy(
+                    QTreeWidgetItem.ShowIndicator if cached['subdirs']
+                    else QTreeWidgetItem.DontShowIndicatorWhenChildless)
+            else:
+                child.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+
+        if fresh:
+            self._request_listings([os.path.join(path, name) for name in subdirs
+                                    if os.path.join(path, name) not in self._listed])
+
+    def _add_directory_items(self, directories):
+        """Add a batch of (path, extensions) with repaints held until the end"""
+        self.setUpdatesEnabled(False)
+        try:
+            for path, extensions in directories:
+                self._add_directory_item(path, extensions)
+        finally:
+            self.setUpdatesEnabled(True)
+
     def _add_directory_item(self, path, extensions):
         """Add directory item to tree with extensions"""
         if not hasattr(self, 'root_item'):
             return
 
-        parent = self.root_item
-        rel_path = os.path.relpath(path, self.root_item.data(0, Qt.UserRole))
-        parts = rel_path.split(os.sep)
+        path = os.path.normpath(path)
+        item = self._items.get(path)
+        if item is None:
+            # Walk up to the closest directory already in the tree
+            missing = []
+            parent_path = path
+            parent = None
+            while parent is None:
+                missing.append(parent_path)
+                parent_path = os.path.dirname(parent_path)
+                if parent_path == missing[-1]:
+                    # Not below the root
+                    return
+                parent = self._items.get(parent_path)
 
-        for i, part in enumerate(parts):
-            found = False
-            for j in range(parent.childCount()):
-                child = parent.child(j)
-                if child.text(0) == part:
-                    parent = child
-                    found = True
-                    break
-
-            if not found:
+            for dir_path in reversed(missing):
                 item = QTreeWidgetItem(parent)
-                item.setText(0, part)
+                item.setText(0, os.path.basename(dir_path))
                 item.setData(0, Qt.UserRole, os.path.join(
-                    parent.data(0, Qt.UserRole), part
+                    parent.data(0, Qt.UserRole), os.path.basename(dir_path)
                 ))
+                self._items[dir_path] = item
                 parent = item
 
         if extensions:
-            parent.setText(1, ", ".join(sorted(extensions)))
+            item.setText(1, ", ".join(sorted(extensions)))
 
     def _on_scan_complete(self):
         """Handle scan completion"""
         if hasattr(self, 'status_bar') and self.status_bar:
             self.status_bar.setFormat("Ready")
-            self.status_bar.setValue(100)
\ No newline at end of file
+            self.status_bar.setValue(100)
+
+    def _find_item(self, path):
+        """Find the tree item of a directory, or None if it is not in the tree"""
+        return self._items.get(os.path.normpath(path))
+
+    def _remove_item(self, item):
+        """Remove a directory item and forget it and everything below it"""
+        stack = [item]
+        while stack:
+            current = stack.pop()
+            current_path = os.path.normpath(current.data(0, Qt.UserRole))
+            self._items.pop(current_path, None)
+            self._populated.discard(current_path)
+            stack.extend(current.child(j) for j in range(current.childCount()))
+        item.parent().removeChild(item)
+
+    def refresh_listings(self, listings):
+        """
+        Update the tree with directories listed again by the folder watcher
+
+        Args:
+            listings (list): Changed listings in walk order, a removed
+                directory has 'subdirs' None
+        """
+        if not hasattr(self, 'root_item'):
+            return
+
+        root_path = os.path.normpath(self.root_item.data(0, Qt.UserRole))
+
+        for listing in listings:
+            path = os.path.normpath(listing['path'])
+            if path != root_path and not path.startswith(root_path + os.sep):
+                continue
+
+            item = self._find_item(path)
+            if listing['subdirs'] is None:
+                if item is not None and item is not self.root_item:
+                    self._remove_item(item)
+                continue
+
+            extensions = get_file_extensions(listing['files'])
+            if FOLDER_TREE_LAZY:
+                # Only directories already in the tree matter, new ones are listed on expand
+                self._apply_listing(path, listing['subdirs'], sorted(extensions))
+                continue
+            if item is not None:
+                item.setText(1, ", ".join(sorted(extensions)))
+            elif extensions:
+                self._add_directory_item(path, list(extensions))
+
+            # Remove vanished sub directories, new ones have listings of their own
+            if item is not None:
+                for j in reversed(range(item.childCount())):
+                    child = item.child(j)
+                    if child.text(0) not in listing['subdirs']:
+                        self._remove_item(child)
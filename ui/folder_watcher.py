@@ -0,0 +1,174 @@
+# nuke_importer/ui/folder_watcher.py
+from PySide2.QtCore import QObject, QFileSystemWatcher, QTimer, Signal
+import os
+from ..config.settings import (WATCH_MODE, WATCH_POLL_INTERVAL, WATCH_POLL_PREFIXES,
+                               WATCH_DEBOUNCE, WATCH_MAX_DIRECTORIES)
+from ..core.scan_index import get_scan_index
+from ..core.scan_pool import get_scan_pool, PRIORITY_BACKGROUND
+from ..core.scanner import relist_directories
+
+
+def _stat_directories(polled):
+    """Changed (path, mtime) pairs of {path: last mtime}, mtime None if the directory is gone"""
+    changed = []
+    for path, mtime in polled.items():
+        try:
+            current = os.stat(path).st_mtime
+        except OSError:
+            changed.append((path, None))
+            continue
+        if current != mtime:
+            changed.append((path, current))
+    return changed
+
+
+class FolderWatcher(QObject):
+    """
+    Watch directories natively, or by polling mtimes on network mounts
+
+    Polling and listing the changed directories again run on the scan pool,
+    only the listings that changed reach the UI.
+    """
+    listings_changed = Signal(list)
+    # Results of pool jobs, delivered to the GUI thread with a generation
+    _sweep_done = Signal(int, list)
+    _relist_done = Signal(int, list)
+
+    def __init__(self, parent=None, mode=WATCH_MODE):
+        super(FolderWatcher, self).__init__(parent)
+        self.mode = mode
+        self._native = QFileSystemWatcher(self)
+        self._native.directoryChanged.connect(self._on_directory_changed)
+        self._polled = {}
+        self._changed = set()
+        # Bumped by clear(), results of earlier pool jobs are dropped
+        self._generation = 0
+        self._poll_future = None
+        self._sweep_done.connect(self._on_swept)
+        self._relist_done.connect(self._on_relisted)
+
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(WATCH_POLL_INTERVAL)
+        self._poll_timer.timeout.connect(self._poll)
+
+        # Renders touch a directory once per frame, report them together
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(WATCH_DEBOUNCE)
+        self._debounce_timer.timeout.connect(self._emit_changes)
+
+    def set_directories(self, paths):
+        """Replace the watched directories"""
+        self.clear()
+        self.add_directories(paths)
+
+    def add_directories(self, paths):
+        """Start watching more directories"""
+        native_paths = []
+        new_polled = False
+        watched = set(self._native.directories())
+        for path in paths:
+            path = os.path.normpath(path)
+            if path in watched or path in self._polled:
+                continue
+            if len(self._polled) + len(watched) >= WATCH_MAX_DIRECTORIES:
+                print(f"Watch limit of {WATCH_MAX_DIRECTORIES} directories reached, "
+                      f"not watching {path}")
+                break
+
+            if self._use_polling(path):
+                # mtime is taken by the next sweep
+                self._polled[path] = None
+                new_polled = True
+            else:
+                native_paths.append(path)
+                watched.add(path)
+
+        if native_paths:
+            self._native.addPaths(native_paths)
+        if self._polled and not self._poll_timer.isActive():
+            self._poll_timer.start()
+        if new_polled:
+            self._poll()
+
+    def remove_directories(self, paths):
+        """Stop watching directories"""
+        paths = [os.path.normpath(p) for p in paths]
+        watched = set(self._native.directories())
+        native_paths = [p for p in paths if p in watched]
+        if native_paths:
+            self._native.removePaths(native_paths)
+        for path in paths:
+            self._polled.pop(path, None)
+        if not self._polled:
+            self._poll_timer.stop()
+
+    def clear(self):
+        """Stop watching everything"""
+        if self._native.directories():
+            self._native.removePaths(self._native.directories())
+        self._polled.clear()
+        self._poll_timer.stop()
+        self._changed.clear()
+        self._debounce_timer.stop()
+        self._generation += 1
+
+    def _use_polling(self, path):
+        """Check whether a path has to be polled instead of natively watched"""
+        if self.mode == 'poll':
+            return True
+        if self.mode == 'native':
+            return False
+        normalized = path.replace('\\', '/')
+        return any(normalized.startswith(prefix) for prefix in WATCH_POLL_PREFIXES)
+
+    def _poll(self):
+        """Stat the polled directories on the scan pool, one sweep at a time"""
+        if self._poll_future is not None and not self._poll_future.done():
+            return
+        self._poll_future = get_scan_pool().submit(
+            PRIORITY_BACKGROUND, _stat_directories, dict(self._polled))
+        self._poll_future.add_done_callback(self._deliver(self._sweep_done))
+
+    def _deliver(self, signal):
+        """Done callback of a pool job, emits its result to the GUI thread"""
+        generation = self._generation
+
+        def done(future):
+            if not future.cancelled() and future.exception() is None:
+                signal.emit(generation, future.result())
+        return done
+
+    def _on_swept(self, generation, changed):
+        """Compare the swept mtimes against the last seen values"""
+        if generation != self._generation:
+            return
+        for path, mtime in changed:
+            if path not in self._polled:
+                # No longer watched
+                continue
+            previous = self._polled[path]
+            if mtime is None:
+                # Directory is gone, report it once and stop polling it
+                del self._polled[path]
+            else:
+                self._polled[path] = mtime
+            if previous is not None:
+                self._on_directory_changed(path)
+
+    def _on_directory_changed(self, path):
+        self._changed.add(os.path.normpath(path))
+        self._debounce_timer.start()
+
+    def _emit_changes(self):
+        """List the changed directories again on the scan pool"""
+        changed = sorted(self._changed)
+        self._changed.clear()
+        if changed:
+            future = get_scan_pool().submit(PRIORITY_BACKGROUND, relist_directories,
+                                            changed, get_scan_index())
+            future.add_done_callback(self._deliver(self._relist_done))
+
+    def _on_relisted(self, generation, listings):
+        if generation == self._generation and listings:
+            self.listings_changed.emit(listings)
@@ -3,15 +3,17 @@ import nuke
 import os
 import socket
 from PySide2.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout,
-                               QSplitter, QLabel, QPushButton)
+                               QSplitter, QLabel, QPushButton, QCheckBox)
 from PySide2.QtCore import Qt
 from .thumbnail_viewer import ThumbnailViewer
-from ..config.settings import WINDOW_SIZE, PC_USER_MAPPINGS, WELCOME_MESSAGE
+from ..config.settings import (WINDOW_SIZE, PC_USER_MAPPINGS, WELCOME_MESSAGE, WATCH_ENABLED,
+                               THUMBNAIL_PREFETCH_ROWS)
 from ..utils.file_utils import setup_status_bar
 from ..utils.nuke_utils import get_current_frame_range
 from .folder_tree import FolderTree
 from .plate_list import PlateList
 from .filter_panel import FilterPanel
+from .folder_watcher import FolderWatcher
 
 
 class ProjectScannerTool(QWidget):
@@ -22,6 +24,7 @@ class ProjectScannerTool(QWidget):
 
         # Store current frame range
         self.current_first, self.current_last = get_current_frame_range()
+        self.folder_watcher = FolderWatcher(self)
 
         # UI Setup
         self.init_ui()
@@ -29,8 +32,11 @@ class ProjectScannerTool(QWidget):
 
         # Initialize scanning
         self.project_path = nuke.root()['project_directory'].value()
+        self.plate_list.project_root = self.project_path
+        self.plate_list.status_bar = self.status_bar
         if self.project_path:
             self.scan_project_directory()
+            self.update_watched_directories()
         else:
             print("Project path err: 33, main_window.py")
 
@@ -110,8 +116,13 @@ class ProjectScannerTool(QWidget):
         """)
         close_button.clicked.connect(self.close)
 
+        # Watch mode toggle
+        self.watch_checkbox = QCheckBox("Watch for changes")
+        self.watch_checkbox.setChecked(WATCH_ENABLED)
+
         # Add widgets to bottom layout
         bottom_layout.addWidget(welcome_label)
+        bottom_layout.addWidget(self.watch_checkbox)
         bottom_layout.addWidget(close_button)
 
         self.right_layout.addWidget(bottom_panel)
@@ -127,19 +138,33 @@ class ProjectScannerTool(QWidget):
         """Setup signal connections"""
         self.folder_tree.itemClicked.connect(self.on_folder_selected)
         self.filter_panel.setup_connections(self.plate_list)
-        self.plate_list.itemClicked.connect(self.update_thumbnail)
-
-    def update_thumbnail(self, item):
+        # Follows keyboard navigation as well as clicks
+        self.plate_list.selectionModel().currentRowChanged.connect(self.update_thumbnail)
+        self.plate_list.scan_finished.connect(self.on_plate_scan_finished)
+        self.watch_checkbox.toggled.connect(self.update_watched_directories)
+        self.filter_panel.project_search.toggled.connect(self.on_project_search_toggled)
+        self.folder_watcher.listings_changed.connect(self.on_listings_changed)
+
+    def update_thumbnail(self, index, previous=None):
         """Update thumbnail when plate is selected"""
-        if not item:
+        row = self.plate_list.store_row(index)
+        if row is None:
             return
 
-        file_path = item.data(0, Qt.UserRole)
+        file_path = self.plate_list.store.first_frame_paths[row]
         if file_path and os.path.exists(file_path):
             self.thumbnail_viewer.set_thumbnail(file_path)
+            sequence = self.plate_list.sequence_frames(row)
+            if sequence:
+                self.thumbnail_viewer.set_sequence(*sequence)
         else:
             self.thumbnail_viewer.clear_thumbnail()
 
+        # Warm the rows the user is likely to look at next
+        self.thumbnail_viewer.prefetch(
+            self.plate_list.neighbour_thumbnail_paths(row, THUMBNAIL_PREFETCH_ROWS)
+        )
+
     def scan_project_directory(self):
         """Start scanning project directory"""
         if not self.project_path:
@@ -147,9 +172,15 @@ class ProjectScannerTool(QWidget):
 
         self.status_bar.setValue(0)
         self.status_bar.setFormat("Scanning project directory...")
+        # The tree reports its own progress and completion
         self.folder_tree.scan_directory(self.project_path, self.status_bar)
-        self.status_bar.setFormat("Ready")
-        self.status_bar.setValue(100)
+        if self.filter_panel.project_search.isChecked():
+            self.folder_tree.index_project()
+
+    def on_project_search_toggled(self, checked):
+        """Index the folders the lazy tree has not listed the first time project search is used"""
+        if checked:
+            self.folder_tree.index_project()
 
     def on_folder_selected(self, item):
         """Handle folder selection"""
@@ -159,9 +190,43 @@ class ProjectScannerTool(QWidget):
         if not folder_path:
             return
 
+        # Picking a folder leaves project wide search
+        self.filter_panel.project_search.blockSignals(True)
+        self.filter_panel.project_search.setChecked(False)
+        self.filter_panel.project_search.blockSignals(False)
+
         self.status_bar.setValue(0)
         self.status_bar.setFormat(f"Scanning folder: {folder_path}")
+        # Runs in the background, a new click cancels the previous scan
         self.plate_list.scan_plates(folder_path, self.status_bar)
+
+    def on_plate_scan_finished(self):
+        """Refresh filters once the plate list is fully populated"""
         self.filter_panel.update_filters(self.plate_list)
-        self.status_bar.setFormat("Ready")
-        self.status_bar.setValue(100)
\ No newline at end of file
+        self.update_watched_directories()
+
+    def update_watched_directories(self):
+        """Watch the project root and the scanned folder when watch mode is on"""
+        if not self.watch_checkbox.isChecked():
+            self.folder_watcher.clear()
+            return
+
+        directories = list(self.plate_list.scanned_dirs)
+        if self.project_path:
+            directories.insert(0, self.project_path)
+        self.folder_watcher.set_directories(directories)
+
+    def on_listings_changed(self, listings):
+        """Patch the tree and the plate list with what changed on disk"""
+        new_dirs = self.plate_list.refresh_listings(listings)
+        self.folder_tree.refresh_listings(listings)
+        if new_dirs:
+            self.folder_watcher.add_directories(new_dirs)
+
+    def closeEvent(self, event):
+        """Stop background work when the window closes"""
+        self.plate_list.stop_threads()
+        self.folder_tree.stop_threads()
+        self.thumbnail_viewer.stop_threads()
+        self.folder_watcher.clear()
+        super(ProjectScannerTool, self).closeEvent(event)
\ No newline at end of file
@@ -1,18 +1,32 @@
 # nuke_importer/ui/plate_list.py
-from PySide2.QtGui import QColor
-from PySide2.QtWidgets import (QTreeWidget, QTreeWidgetItem, QMenu,
+from PySide2.QtWidgets import (QTreeView, QMenu,
                               QDialog, QVBoxLayout, QTextEdit, QApplication)
-from PySide2.QtCore import Qt
+from PySide2.QtCore import Qt, QThread, QTimer, QPoint, Signal
 import nuke
 import os
 import sys
+import time
 import subprocess
 import json
-import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from .filter_panel import FilterPanel
-from ..config.settings import PLATE_LIST_COLUMNS, COLUMN_WIDTHS, STYLES, SUPPORTED_FORMATS
+from .plate_model import PlateTableModel
+from ..config.settings import (COLUMN_WIDTHS, STYLES,
+                               PLATE_SCAN_BATCH_SIZE, PLATE_SCAN_BATCH_INTERVAL,
+                               PLATE_LIST_CHUNK_SIZE, SCAN_WORKERS,
+                               METADATA_WORKERS, METADATA_PLACEHOLDER, METADATA_LAZY,
+                               METADATA_LOOKAHEAD, METADATA_VIEWPORT_DELAY)
 from ..core.plate_info import PlateInfo
-from ..utils.file_utils import get_sequence_size, reveal_in_explorer
+from ..core.plate_store import (COL_VERSION, COL_FRAME_RANGE, COL_RESOLUTION, COL_FORMAT,
+                                COL_COLORSPACE, COL_SIZE)
+from ..core.plate_filter import PlateFilterIndex
+from ..core.scan_index import get_scan_index
+from ..core.metadata_cache import get_metadata_cache
+from ..core.scanner import walk_directories
+from ..core.scan_pool import PRIORITY_FOREGROUND
+from ..utils.file_utils import reveal_in_explorer
 from ..utils.nuke_utils import create_read_node, create_readgeo_node,set_root_frame_range
 
 
@@ -34,13 +48,167 @@ class MetadataDialog(QDialog):
 
         layout.addWidget(text_edit)
 
-class PlateList(QTreeWidget):
+class PlateScanThread(QThread):
+    progress = Signal(int, str)
+    plates_found = Signal(list)
+    scan_complete = Signal()
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.directories = []
+        self._cancelled = False
+
+    def cancel(self):
+        """Ask the scan to stop at the next directory"""
+        self._cancelled = True
+
+    def is_cancelled(self):
+        return self._cancelled
+
+    def run(self):
+        batch = []
+        last_emit = time.monotonic()
+
+        def on_progress(scanned_dirs, known_dirs, current_dir):
+            self.progress.emit(int(scanned_dirs / max(1, known_dirs) * 100), current_dir)
+
+        # The folder the user picked is listed ahead of background tree work
+        listings = walk_directories(self.path, on_progress, self.is_cancelled,
+                                    get_scan_index(), SCAN_WORKERS, PRIORITY_FOREGROUND)
+        for listing in listings:
+            self.directories.append(listing['path'])
+            batch.extend(listing['plates'])
+
+            # Send by count or time slice so the first rows show up quickly
+            now = time.monotonic()
+            if len(batch) >= PLATE_SCAN_BATCH_SIZE or now - last_emit >= PLATE_SCAN_BATCH_INTERVAL:
+                self.plates_found.emit(batch)
+                batch = []
+                last_emit = now
+
+        if self._cancelled:
+            return
+
+        if batch:
+            self.plates_found.emit(batch)
+        self.scan_complete.emit()
+
+
+class MetadataThread(QThread):
+    metadata_ready = Signal(list)
+    idle = Signal()
+
+    def __init__(self):
+        super().__init__()
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = False
+
+    def request(self, plates):
+        """Queue (plate_path, sample_path) pairs for header metadata"""
+        with self._lock:
+            self._queue.extend(plates)
+        self._wake.set()
+
+    def replace(self, plates):
+        """Replace the queued requests, e.g. with the rows now in the viewport"""
+        with self._lock:
+            self._queue = deque(plates)
+        self._wake.set()
+
+    def clear(self):
+        """Drop queued requests, e.g. when a new folder is scanned"""
+        with self._lock:
+            self._queue.clear()
+
+    def stop(self):
+        """Stop the thread after the running batch"""
+        self._stopped = True
+        self._wake.set()
+
+    def _next_batch(self, size):
+        with self._lock:
+            return [self._queue.popleft() for _ in range(min(size, len(self._queue)))]
+
+    def run(self):
+        with ThreadPoolExecutor(max_workers=METADATA_WORKERS) as executor:
+            while not self._stopped:
+                # Small batches so replaced requests are dropped quickly
+                batch = self._next_batch(METADATA_WORKERS)
+                if not batch:
+                    self.idle.emit()
+                    self._wake.wait()
+                    self._wake.clear()
+                    continue
+
+                results = []
+                last_emit = time.monotonic()
+                for info in PlateInfo.analyze_batch(batch, executor=executor):
+                    results.append(info)
+                    now = time.monotonic()
+                    if now - last_emit >= PLATE_SCAN_BATCH_INTERVAL:
+                        self.metadata_ready.emit(results)
+                        results = []
+                        last_emit = now
+                if results:
+                    self.metadata_ready.emit(results)
+
+
+class PlateList(QTreeView):
+    scan_finished = Signal()
+
     def __init__(self, current_first=1, current_last=100):
         super().__init__()
         self.current_first = current_first
         self.current_last = current_last
         self.wrong_plates = set()
 
+        # Background scan state
+        self.scan_thread = None
+        self.status_bar = None
+        self._old_scan_threads = []
+        self._pending_plates = deque()
+        # Watcher listings that arrived while a scan was running
+        self._deferred_listings = []
+        self._scan_done = True
+        self._plate_count = 0
+        # Metadata cache counters when the scan started, reported once per scan
+        self._cache_baseline = None
+        self.scan_folder = None
+        self.scanned_dirs = set()
+        self._dir_plates = {}
+        # Project wide search, the folder listed before it started is restored after
+        self.project_root = None
+        self._project_query = None
+        self._folder_before_search = None
+        # Rows live in the model's columnar store, the filter index and search run on it
+        self.plate_model = PlateTableModel(self)
+        self._filter_index = None
+        # (filter index, visibility) of the last filter pass
+        self._visible_rows = None
+        self._add_timer = QTimer(self)
+        self._add_timer.setInterval(0)
+        self._add_timer.timeout.connect(self._add_pending_plates)
+
+        # Background metadata, Nuke fallbacks run on the main thread
+        self.metadata_thread = MetadataThread()
+        self.metadata_thread.metadata_ready.connect(self._on_metadata_ready)
+        self.metadata_thread.idle.connect(self._on_metadata_idle)
+        self.metadata_thread.start()
+        self._nuke_metadata = deque()
+        self._nuke_timer = QTimer(self)
+        self._nuke_timer.setInterval(0)
+        self._nuke_timer.timeout.connect(self._analyze_next_with_nuke)
+
+        # Lazy mode only reads metadata of the rows the user can see
+        self._metadata_requested = set()
+        self._viewport_timer = QTimer(self)
+        self._viewport_timer.setSingleShot(True)
+        self._viewport_timer.setInterval(METADATA_VIEWPORT_DELAY)
+        self._viewport_timer.timeout.connect(self._request_visible_metadata)
+
         # Config dosyası için sabit yol
         self.config_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config')
         if not os.path.exists(self.config_dir):
@@ -51,12 +219,25 @@ class PlateList(QTreeWidget):
         self.setup_connections()
         self.load_wrong_plates()  # Wrong plates'leri başlangıçta yükle
 
+    @property
+    def store(self):
+        """Columnar rows of the list, replaced when the list is cleared"""
+        return self.plate_model.store
+
     def setup_ui(self):
         """Set up the plate list UI"""
-        self.setHeaderLabels(PLATE_LIST_COLUMNS)
+        self.setModel(self.plate_model)
         for col, width in COLUMN_WIDTHS.items():
             self.setColumnWidth(col, width)
 
+        # Flat table, equal row heights let the view skip measuring every row
+        self.setRootIsDecorated(False)
+        self.setUniformRowHeights(True)
+        self.setAllColumnsShowFocus(True)
+        # No sort column until a header is clicked, rows keep scan order
+        self.header().setSortIndicator(-1, Qt.AscendingOrder)
+        self.setSortingEnabled(True)
+
         self.setSelectionMode(self.ExtendedSelection)
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.setStyleSheet(STYLES['plate_list'])
@@ -68,21 +249,38 @@ class PlateList(QTreeWidget):
     def setup_connections(self):
         """Setup signal connections"""
         self.customContextMenuRequested.connect(self.show_context_menu)
-        self.itemSelectionChanged.connect(self.on_selection_changed)
+        self.selectionModel().selectionChanged.connect(self.on_selection_changed)
+        self.verticalScrollBar().valueChanged.connect(self._schedule_visible_metadata)
+        self.header().sortIndicatorChanged.connect(self._schedule_visible_metadata)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._schedule_visible_metadata()
 
-    def on_selection_changed(self):
+    def on_selection_changed(self, *args):
         """Handle selection change"""
         if hasattr(self, 'current_first') and hasattr(self, 'current_last'):
             set_root_frame_range(self.current_first, self.current_last)
 
-    def on_plate_double_clicked(self, item):
-        """Handle double click on plate item - DISABLED"""
-        if not item:
+    def store_row(self, index):
+        """Store row of a view index, None if the index is invalid"""
+        if index is None or not index.isValid():
+            return None
+        return self.plate_model.store_row(index.row())
+
+    def selected_rows(self):
+        """Store rows of the selected plates, in view order"""
+        return [self.plate_model.store_row(index.row())
+                for index in sorted(self.selectionModel().selectedRows(), key=lambda i: i.row())]
+
+    def on_plate_double_clicked(self, row):
+        """Handle double click on plate row - DISABLED"""
+        if row is None:
             return
 
-        file_path = item.text(7)  # Tam dosya yolunu al
-        ext = item.text(4).lower()
-        frame_range = item.text(2)
+        file_path = self.store.paths[row]  # Tam dosya yolunu al
+        ext = self.store.text(row, COL_FORMAT).lower()
+        frame_range = self.store.text(row, COL_FRAME_RANGE)
 
         try:
             if ext in ['.mov', '.mp4']:
@@ -96,7 +294,7 @@ class PlateList(QTreeWidget):
                 read_node = create_read_node(
                     file_path,
                     frame_range=frame_range,
-                    colorspace=item.text(5)
+                    colorspace=self._analyzed_colorspace(row)
                 )
 
             if hasattr(self, 'current_first') and hasattr(self, 'current_last'):
@@ -106,228 +304,340 @@ class PlateList(QTreeWidget):
             print(f"Error opening file {file_path}: {str(e)}")
 
     def scan_plates(self, folder_path, status_bar=None):
-        """Scan plates in the selected folder"""
-        self.clear()
+        """Scan plates in the selected folder in a background thread"""
+        self._reset_rows()
+        self.scan_folder = folder_path
+        self._project_query = None
         if not folder_path:
             return
 
+        self.status_bar = status_bar
         if status_bar:
             status_bar.setValue(0)
             status_bar.setFormat("Scanning plates...")
 
-        # Debug print için format listesi
-        # print("Supported formats:", SUPPORTED_FORMATS)
-
-        # First pass: count total files and collect sequences
-        total_files = 0
-        plates = {}
-
-        for root, _, files in os.walk(folder_path):
-            for file in files:
-                file_ext = os.path.splitext(file)[1].lower()
-                # Debug: Her dosyanın uzantısını kontrol et
-                # print(f"Checking file: {file} with extension: {file_ext}")
-
-                if file_ext in SUPPORTED_FORMATS:
-                    total_files += 1
-                    # print(f"Found supported file: {file}")
-
-        # print(f"Total supported files found: {total_files}")
-
-        # Second pass: process files
-        scanned_files = 0
-        for root, _, files in os.walk(folder_path):
-            for file in files:
-                file_ext = os.path.splitext(file)[1].lower()
-
-                if file_ext in SUPPORTED_FORMATS:
-                    if status_bar:
-                        status_bar.setFormat(f"Scanning: {file}")
-
-                    try:
-                        # Video dosyaları için özel işleme
-                        if file_ext in ['.mov', '.mp4', '.mkv', '.avi', '.wmv']:
-                            # print(f"Processing video file: {file}")
-                            self._handle_single_frame(os.path.join(root, file),
-                                                      os.path.splitext(file)[0],
-                                                      "v001")
-                        else:
-                            # Sequence veya diğer dosyalar için normal işleme
-                            self._process_file(root, file, plates)
-
-                        scanned_files += 1
-                        if status_bar:
-                            progress = int((scanned_files / total_files) * 100)
-                            status_bar.setValue(progress)
-                    except Exception as e:
-                        print(f"Error processing file {file}: {str(e)}")
-
-        # Add sequences to list
-        if plates:
-            self._add_sequences_to_list(plates, status_bar)
-
-        if status_bar:
-            status_bar.setFormat("Ready")
-            status_bar.setValue(100)
-        self.apply_wrong_plates_highlight()
-        print(f"Scan complete. Processed {scanned_files} files.")
-
-    def _process_file(self, root, file, plates):
-        """Process individual file"""
-        file_path = os.path.normpath(os.path.join(root, file))
-
-        if not os.path.exists(file_path):
+        self._scan_done = False
+        self._plate_count = 0
+        cache = get_metadata_cache()
+        self._cache_baseline = (cache.hits, cache.misses) if cache is not None else None
+        self.scan_thread = PlateScanThread(folder_path)
+        self.scan_thread.progress.connect(self._on_scan_progress)
+        self.scan_thread.plates_found.connect(self._on_plates_found)
+        self.scan_thread.scan_complete.connect(self._on_scan_complete)
+        self.scan_thread.start()
+
+    def _reset_rows(self):
+        """Stop background work and drop every row"""
+        self.cancel_scan()
+        self.plate_model.clear()
+        self.scan_folder = None
+        self.scanned_dirs = set()
+        self._dir_plates = {}
+        self._metadata_requested = set()
+
+    def show_project_results(self, text):
+        """List plates from the whole project whose name matches, read from the scan index"""
+        if self._project_query is None:
+            self._folder_before_search = self.scan_folder
+        self._reset_rows()
+        self._project_query = text
+
+        index = get_scan_index()
+        if index is None or not self.project_root:
+            if self.status_bar:
+                self.status_bar.setFormat("Project search needs the scan index and a project directory")
             return
-
-        # Extract version
-        version_match = re.search(r'v(\d+)', file, re.IGNORECASE)
-        version = f"v{version_match.group(1)}" if version_match else "v001"
-
-        # 3D dosya formatlarını kontrol et
-        ext = os.path.splitext(file)[1].lower()
-        is_3d_file = ext in ['.fbx', '.obj', '.abc']
-
-        if is_3d_file:
-            base_name = os.path.splitext(file)[0]
-            self._handle_single_frame(file_path, base_name, version)
+        if not text:
+            if self.status_bar:
+                self.status_bar.setFormat("Type a plate name to search the whole project")
             return
 
-        # Geliştirilmiş sekans algılama - farklı frame numaralandırma formatlarını destekle
-        frame_patterns = [
-            # Standard frame patterns
-            r'_(\d+)\.([\w]+)$',  # underscore_number.ext
-            r'\.(\d+)\.([\w]+)$',  # .number.ext
-            r'(\d{2,})\.([\w]+)$',  # number.ext (en az 2 basamaklı)
-
-            # Additional patterns for complex names
-            r'[._](\d{2,})[._]',  # number between dots/underscores
-            r'(\d{2,})_v\d+\.([\w]+)$',  # number_version.ext
-            r'_v\d+_(\d+)\.([\w]+)$',  # version_number.ext
-        ]
-
-        base_name = None
-        frame_num = None
-        ext_match = None
-
-        # Try each pattern until we find a match
-        for pattern in frame_patterns:
-            match = re.search(pattern, file)
-            if match:
-                frame_num = int(match.group(1))
-
-                # Extract extension based on pattern
-                if len(match.groups()) > 1:
-                    ext_match = match.group(2)
-                else:
-                    # If pattern doesn't capture extension, get it directly
-                    ext_match = os.path.splitext(file)[1][1:]  # Remove leading dot
-
-                # Get base name by removing the frame number and extension
-                full_match = match.group(0)
-                base_name = file[:file.index(full_match)] + file[file.index(full_match):].replace(match.group(1),
-                                                                                                  '%04d')
-                break
-
-        if frame_num is not None and base_name is not None:
-            # Create plate key using the folder path and base name
-            # This helps group frames that belong to the same sequence
-            plate_key = (root, base_name, version)
-            seq_path = os.path.join(root, f"{base_name}.{ext_match}")
-
-            # Clean up display name
-            display_name = os.path.basename(base_name.rstrip('._-'))
-
-            if plate_key not in plates:
-                plates[plate_key] = {
-                    'min_frame': frame_num,
-                    'max_frame': frame_num,
-                    'ext': ext_match,
-                    'path': seq_path,
-                    'display_name': display_name,
-                    'frames': {frame_num},
-                    'first_frame_path': file_path
-                }
+        start = time.monotonic()
+        plates = index.search_plates(text, root=self.project_root)
+        elapsed = (time.monotonic() - start) * 1000
+
+        # Results come ranked, keep their order
+        for plate in plates:
+            try:
+                self._add_plate(plate)
+            except Exception as e:
+                print(f"Error adding plate {plate['path']}: {str(e)}")
+
+        if self.status_bar:
+            self.status_bar.setValue(100)
+            self.status_bar.setFormat(
+                f"{len(plates)} project results for '{text}' ({elapsed:.0f} ms)")
+
+    def cancel_scan(self):
+        """Cancel the running scan and drop any rows it has not added yet"""
+        if self.scan_thread:
+            self.scan_thread.cancel()
+            self.scan_thread.progress.disconnect(self._on_scan_progress)
+            self.scan_thread.plates_found.disconnect(self._on_plates_found)
+            self.scan_thread.scan_complete.disconnect(self._on_scan_complete)
+
+            # Keep a reference until the thread has actually stopped
+            if self.scan_thread.isRunning():
+                self._old_scan_threads.append(self.scan_thread)
+            self.scan_thread = None
+
+        self._old_scan_threads = [t for t in self._old_scan_threads if t.isRunning()]
+        self._pending_plates.clear()
+        self._deferred_listings = []
+        self._add_timer.stop()
+        self._scan_done = True
+        self._cache_baseline = None
+        self.metadata_thread.clear()
+        self._metadata_requested.clear()
+        self._nuke_metadata.clear()
+        self._nuke_timer.stop()
+        self._viewport_timer.stop()
+
+    def stop_threads(self):
+        """Stop all background work, used when the tool closes"""
+        self.cancel_scan()
+        for thread in self._old_scan_threads:
+            thread.wait()
+        self._old_scan_threads = []
+        self.metadata_thread.stop()
+        self.metadata_thread.wait()
+
+    def _on_scan_progress(self, progress, current_dir):
+        """Show scan progress in the status bar"""
+        if self.status_bar:
+            self.status_bar.setFormat(f"Scanning: {current_dir}")
+            self.status_bar.setValue(progress)
+
+    def _on_plates_found(self, plates):
+        """Queue a batch of plates coming from the scan thread"""
+        self._pending_plates.extend(plates)
+        if not self._add_timer.isActive():
+            self._add_timer.start()
+
+    def _on_scan_complete(self):
+        """Handle the scan thread finishing its walk"""
+        self.scanned_dirs = {os.path.normpath(d) for d in self.scan_thread.directories}
+        self._scan_done = True
+        if not self._pending_plates:
+            self._finish_scan()
+
+    def _add_pending_plates(self):
+        """Add the next chunk of queued plates, keeping the UI responsive"""
+        for _ in range(min(PLATE_LIST_CHUNK_SIZE, len(self._pending_plates))):
+            plate = self._pending_plates.popleft()
+            try:
+                self._add_plate(plate)
+                self._plate_count += 1
+            except Exception as e:
+                print(f"Error adding plate {plate['path']}: {str(e)}")
+
+        if not self._pending_plates:
+            self._add_timer.stop()
+            if self._scan_done:
+                self._finish_scan()
+
+    def _finish_scan(self):
+        """Finalize the list once every scanned plate has been added"""
+        if self.status_bar:
+            self.status_bar.setFormat("Ready")
+            self.status_bar.setValue(100)
+        # Changes in directories the walk had already passed
+        if self._deferred_listings:
+            listings, self._deferred_listings = self._deferred_listings, []
+            self.refresh_listings(listings)
+        # Name search index built once per scan, not on the first keystroke
+        self.filter_index().build_search_index()
+        self.apply_filters()
+        print(f"Scan complete. Found {self._plate_count} plates.")
+        self.scan_finished.emit()
+
+    def _add_plate(self, plate):
+        """Add the row of a single plate record"""
+        self.plate_model.add_plate(plate)
+        if self.normalize_path(plate['first_frame_path']) in self.wrong_plates:
+            self.plate_model.highlighted.add(plate['path'])
+        plate_dir = os.path.normpath(os.path.dirname(plate['path']))
+        self._dir_plates.setdefault(plate_dir, set()).add(plate['path'])
+
+        # Resolution and colorspace are filled in when the metadata arrives
+        if METADATA_LAZY:
+            self._schedule_visible_metadata()
+        else:
+            self._metadata_requested.add(plate['path'])
+            self.metadata_thread.request([(plate['path'], plate['first_frame_path'])])
+
+    def _schedule_visible_metadata(self, *args):
+        """Coalesce scroll, resize and insert events into one viewport update"""
+        if METADATA_LAZY and not self._viewport_timer.isActive():
+            self._viewport_timer.start()
+
+    def _visible_plate_rows(self):
+        """Store rows in the viewport plus a look-ahead below it, filtered rows skipped"""
+        top = self.indexAt(QPoint(0, 0))
+        if not top.isValid():
+            return []
+        # Rows have one height, the viewport holds height / row height of them
+        row_height = max(1, self.rowHeight(top))
+        count = self.viewport().height() // row_height + 1 + METADATA_LOOKAHEAD
+        last = min(top.row() + count, self.plate_model.rowCount())
+        return [self.plate_model.store_row(view_row) for view_row in range(top.row(), last)]
+
+    def neighbour_thumbnail_paths(self, row, count):
+        """
+        Thumbnail paths of the rows around a store row, filtered rows skipped
+
+        Returns:
+            list: Nearest first, alternating below and above
+        """
+        view_row = self.plate_model.view_row(row)
+        if view_row < 0:
+            return []
+        paths = []
+        for offset in range(1, count + 1):
+            for neighbour in (view_row + offset, view_row - offset):
+                if 0 <= neighbour < self.plate_model.rowCount():
+                    path = self.store.first_frame_paths[self.plate_model.store_row(neighbour)]
+                    if path:
+                        paths.append(path)
+        return paths
+
+    def sequence_frames(self, row):
+        """
+        Frame range of a sequence row
+
+        Returns:
+            tuple: (first frame path, first frame, last frame), or None for
+                single frames and movies
+        """
+        if row is None or not self.store.is_sequence[row]:
+            return None
+        return (self.store.first_frame_paths[row], self.store.first_frames[row],
+                self.store.last_frames[row])
+
+    def _request_visible_metadata(self):
+        """Request metadata for the rows in view, dropping requests scrolled away"""
+        wanted = []
+        for row in self._visible_plate_rows():
+            if not self.store.has_metadata(row):
+                wanted.append((self.store.paths[row], self.store.first_frame_paths[row]))
+
+        self._metadata_requested = {plate_path for plate_path, _ in wanted}
+        self.metadata_thread.replace(wanted)
+
+    def _on_metadata_ready(self, infos):
+        """Fill resolution and colorspace of rows whose headers have been read"""
+        for info in infos:
+            row = self.store.row(info.file_path)
+            if row is None:
+                continue
+            if info.header_read or info.from_cache:
+                self.plate_model.set_metadata(row, info.resolution, info.colorspace)
             else:
-                current_plate = plates[plate_key]
-                current_plate['min_frame'] = min(current_plate['min_frame'], frame_num)
-                current_plate['max_frame'] = max(current_plate['max_frame'], frame_num)
-                current_plate['frames'].add(frame_num)
+                self._nuke_metadata.append(info)
 
-                # Update first frame path if this is the earliest frame
-                if frame_num < min(current_plate['frames']):
-                    current_plate['first_frame_path'] = file_path
+        if self._nuke_metadata and not self._nuke_timer.isActive():
+            self._nuke_timer.start()
 
-        else:
-            # Handle as single frame if no frame number pattern is found
-            self._handle_single_frame(file_path, os.path.splitext(file)[0], version)
-
-    def _handle_single_frame(self, file_path, display_name, version):
-        """Handle single frame file"""
-        plate_info = PlateInfo(file_path)
-        plate_info.analyze_metadata(self.current_first, self.current_last)
-
-        item = QTreeWidgetItem(self)
-        item.setText(0, display_name)
-        item.setText(1, version)
-        item.setText(2, "Single Frame")
-        item.setText(3, plate_info.resolution if plate_info.resolution else "N/A")
-        item.setText(4, os.path.splitext(file_path)[1])
-        item.setText(5, plate_info.colorspace if plate_info.colorspace else "N/A")
-        item.setText(6, get_sequence_size(file_path))
-        item.setText(7, file_path)
-
-        # UserRole'e tam dosya yolunu kaydediyoruz
-        actual_path = file_path.replace('%04d', '0001') if '%04d' in file_path else file_path
-        item.setData(0, Qt.UserRole, actual_path)
-
-    def _add_sequences_to_list(self, plates, status_bar=None):
-        """Add sequences to the plate list"""
-        total_items = len(plates)
-
-        for idx, ((root, base_name, version), info) in enumerate(plates.items()):
-            try:
-                frames = sorted(list(info['frames']))
-
-                # If we have multiple frames, treat it as a sequence
-                # regardless of frame numbering
-                if len(frames) > 1:
-                    plate_info = PlateInfo(info['path'])
-                    plate_info.analyze_metadata(self.current_first, self.current_last)
-
-                    item = QTreeWidgetItem(self)
-                    item.setText(0, info['display_name'])
-                    item.setText(1, version)
-                    item.setText(2, f"{info['min_frame']}-{info['max_frame']}")
-                    item.setText(3, plate_info.resolution if plate_info.resolution else "N/A")
-                    item.setText(4, f".{info['ext']}")
-                    item.setText(5, plate_info.colorspace if plate_info.colorspace else "N/A")
-                    item.setText(6, get_sequence_size(
-                        info['path'],
-                        base_name,
-                        f"{info['min_frame']}-{info['max_frame']}",
-                        f".{info['ext']}"
-                    ))
-                    item.setText(7, info['path'])
-
-                    # Thumbnail için ilk frame'in yolunu kullan
-                    item.setData(0, Qt.UserRole, info.get('first_frame_path', info['path']))
-                else:
-                    # Single frame case
-                    single_path = os.path.join(root, f"{base_name}.{info['ext']}")
-                    if os.path.exists(single_path):
-                        self._handle_single_frame(single_path, info['display_name'], version)
+    def _on_metadata_idle(self):
+        """Report how well the metadata cache did for a scan, once its queue has drained"""
+        cache = get_metadata_cache()
+        if cache is None:
+            return
+        cache.flush()
+        if self._cache_baseline is None or not self._scan_done or self._pending_plates:
+            return
 
-                if status_bar:
-                    progress = int((idx + 1) / total_items * 100)
-                    status_bar.setValue(progress)
+        hits = cache.hits - self._cache_baseline[0]
+        lookups = hits + cache.misses - self._cache_baseline[1]
+        self._cache_baseline = None
+        if lookups and self.status_bar:
+            self.status_bar.setFormat(f"Ready - metadata cache hit rate {hits / lookups:.0%}")
 
-            except Exception as e:
-                print(f"Error adding sequence {info['path']}: {str(e)}")
+    def _analyze_next_with_nuke(self):
+        """Read Node fallback for formats without a header reader, one per event loop pass"""
+        if not self._nuke_metadata:
+            self._nuke_timer.stop()
+            return
+
+        info = self._nuke_metadata.popleft()
+        row = self.store.row(info.file_path)
+        if row is None or info.file_path not in self._metadata_requested:
+            # Removed or scrolled away, asked for again when it comes back into view
+            return
+        if os.path.exists(info.sample_path):
+            info.analyze_with_nuke(self.current_first, self.current_last)
+        self.plate_model.set_metadata(row, info.resolution, info.colorspace)
+
+    def _analyzed_colorspace(self, row):
+        """Colorspace read from the plate, None while unread or unknown"""
+        colorspace = self.store.text(row, COL_COLORSPACE)
+        return colorspace if colorspace and colorspace != "N/A" else None
+
+    def _remove_plates(self, plate_paths):
+        """Remove the rows of plates that no longer exist"""
+        for plate_path in plate_paths:
+            self.plate_model.highlighted.discard(plate_path)
+        self.plate_model.remove_plates(plate_paths)
+
+    def refresh_listings(self, listings):
+        """
+        Patch the list with directories listed again by the folder watcher
+
+        Args:
+            listings (list): Changed listings in walk order, a removed
+                directory has 'subdirs' None
+
+        Returns:
+            list: Newly discovered directories inside the scanned folder
+        """
+        if not self.scan_folder:
+            return []
+        if not self._scan_done or self._pending_plates:
+            # The walk may have passed these directories already, applied
+            # once the scan has finished
+            self._deferred_listings.extend(listings)
+            return []
+
+        scan_root = os.path.normpath(self.scan_folder)
+        new_dirs = []
+
+        for listing in listings:
+            path = os.path.normpath(listing['path'])
+            if path != scan_root and not path.startswith(scan_root + os.sep):
+                continue
+
+            if listing['subdirs'] is None:
+                # Directory removed, drop its rows and everything below it
+                for plate_dir in [d for d in self._dir_plates
+                                  if d == path or d.startswith(path + os.sep)]:
+                    self._remove_plates(self._dir_plates.pop(plate_dir))
+                self.scanned_dirs = {d for d in self.scanned_dirs
+                                     if d != path and not d.startswith(path + os.sep)}
+                continue
+
+            plates = {plate['path']: plate for plate in listing['plates']}
+            self._remove_plates(self._dir_plates.get(path, set()) - set(plates))
+
+            for plate_path, plate in plates.items():
+                try:
+                    # Updates the row in place when the plate is already listed
+                    self._add_plate(plate)
+                except Exception as e:
+                    print(f"Error updating plate {plate_path}: {str(e)}")
+            self._dir_plates[path] = set(plates)
+
+            # Directories that appeared inside the folder
+            if path not in self.scanned_dirs:
+                self.scanned_dirs.add(path)
+                new_dirs.append(path)
+
+        self.apply_filters()
+        return new_dirs
 
     def show_context_menu(self, position):
-        """Show enhanced context menu for plate list items"""
-        items = self.selectedItems()
-        if not items:
+        """Show enhanced context menu for the selected plates"""
+        rows = self.selected_rows()
+        if not rows:
             return
 
         menu = QMenu()
@@ -350,9 +660,9 @@ class PlateList(QTreeWidget):
         wrong_plate_action = menu.addAction("Toggle Wrong Plate")
         wrong_plate_action.setCheckable(True)
 
-        # Get the first selected item's path
-        first_item_path = items[0].data(0, Qt.UserRole)
-        wrong_plate_action.setChecked(first_item_path in self.wrong_plates)
+        # Get the first selected plate's path
+        first_plate_path = self.normalize_path(self.store.first_frame_paths[rows[0]])
+        wrong_plate_action.setChecked(first_plate_path in self.wrong_plates)
 
         show_metadata_action = menu.addAction("Show Metadata")
 
@@ -360,65 +670,74 @@ class PlateList(QTreeWidget):
         import_normal.triggered.connect(
             lambda checked=False: self.import_selected_plates())
         reveal_action.triggered.connect(
-            lambda checked=False: self.reveal_in_explorer(items[0]))
+            lambda checked=False: self.reveal_in_explorer(rows[0]))
         open_action.triggered.connect(
-            lambda checked=False: self.open_file(items[0]))
+            lambda checked=False: self.open_file(rows[0]))
         copy_path_action.triggered.connect(
-            lambda checked=False: self.copy_path(items[0]))
+            lambda checked=False: self.copy_path(rows[0]))
         wrong_plate_action.triggered.connect(
-            lambda checked=False: self.toggle_wrong_plate(items[0]))
+            lambda checked=False: self.toggle_wrong_plate(rows[0]))
         show_metadata_action.triggered.connect(
-            lambda checked=False: self.show_metadata(items[0]))
+            lambda checked=False: self.show_metadata(rows[0]))
 
         menu.exec_(self.viewport().mapToGlobal(position))
 
-    def copy_path(self, item):
+    def copy_path(self, row):
         """Copy file path to clipboard"""
-        if not item:
+        if row is None:
             return
 
-        file_path = item.data(0, Qt.UserRole)
+        file_path = self.store.first_frame_paths[row]
         QApplication.clipboard().setText(file_path)
 
-    def toggle_wrong_plate(self, item):
+    def toggle_wrong_plate(self, row):
         """Toggle wrong plate status"""
-        if not item:
+        if row is None:
             return
 
-        file_path = self.normalize_path(item.data(0, Qt.UserRole))
+        file_path = self.normalize_path(self.store.first_frame_paths[row])
+        plate_path = self.store.paths[row]
 
         if file_path in self.wrong_plates:
             self.wrong_plates.remove(file_path)
-            for col in range(item.columnCount()):
-                item.setBackground(col, Qt.transparent)
+            self.plate_model.highlighted.discard(plate_path)
         else:
             self.wrong_plates.add(file_path)
-            for col in range(item.columnCount()):
-                item.setBackground(col, QColor(150, 0, 40))
+            self.plate_model.highlighted.add(plate_path)
+        self.plate_model.row_changed(row)
 
         self.save_wrong_plates()
-        self.save_wrong_plates()
 
-    def show_metadata(self, item):
+    def show_metadata(self, row):
         """Show metadata dialog"""
-        if not item:
+        if row is None:
             return
 
-        file_path = item.data(0, Qt.UserRole)
+        file_path = self.store.first_frame_paths[row]
 
         try:
             # Get basic metadata
             metadata = {
                 "File Name": os.path.basename(file_path),
                 "Path": file_path,
-                "Size": item.text(6),
-                "Resolution": item.text(3),
-                "Format": item.text(4),
-                "Colorspace": item.text(5),
-                "Frame Range": item.text(2),
-                "Version": item.text(1)
+                "Size": self.store.text(row, COL_SIZE),
+                "Resolution": self.store.text(row, COL_RESOLUTION, METADATA_PLACEHOLDER),
+                "Format": self.store.text(row, COL_FORMAT),
+                "Colorspace": self.store.text(row, COL_COLORSPACE, METADATA_PLACEHOLDER),
+                "Frame Range": self.store.text(row, COL_FRAME_RANGE),
+                "Version": self.store.text(row, COL_VERSION)
             }
 
+            # Header metadata, read without creating any node
+            plate_info = PlateInfo(file_path)
+            if plate_info.load_cached() and plate_info.header_read or plate_info.read_header():
+                metadata.update({
+                    "Channels": ", ".join(plate_info.channels),
+                    "Compression": plate_info.compression,
+                    "Pixel Aspect": plate_info.pixel_aspect,
+                    "Data Window": list(plate_info.data_window)
+                })
+
             # Get additional metadata from Nuke if possible
             try:
                 temp_node = nuke.createNode('Read', inpanel=False)
@@ -460,17 +779,17 @@ class PlateList(QTreeWidget):
 
     def apply_wrong_plates_highlight(self):
         """Apply highlighting to wrong plates"""
-        for i in range(self.topLevelItemCount()):
-            item = self.topLevelItem(i)
-            file_path = self.normalize_path(item.data(0, Qt.UserRole))
-            if file_path in self.wrong_plates:
-                for col in range(item.columnCount()):
-                    item.setBackground(col, QColor(150, 0, 40))
+        store = self.store
+        self.plate_model.highlighted.update(
+            path for path, file_path in zip(store.paths, store.first_frame_paths)
+            if self.normalize_path(file_path) in self.wrong_plates
+        )
+        self.viewport().update()
 
     def import_selected_plates(self):
         """Import selected plates with organized layout and backdrops"""
-        items = self.selectedItems()
-        if not items:
+        rows = self.selected_rows()
+        if not rows:
             return
 
         # Improved grid layout settings
@@ -482,11 +801,11 @@ class PlateList(QTreeWidget):
         base_y = 0
         created_nodes = []
 
-        for idx, item in enumerate(items):
+        for idx, plate_row in enumerate(rows):
             try:
-                file_path = item.data(0, Qt.UserRole)
+                file_path = self.store.first_frame_paths[plate_row]
                 folder_path = os.path.dirname(file_path)
-                file_ext = item.text(4).lower()
+                file_ext = self.store.text(plate_row, COL_FORMAT).lower()
 
                 # Calculate grid position with better spacing
                 col = idx % columns
@@ -495,7 +814,7 @@ class PlateList(QTreeWidget):
                 pos_y = base_y - (row * spacing_y)
 
                 # Get clean plate name (without extension and pattern)
-                plate_name = os.path.splitext(item.text(0))[0]  # Remove extension
+                plate_name = os.path.splitext(self.store.names[plate_row])[0]  # Remove extension
                 # Remove common pattern indicators
                 plate_name = plate_name.replace('####', '').replace('%04d', '')
                 plate_name = plate_name.rstrip('._- ')  # Remove trailing separators
@@ -513,8 +832,8 @@ class PlateList(QTreeWidget):
                 else:
                     # Handle normal read nodes
                     read_node = create_read_node(file_path,
-                                                 frame_range=item.text(2),
-                                                 colorspace=item.text(5),
+                                                 frame_range=self.store.text(plate_row, COL_FRAME_RANGE),
+                                                 colorspace=self._analyzed_colorspace(plate_row),
                                                  pos_x=pos_x,
                                                  pos_y=pos_y)
                     if read_node:
@@ -544,7 +863,7 @@ class PlateList(QTreeWidget):
                     created_nodes.append(backdrop)
 
             except Exception as e:
-                print(f"Error importing plate {item.text(0)}: {str(e)}")
+                print(f"Error importing plate {self.store.names[plate_row]}: {str(e)}")
 
         # Select all created nodes for zooming
         for node in created_nodes:
@@ -575,12 +894,12 @@ class PlateList(QTreeWidget):
         except Exception as e:
             print(f"Error saving wrong plates: {str(e)}")
 
-    def open_file(self, item):
+    def open_file(self, row):
         """Open file with default application"""
-        if not item:
+        if row is None:
             return
 
-        file_path = item.data(0, Qt.UserRole)
+        file_path = self.store.first_frame_paths[row]
         if not os.path.exists(file_path):
             return
 
@@ -594,6 +913,13 @@ class PlateList(QTreeWidget):
         except Exception as e:
             print(f"Error opening file: {str(e)}")
 
+    def filter_index(self):
+        """Filter keys of the current rows, rebuilt once after the rows change"""
+        index = self._filter_index
+        if index is None or index.store is not self.store or index.is_stale():
+            self._filter_index = PlateFilterIndex(self.store)
+        return self._filter_index
+
     def apply_filters(self):
         """Apply filters to the plate list"""
         if not hasattr(self, 'parent'):
@@ -605,45 +931,32 @@ class PlateList(QTreeWidget):
             return
 
         filters = filter_panel.get_filter_values()
-        search_text = filters['search']
-        format_filter = filters['format']
-        version_filter = filters['version']
-        sequence_only = filters['sequence_only']
-
-        for i in range(self.topLevelItemCount()):
-            item = self.topLevelItem(i)
-            show_item = True
-
-            # Apply search filter
-            if search_text and search_text not in item.text(0).lower():
-                show_item = False
-
-            # Apply format filter
-            if format_filter != 'All Formats' and not item.text(4).endswith(format_filter):
-                show_item = False
-
-            # Apply version filter
-            if version_filter != 'All Versions':
-                if version_filter == 'Latest Version':
-                    base_name = item.text(0)
-                    versions = []
-                    for j in range(self.topLevelItemCount()):
-                        other_item = self.topLevelItem(j)
-                        if other_item.text(0) == base_name:
-                            versions.append(other_item.text(1))
-                    if item.text(1) != max(versions):
-                        show_item = False
-                elif item.text(1) != version_filter:
-                    show_item = False
-
-            # Apply sequence filter
-            if sequence_only and item.text(2) == "Single Frame":
-                show_item = False
-
-            item.setHidden(not show_item)
-
-    def reveal_in_explorer(self, item):
+        if filters['project_search']:
+            if filters['search'] != self._project_query:
+                self.show_project_results(filters['search'])
+        elif self._project_query is not None:
+            # Project search switched off, list the folder again
+            self.scan_plates(self._folder_before_search, self.status_bar)
+            return
+
+        visible = self.filter_index().match(
+            search=filters['search'],
+            format_filter=filters['format'],
+            version_filter=filters['version'],
+            sequence_only=filters['sequence_only'],
+        )
+
+        # Relayout only when the shown rows change, new rows also go into sort order here
+        previous = self._visible_rows
+        if previous is None or previous[0] is not self._filter_index or previous[1] != visible:
+            self.plate_model.set_visible(visible)
+        self._visible_rows = (self._filter_index, visible)
+
+        # Filtering changes which rows are in view
+        self._schedule_visible_metadata()
+
+    def reveal_in_explorer(self, row):
         """Reveal file in explorer"""
-        if item:
-            path = os.path.dirname(item.data(0, Qt.UserRole))
+        if row is not None:
+            path = os.path.dirname(self.store.first_frame_paths[row])
             reveal_in_explorer(path)
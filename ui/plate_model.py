@@ -0,0 +1,165 @@
+# nuke_importer/ui/plate_model.py
+from bisect import bisect_left
+from itertools import compress
+from array import array
+from PySide2.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide2.QtGui import QColor
+from ..config.settings import PLATE_LIST_COLUMNS, METADATA_PLACEHOLDER
+from ..core.plate_store import PlateStore
+
+WRONG_PLATE_COLOR = QColor(150, 0, 40)
+# Plain ints, comparing against the Qt enum objects is slow in data()
+DISPLAY_ROLE = int(Qt.DisplayRole)
+BACKGROUND_ROLE = int(Qt.BackgroundRole)
+
+
+class PlateTableModel(QAbstractTableModel):
+    """
+    Table model over a PlateStore
+
+    Rows are never materialized as items, the view asks for the cells it
+    paints. Filtering and sorting only rebuild the array of store rows shown,
+    in view order.
+    """
+
+    def __init__(self, parent=None):
+        super(PlateTableModel, self).__init__(parent)
+        self.store = PlateStore()
+        # View row -> store row
+        self._order = array('l')
+        # Store row -> view row, rebuilt lazily after the order changes
+        self._positions = None
+        # Column -1 keeps store order, scan order or search rank
+        self._sort_column = -1
+        self._sort_order = Qt.AscendingOrder
+        # Plate paths painted as wrong plates
+        self.highlighted = set()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._order)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(PLATE_LIST_COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return PLATE_LIST_COLUMNS[section]
+        return None
+
+    def data(self, index, role=DISPLAY_ROLE):
+        # Called for every role of every painted cell, only two are answered
+        if role == DISPLAY_ROLE:
+            return self.store.text(self._order[index.row()], index.column(), METADATA_PLACEHOLDER)
+        if role == BACKGROUND_ROLE and self.highlighted \
+                and self.store.paths[self._order[index.row()]] in self.highlighted:
+            return WRONG_PLATE_COLOR
+        return None
+
+    def store_row(self, view_row):
+        """Store row shown at a view row"""
+        return self._order[view_row]
+
+    def view_row(self, row):
+        """View row of a store row, -1 if it is filtered out"""
+        if self._positions is None:
+            self._positions = array('l', [-1]) * len(self.store)
+            for view_row, store_row in enumerate(self._order):
+                self._positions[store_row] = view_row
+        return self._positions[row] if row < len(self._positions) else -1
+
+    def clear(self):
+        """Drop every row, the view keeps its model and selection model"""
+        self.beginResetModel()
+        self.store = PlateStore()
+        self._order = array('l')
+        self._positions = None
+        self.highlighted = set()
+        self.endResetModel()
+
+    def add_plate(self, plate):
+        """
+        Add or update a plate record from the scanner
+
+        New rows go to the bottom, they are put in sort order with the next
+        filter pass.
+
+        Returns:
+            int: Store row of the plate
+        """
+        row = self.store.row(plate['path'])
+        if row is not None:
+            self.store.update(row, plate)
+            self.row_changed(row)
+            return row
+
+        view_row = len(self._order)
+        self.beginInsertRows(QModelIndex(), view_row, view_row)
+        row = self.store.append(plate)
+        self._order.append(row)
+        if self._positions is not None:
+            self._positions.append(view_row)
+        self.endInsertRows()
+        return row
+
+    def remove_plates(self, plate_paths):
+        """Remove plates, the store rows after them move up"""
+        rows = [self.store.row(path) for path in plate_paths]
+        rows = sorted(row for row in rows if row is not None)
+        if not rows:
+            return
+
+        def remove():
+            removed = set(rows)
+            for row in reversed(rows):
+                self.store.remove(self.store.paths[row])
+            # Store rows move up by the number of removed rows before them
+            return array('l', (row - bisect_left(rows, row) for row in self._order
+                               if row not in removed))
+
+        self._change_layout(remove)
+
+    def set_metadata(self, row, resolution, colorspace):
+        """Fill resolution and colorspace of a store row"""
+        self.store.set_metadata(row, resolution, colorspace)
+        self.row_changed(row)
+
+    def row_changed(self, row):
+        """Repaint a store row if it is shown"""
+        view_row = self.view_row(row)
+        if view_row >= 0:
+            self.dataChanged.emit(self.index(view_row, 0),
+                                  self.index(view_row, self.columnCount() - 1))
+
+    def set_visible(self, visible):
+        """Show the store rows flagged in a filter result, in sort order"""
+        self._change_layout(lambda: self._sorted(array('l', compress(range(len(visible)), visible))))
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort on the store's numeric or ranked keys, column -1 restores store order"""
+        self._sort_column = column
+        self._sort_order = order
+        self._change_layout(lambda: self._sorted(self._order))
+
+    def _sorted(self, rows):
+        if self._sort_column < 0:
+            return array('l', sorted(rows))
+        keys = self.store.sort_keys(self._sort_column)
+        return array('l', sorted(rows, key=keys.__getitem__,
+                                 reverse=self._sort_order == Qt.DescendingOrder))
+
+    def _change_layout(self, update):
+        """Replace the view order with update(), keeping selection and current row on their plates"""
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        paths = [self.store.paths[self._order[index.row()]] for index in persistent]
+
+        self._order = update()
+        self._positions = None
+
+        moved = []
+        for path, index in zip(paths, persistent):
+            row = self.store.row(path)
+            view_row = -1 if row is None else self.view_row(row)
+            moved.append(self.index(view_row, index.column()) if view_row >= 0 else QModelIndex())
+        self.changePersistentIndexList(persistent, moved)
+        self.layoutChanged.emit()
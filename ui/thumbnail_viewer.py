@@ -1,11 +1,363 @@
 from PySide2.QtWidgets import QLabel, QWidget, QVBoxLayout, QTreeWidget
-from PySide2.QtCore import Qt
+from PySide2.QtCore import Qt, QObject, QRunnable, QThread, QThreadPool, QTimer, Signal
 from PySide2.QtGui import QPixmap, QImage
 import os
-import nuke
+import time
+import threading
+from collections import OrderedDict
 import open3d as o3d
 import numpy as np
 import cv2
+from ..config.settings import (THUMBNAIL_SIZE, THUMBNAIL_EXR_DIRECT, THUMBNAIL_WORKERS,
+                               THUMBNAIL_LOADING_DELAY, THUMBNAIL_MEMORY_BYTES,
+                               THUMBNAIL_PREFETCH_WORKERS, THUMBNAIL_VIDEO_POSITION,
+                               THUMBNAIL_SCRUB_ENABLED, THUMBNAIL_SCRUB_SIZE,
+                               THUMBNAIL_SCRUB_MEMORY_BYTES)
+from ..core.exr_thumbnail import read_exr_thumbnail
+from ..core.scrub_buffer import ScrubBuffer, coarse_to_fine, COARSE_FRAMES
+from ..core.thumbnail_cache import get_thumbnail_cache
+from ..utils.frame_pattern_utils import tokenize_filename
+
+try:
+    import nuke
+except ImportError:
+    # EXR thumbnails are decoded directly without a Nuke session
+    nuke = None
+
+
+# Thumbnail kinds decoded on the pool
+THUMBNAIL_IMAGE = 'image'
+THUMBNAIL_VIDEO = 'video'
+THUMBNAIL_EXR = 'exr'
+
+# Result status besides a plain image
+THUMBNAIL_OK = 'ok'
+THUMBNAIL_NEEDS_NUKE = 'nuke'
+THUMBNAIL_VIDEO_ERROR = 'video_error'
+
+# Seconds a prefetch waits between checks for a running foreground decode
+PREFETCH_POLL_INTERVAL = 0.02
+
+
+class ThumbnailSignals(QObject):
+    # generation, file path, image (null on failure), status
+    ready = Signal(int, str, QImage, str)
+    # file path, image
+    prefetched = Signal(str, QImage)
+
+
+class ThumbnailTask(QRunnable):
+    """
+    Decode one thumbnail off the UI thread
+
+    Works on QImage only, QPixmap may not be used outside the UI thread.
+    The result goes through the thumbnail cache on the way out.
+    """
+
+    def __init__(self, generation, file_path, kind, signals, is_current):
+        super(ThumbnailTask, self).__init__()
+        self.generation = generation
+        self.file_path = file_path
+        self.kind = kind
+        self.signals = signals
+        self.is_current = is_current
+
+    def run(self):
+        if not self.is_current(self.generation):
+            # Selection moved on while this was queued
+            return
+        image, status = self.load()
+        if self.is_current(self.generation):
+            self.signals.ready.emit(self.generation, self.file_path, image, status)
+
+    def load(self):
+        """
+        Returns:
+            tuple: (QImage, status), the image is null unless status is ok
+        """
+        width, height = THUMBNAIL_SIZE
+        cache = get_thumbnail_cache()
+        if cache is not None:
+            cached_path = cache.get(self.file_path, width, height)
+            if cached_path:
+                image = QImage(cached_path)
+                if not image.isNull():
+                    return image, THUMBNAIL_OK
+
+        try:
+            if self.kind == THUMBNAIL_VIDEO:
+                image = self.load_video()
+            elif self.kind == THUMBNAIL_EXR:
+                image = self.load_exr()
+                if image is None:
+                    return QImage(), THUMBNAIL_NEEDS_NUKE
+            else:
+                image = QImage(self.file_path)
+        except Exception as e:
+            print(f"Error loading {self.kind} thumbnail: {str(e)}")
+            status = THUMBNAIL_VIDEO_ERROR if self.kind == THUMBNAIL_VIDEO else THUMBNAIL_OK
+            return QImage(), status
+
+        if image.isNull():
+            return image, THUMBNAIL_OK
+
+        if image.width() > width or image.height() > height:
+            image = image.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        if cache is not None:
+            cache.put(self.file_path, width, height,
+                      lambda temp_path: image.save(temp_path, 'JPG', 85))
+        return image, THUMBNAIL_OK
+
+    def load_video(self):
+        """Representative frame of a video using OpenCV, downscaled before conversion"""
+        # Open video file
+        cap = cv2.VideoCapture(self.file_path)
+        try:
+            if not cap.isOpened():
+                raise Exception("Could not open video file")
+
+            # Skip slates and fades, the decoder starts at the keyframe before it
+            frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            target = int(frame_count * THUMBNAIL_VIDEO_POSITION)
+            ret, frame = False, None
+            if target > 0 and cap.set(cv2.CAP_PROP_POS_FRAMES, target):
+                ret, frame = cap.read()
+            if not ret:
+                # Unseekable stream or bad frame count, fall back to the first frame
+                cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                ret, frame = cap.read()
+            if not ret:
+                raise Exception("Could not read video frame")
+        finally:
+            # Release video capture
+            cap.release()
+
+        # Shrink first, colour conversion then only touches thumbnail pixels
+        height, width = frame.shape[:2]
+        scale = min(THUMBNAIL_SIZE[0] / width, THUMBNAIL_SIZE[1] / height, 1.0)
+        if scale < 1.0:
+            size = (max(1, int(round(width * scale))), max(1, int(round(height * scale))))
+            frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+
+        # Convert frame from BGR to RGB
+        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+        # Get frame dimensions
+        height, width, channel = frame_rgb.shape
+        bytes_per_line = 3 * width
+
+        # Create QImage from frame, copied before the numpy buffer goes away
+        return QImage(frame_rgb.data, width, height,
+                      bytes_per_line, QImage.Format_RGB888).copy()
+
+    def load_exr(self):
+        """EXR decoded with OpenEXR, None if Nuke has to render it"""
+        if not THUMBNAIL_EXR_DIRECT:
+            return None
+        image = read_exr_thumbnail(self.file_path, *THUMBNAIL_SIZE)
+        if image is None:
+            return None
+        height, width = image.shape[:2]
+        # Copy, the QImage must not outlive the numpy buffer
+        return QImage(image.data, width, height, 3 * width, QImage.Format_RGB888).copy()
+
+
+class PrefetchTask(ThumbnailTask):
+    """
+    Warm the thumbnail of a neighbouring row
+
+    Runs on its own low priority pool and waits while a foreground decode is
+    running, so the selected plate never queues behind a prefetch.
+    """
+
+    def __init__(self, generation, file_path, kind, signals, is_current, foreground_pool):
+        super(PrefetchTask, self).__init__(generation, file_path, kind, signals, is_current)
+        self.foreground_pool = foreground_pool
+
+    def run(self):
+        QThread.currentThread().setPriority(QThread.LowestPriority)
+        while self.foreground_pool.activeThreadCount() and self.is_current(self.generation):
+            time.sleep(PREFETCH_POLL_INTERVAL)
+        if not self.is_current(self.generation):
+            return
+
+        image, status = self.load()
+        if status == THUMBNAIL_OK and not image.isNull() and self.is_current(self.generation):
+            self.signals.prefetched.emit(self.file_path, image)
+
+
+class ThumbnailMemoryCache:
+    """Decoded thumbnails kept in memory up to a byte budget, least recently used go first"""
+
+    def __init__(self, max_bytes=THUMBNAIL_MEMORY_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        # file path -> (source mtime, QImage)
+        self._images = OrderedDict()
+
+    def __contains__(self, file_path):
+        return file_path in self._images
+
+    def get(self, file_path):
+        """QImage of a file, None if missing or the file changed since"""
+        entry = self._images.get(file_path)
+        if entry is None:
+            return None
+        try:
+            if os.path.getmtime(file_path) != entry[0]:
+                self._remove(file_path)
+                return None
+        except OSError:
+            return None
+        self._images.move_to_end(file_path)
+        return entry[1]
+
+    def put(self, file_path, image):
+        try:
+            mtime = os.path.getmtime(file_path)
+        except OSError:
+            return
+        if file_path in self._images:
+            self._remove(file_path)
+        self._images[file_path] = (mtime, image)
+        self.total_bytes += image.sizeInBytes()
+        while self.total_bytes > self.max_bytes and len(self._images) > 1:
+            self._remove(next(iter(self._images)))
+
+    def _remove(self, file_path):
+        _, image = self._images.pop(file_path)
+        self.total_bytes -= image.sizeInBytes()
+
+
+class ScrubJob:
+    """Frames of one sequence to decode for scrubbing, and where they go"""
+
+    def __init__(self, first_frame_path, kind, first, last):
+        self.directory = os.path.dirname(first_frame_path)
+        self.token = tokenize_filename(os.path.basename(first_frame_path))
+        self.kind = kind
+        self.first = first
+        self.last = last
+        width, height = THUMBNAIL_SCRUB_SIZE
+        self.buffer = ScrubBuffer(THUMBNAIL_SCRUB_MEMORY_BYTES, width * height * 4)
+        self.order = coarse_to_fine(first, last)
+        # Missing or unreadable frames, never retried
+        self.failed = set()
+        self.coarse_done = False
+        self._refine_next = False
+
+    def frame_path(self, frame):
+        return os.path.join(self.directory, self.token.frame_name(frame))
+
+    def next_frame(self, focus):
+        """
+        Next frame to decode, None when there is nothing left for now
+
+        Coarse frames go first. Once the sequence is roughly covered, decodes
+        alternate between refining the whole range and the frames nearest the
+        scrub position.
+        """
+        self._refine_next = not self._refine_next
+        if focus is not None and self._refine_next and len(self.buffer) >= COARSE_FRAMES:
+            frame = self._nearest_missing(focus)
+            if frame is not None:
+                return frame, False
+
+        if not self.coarse_done and not self.buffer.pinned_full():
+            for frame in self.order:
+                if frame not in self.buffer and frame not in self.failed:
+                    return frame, True
+        self.coarse_done = True
+
+        if focus is not None:
+            frame = self._nearest_missing(focus)
+            if frame is not None:
+                return frame, False
+        return None
+
+    def _nearest_missing(self, focus):
+        """Closest undecoded frame to the scrub position within the ring's reach"""
+        # Every frame within reach fits the ring, refining never evicts its own work
+        radius = (self.buffer.capacity - self.buffer.pinned_capacity - 1) // 2
+        for offset in range(radius + 1):
+            for frame in (focus + offset, focus - offset):
+                if (self.first <= frame <= self.last and frame not in self.buffer
+                        and frame not in self.failed):
+                    return frame
+        return None
+
+
+class ScrubThread(QThread):
+    # generation, frame
+    frame_ready = Signal(int, int)
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = False
+        self._job = None
+        self._generation = 0
+        self._focus = None
+
+    def set_job(self, generation, job):
+        """Decode frames of a sequence, replacing the previous one"""
+        with self._lock:
+            self._generation = generation
+            self._job = job
+            self._focus = None
+        self._wake.set()
+
+    def focus(self, frame):
+        """Refine around the frame under the cursor, None when it left"""
+        with self._lock:
+            self._focus = frame
+        self._wake.set()
+
+    def clear(self):
+        with self._lock:
+            self._job = None
+            self._focus = None
+
+    def stop(self):
+        """Stop the thread after the running decode"""
+        self._stopped = True
+        self._wake.set()
+
+    def run(self):
+        self.setPriority(QThread.LowPriority)
+        while not self._stopped:
+            with self._lock:
+                job, generation, focus = self._job, self._generation, self._focus
+                step = job.next_frame(focus) if job is not None else None
+            if step is None:
+                self._wake.wait()
+                self._wake.clear()
+                continue
+
+            frame, pinned = step
+            image = decode_scrub_frame(job.frame_path(frame), job.kind)
+            if image is None or image.isNull():
+                job.failed.add(frame)
+                continue
+            if job is self._job and job.buffer.put(frame, image, pinned):
+                self.frame_ready.emit(generation, frame)
+
+
+def decode_scrub_frame(file_path, kind):
+    """Low resolution QImage of one sequence frame, None if it cannot be read"""
+    width, height = THUMBNAIL_SCRUB_SIZE
+    if kind == THUMBNAIL_EXR:
+        image = read_exr_thumbnail(file_path, width, height)
+        if image is None:
+            return None
+        rows, columns = image.shape[:2]
+        return QImage(image.data, columns, rows, 3 * columns, QImage.Format_RGB888).copy()
+
+    image = QImage(file_path)
+    if image.isNull():
+        return None
+    return image.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
 
 
 class ThumbnailViewer(QWidget):
@@ -18,13 +370,41 @@ class ThumbnailViewer(QWidget):
         self.supported_video_formats = ['.mov', '.mp4', '.mkv', '.avi']
         self.exr_file_ext = [".exr"]
 
+        # Decodes run on a private pool, results of older selections are dropped
+        self._generation = 0
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(THUMBNAIL_WORKERS)
+        self.signals = ThumbnailSignals(self)
+        self.signals.ready.connect(self._on_thumbnail_ready)
+
+        # Neighbouring rows are decoded ahead on a separate, smaller pool
+        self._prefetch_generation = 0
+        self.prefetch_pool = QThreadPool(self)
+        self.prefetch_pool.setMaxThreadCount(THUMBNAIL_PREFETCH_WORKERS)
+        self.signals.prefetched.connect(self._on_thumbnail_prefetched)
+        self.memory_cache = ThumbnailMemoryCache()
+        self.loading_timer = QTimer(self)
+        self.loading_timer.setSingleShot(True)
+        self.loading_timer.setInterval(THUMBNAIL_LOADING_DELAY)
+        self.loading_timer.timeout.connect(self._show_loading)
+
+        # Hover scrubbing through the selected sequence, decoded on first hover
+        self._scrub_job = None
+        self._scrub_started = False
+        self._scrub_frame = None
+        # Thumbnail of the selected plate, shown again when scrubbing stops
+        self._static_pixmap = None
+        self._thumbnail_pending = False
+        self.scrub_thread = ScrubThread()
+        self.scrub_thread.frame_ready.connect(self._on_scrub_frame_ready)
+
     def setup_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
         self.thumbnail_label = QLabel()
         self.thumbnail_label.setAlignment(Qt.AlignCenter)
-        self.thumbnail_label.setFixedSize(320, 180)
+        self.thumbnail_label.setFixedSize(*THUMBNAIL_SIZE)
         self.thumbnail_label.setMinimumHeight(200)
         self.thumbnail_label.setStyleSheet("""
             QLabel {
@@ -35,67 +415,120 @@ class ThumbnailViewer(QWidget):
         """)
         layout.addWidget(self.thumbnail_label)
         self.thumbnail_label.mousePressEvent = self.on_thumbnail_click
+        self.thumbnail_label.setMouseTracking(True)
+        self.thumbnail_label.enterEvent = self.on_thumbnail_enter
+        self.thumbnail_label.mouseMoveEvent = self.on_thumbnail_hover
+        self.thumbnail_label.leaveEvent = self.on_thumbnail_leave
 
     def set_thumbnail(self, file_path):
-        """Set thumbnail based on file type"""
+        """Set thumbnail based on file type, decoding in the background"""
+        # Anything still queued or running for the previous selection is stale
+        self._generation += 1
+        self.pool.clear()
+        self.loading_timer.stop()
+        self._reset_scrub()
+
         if not file_path or not os.path.exists(file_path):
             self.clear_thumbnail()
             return
 
         ext = os.path.splitext(file_path)[1].lower()
+        kind = self.thumbnail_kind(file_path)
 
         if ext in self.supported_3d_formats:
             self.set_thumbnail_3D(file_path)
-        elif ext in self.supported_image_formats:
-            self.set_image_thumbnail(file_path)
-        elif ext in self.supported_video_formats:
-            self.set_video_thumbnail(file_path)
-        elif ext in self.exr_file_ext:
-            self.set_thumbnail_exr(file_path)
-        else:
+        elif kind is None:
             self.clear_thumbnail()
+        else:
+            image = self.memory_cache.get(file_path)
+            if image is not None:
+                # Prefetched or seen before
+                self.current_3d_file = None
+                self._show_thumbnail(QPixmap.fromImage(image))
+            else:
+                self.request_thumbnail(file_path, kind)
 
-    def set_video_thumbnail(self, file_path):
-        """Set thumbnail for video files using OpenCV"""
-        try:
-            # Open video file
-            cap = cv2.VideoCapture(file_path)
-            if not cap.isOpened():
-                raise Exception("Could not open video file")
-
-            # Read first frame
-            ret, frame = cap.read()
-            if not ret:
-                raise Exception("Could not read video frame")
-
-            # Convert frame from BGR to RGB
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-            # Get frame dimensions
-            height, width, channel = frame_rgb.shape
-            bytes_per_line = 3 * width
-
-            # Create QImage from frame
-            q_img = QImage(frame_rgb.data, width, height,
-                         bytes_per_line, QImage.Format_RGB888)
-
-            # Convert to pixmap and scale
-            pixmap = QPixmap.fromImage(q_img)
-            scaled_pixmap = pixmap.scaled(
-                self.thumbnail_label.size(),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-
-            # Set thumbnail
-            self.thumbnail_label.setPixmap(scaled_pixmap)
+    def thumbnail_kind(self, file_path):
+        """Kind of thumbnail decoded for a file, None if it has none"""
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext in self.supported_image_formats:
+            return THUMBNAIL_IMAGE
+        if ext in self.supported_video_formats:
+            return THUMBNAIL_VIDEO
+        if ext in self.exr_file_ext:
+            return THUMBNAIL_EXR
+        return None
+
+    def prefetch(self, file_paths):
+        """
+        Warm thumbnails of neighbouring rows, replacing earlier prefetches
+
+        Args:
+            file_paths (list): Nearest first, the queue is worked in this order
+        """
+        self._prefetch_generation += 1
+        self.prefetch_pool.clear()
+        for file_path in file_paths:
+            kind = self.thumbnail_kind(file_path)
+            if kind is None or file_path in self.memory_cache:
+                continue
+            self.prefetch_pool.start(PrefetchTask(
+                self._prefetch_generation, file_path, kind, self.signals,
+                self.is_current_prefetch, self.pool
+            ))
+
+    def is_current_prefetch(self, generation):
+        return generation == self._prefetch_generation
+
+    def _on_thumbnail_prefetched(self, file_path, image):
+        self.memory_cache.put(file_path, image)
+
+    def request_thumbnail(self, file_path, kind):
+        """Queue a thumbnail on the pool, the label keeps its image until it is ready"""
+        self.current_3d_file = None
+        task = ThumbnailTask(self._generation, file_path, kind, self.signals, self.is_current)
+        self._thumbnail_pending = True
+        self.pool.start(task)
+        self.loading_timer.start()
+
+    def is_current(self, generation):
+        """Check whether a request still belongs to the latest selection"""
+        return generation == self._generation
+
+    def _show_loading(self):
+        """Replace a previous plate's thumbnail once a decode takes noticeably long"""
+        if self._scrub_frame is not None:
+            # Scrub frames are on screen, leaving shows the state again
+            return
+        self.thumbnail_label.clear()
+        self.thumbnail_label.setText("Loading...")
 
-            # Release video capture
-            cap.release()
+    def _on_thumbnail_ready(self, generation, file_path, image, status):
+        if generation != self._generation:
+            # Finished after the selection moved on
+            return
+        self.loading_timer.stop()
+        self._thumbnail_pending = False
 
-        except Exception as e:
-            print(f"Error loading video thumbnail: {str(e)}")
+        if status == THUMBNAIL_NEEDS_NUKE:
+            # Nuke only renders on the main thread
+            if nuke is None:
+                self.clear_thumbnail()
+            else:
+                self.set_thumbnail_exr_with_nuke(file_path)
+        elif status == THUMBNAIL_VIDEO_ERROR:
             self.thumbnail_label.setText("Video Preview\nError")
+        elif image.isNull():
+            self.clear_thumbnail()
+        else:
+            self.memory_cache.put(file_path, image)
+            self._show_thumbnail(QPixmap.fromImage(image))
+
+    def _show_thumbnail(self, pixmap):
+        """Show the selected plate's thumbnail, held back while the cursor scrubs"""
+        self._static_pixmap = pixmap
+        if self._scrub_frame is None:
+            self.thumbnail_label.setPixmap(pixmap)
 
     def set_image_thumbnail(self, file_path):
         """Set thumbnail for regular image files"""
@@ -107,7 +540,7 @@ class ThumbnailViewer(QWidget):
                     Qt.KeepAspectRatio,
                     Qt.SmoothTransformation
                 )
-                self.thumbnail_label.setPixmap(scaled_pixmap)
+                self._show_thumbnail(scaled_pixmap)
             else:
                 self.clear_thumbnail()
         except Exception as e:
@@ -135,7 +568,7 @@ class ThumbnailViewer(QWidget):
         else:
             self.clear_thumbnail()
 
-    def set_thumbnail_exr(self, file_path):
+    def set_thumbnail_exr_with_nuke(self, file_path):
         """Set thumbnail for EXR files by rendering to JPG using Nuke"""
         import tempfile
         from PySide2.QtWidgets import QApplication
@@ -144,6 +577,18 @@ class ThumbnailViewer(QWidget):
             # Mevcut aktif pencereyi kaydet
             main_window = QApplication.activeWindow()
 
+            # Render straight into the cache, the JPEG is the cache entry
+            cache = get_thumbnail_cache()
+            if cache is not None:
+                jpg_path = cache.put(file_path, *THUMBNAIL_SIZE,
+                                     lambda temp_path: self.render_exr_thumbnail(file_path, temp_path))
+                if jpg_path:
+                    self.set_image_thumbnail(jpg_path)
+                else:
+                    self.clear_thumbnail()
+                self._restore_window(main_window)
+                return
+
             # Temp dizini oluştur
             temp_dir = os.path.join(tempfile.gettempdir(), 'nuke_importer_thumbs')
             os.makedirs(temp_dir, exist_ok=True)
@@ -157,34 +602,7 @@ class ThumbnailViewer(QWidget):
                 jpg_filename = f"{os.path.splitext(os.path.basename(file_path))[0]}_temp.jpg"
             jpg_path = os.path.join(temp_dir, jpg_filename)
 
-            # Geçici Nuke node'ları oluştur
-            temp_read = nuke.createNode('Read', inpanel=False)
-            temp_read['file'].fromUserText(file_path)
-
-            # Write node'u oluştur
-            temp_write = nuke.createNode('Write', inpanel=False)
-            temp_write['file'].setValue(jpg_path.replace('\\', '/'))
-            temp_write['file_type'].setValue('jpeg')
-            temp_write['_jpeg_quality'].setValue(0.8)
-            temp_write['channels'].setValue('rgb')
-            temp_write['create_directories'].setValue(True)
-            temp_write.setInput(0, temp_read)
-
-            # Dizin yolunu doğrula
-            if not os.path.exists(os.path.dirname(jpg_path)):
-                os.makedirs(os.path.dirname(jpg_path), exist_ok=True)
-
-            # Nuke'un yolu tanımasını sağla
-            nuke.script_directory()
-
-            # Render işlemini gerçekleştir
-            frame = int(temp_read['first'].value())
-            print(frame)
-            nuke.execute(temp_write, frame, frame, continueOnError=True)
-
-            # Temizlik yap
-            nuke.delete(temp_write)
-            nuke.delete(temp_read)
+            self.render_exr_thumbnail(file_path, jpg_path)
 
             # Önizlemeyi ayarla
             self.set_image_thumbnail(jpg_path)
@@ -195,17 +613,153 @@ class ThumbnailViewer(QWidget):
             except:
                 pass
 
-            # Plugin penceresini tekrar öne getir
-            if main_window:
-                main_window.activateWindow()
-                main_window.raise_()
+            self._restore_window(main_window)
 
         except Exception as e:
             print(f"Error creating EXR thumbnail: {str(e)}")
             self.clear_thumbnail()
 
+    def render_exr_thumbnail(self, file_path, jpg_path):
+        """Render the first frame of an EXR to a thumbnail sized JPG using Nuke"""
+        # Geçici Nuke node'ları oluştur
+        temp_read = nuke.createNode('Read', inpanel=False)
+        temp_read['file'].fromUserText(file_path)
+
+        # Fit into the thumbnail, keeps cache entries small
+        temp_reformat = nuke.createNode('Reformat', inpanel=False)
+        temp_reformat['type'].setValue('to box')
+        temp_reformat['box_fixed'].setValue(True)
+        temp_reformat['box_width'].setValue(THUMBNAIL_SIZE[0])
+        temp_reformat['box_height'].setValue(THUMBNAIL_SIZE[1])
+        temp_reformat['resize'].setValue('fit')
+        temp_reformat.setInput(0, temp_read)
+
+        # Write node'u oluştur
+        temp_write = nuke.createNode('Write', inpanel=False)
+        temp_write['file'].setValue(jpg_path.replace('\\', '/'))
+        temp_write['file_type'].setValue('jpeg')
+        temp_write['_jpeg_quality'].setValue(0.8)
+        temp_write['channels'].setValue('rgb')
+        temp_write['create_directories'].setValue(True)
+        temp_write.setInput(0, temp_reformat)
+
+        # Dizin yolunu doğrula
+        if not os.path.exists(os.path.dirname(jpg_path)):
+            os.makedirs(os.path.dirname(jpg_path), exist_ok=True)
+
+        # Nuke'un yolu tanımasını sağla
+        nuke.script_directory()
+
+        try:
+            # Render işlemini gerçekleştir
+            frame = int(temp_read['first'].value())
+            nuke.execute(temp_write, frame, frame, continueOnError=True)
+        finally:
+            # Temizlik yap
+            nuke.delete(temp_write)
+            nuke.delete(temp_reformat)
+            nuke.delete(temp_read)
+
+    def _restore_window(self, main_window):
+        """Bring the plugin window back to the front after a Nuke render"""
+        # Plugin penceresini tekrar öne getir
+        if main_window:
+            main_window.activateWindow()
+            main_window.raise_()
+
+    def set_sequence(self, first_frame_path, first, last):
+        """
+        Enable hover scrubbing for the sequence whose thumbnail is shown
+
+        Args:
+            first_frame_path (str): Path of the first frame
+            first (int): First frame number
+            last (int): Last frame number
+        """
+        kind = self.thumbnail_kind(first_frame_path)
+        if not THUMBNAIL_SCRUB_ENABLED or last <= first or kind not in (THUMBNAIL_IMAGE, THUMBNAIL_EXR):
+            return
+        if tokenize_filename(os.path.basename(first_frame_path)).frame is None:
+            return
+        self._scrub_job = ScrubJob(first_frame_path, kind, first, last)
+
+    def _reset_scrub(self):
+        """Drop the scrub frames of the previous selection"""
+        self._scrub_job = None
+        self._scrub_started = False
+        self._scrub_frame = None
+        self._static_pixmap = None
+        self.scrub_thread.clear()
+
+    def on_thumbnail_enter(self, event):
+        """Start decoding scrub frames the first time the cursor enters"""
+        job = self._scrub_job
+        if job is None:
+            return
+        if not self.scrub_thread.isRunning():
+            self.scrub_thread.start()
+        if not self._scrub_started:
+            self._scrub_started = True
+            self.scrub_thread.set_job(self._generation, job)
+
+    def on_thumbnail_hover(self, event):
+        """Show the frame under the cursor, left edge first frame, right edge last"""
+        job = self._scrub_job
+        if job is None:
+            return
+        if not self._scrub_started:
+            # Selection changed under a resting cursor, no enter event came
+            self.on_thumbnail_enter(event)
+        position = min(max(event.x() / max(1, self.thumbnail_label.width()), 0.0), 1.0)
+        self._scrub_frame = job.first + int(round(position * (job.last - job.first)))
+        self.scrub_thread.focus(self._scrub_frame)
+        self._show_scrub_frame()
+
+    def on_thumbnail_leave(self, event):
+        """Go back to the plate's thumbnail"""
+        if self._scrub_frame is None:
+            return
+        self._scrub_frame = None
+        self.scrub_thread.focus(None)
+        if self._static_pixmap is not None:
+            self.thumbnail_label.setPixmap(self._static_pixmap)
+        elif self._thumbnail_pending:
+            self._show_loading()
+        else:
+            self.clear_thumbnail()
+
+    def _on_scrub_frame_ready(self, generation, frame):
+        if generation == self._generation and self._scrub_frame is not None:
+            self._show_scrub_frame()
+
+    def _show_scrub_frame(self):
+        """Show the decoded frame nearest the cursor"""
+        nearest = self._scrub_job.buffer.nearest(self._scrub_frame)
+        if nearest is None:
+            return
+        pixmap = QPixmap.fromImage(nearest[1]).scaled(
+            self.thumbnail_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
+        )
+        self.thumbnail_label.setPixmap(pixmap)
+        self.thumbnail_label.setToolTip(f"Frame {nearest[0]}")
+
+    def stop_threads(self):
+        """Drop queued thumbnails and wait for running decodes"""
+        self._generation += 1
+        self._prefetch_generation += 1
+        self.pool.clear()
+        self.prefetch_pool.clear()
+        self.scrub_thread.stop()
+        self.pool.waitForDone()
+        self.prefetch_pool.waitForDone()
+        self.scrub_thread.wait()
+
     def clear_thumbnail(self):
         """Clear the thumbnail"""
+        # A decode still running must not bring the old image back
+        self._generation += 1
+        self.loading_timer.stop()
+        self._thumbnail_pending = False
         self.thumbnail_label.clear()
         self.thumbnail_label.setText("No Preview Available")
         self.current_3d_file = None
@@ -1,66 +1,11 @@
 # nuke_importer/utils/file_utils.py
 import os
-import re
-import math
 import sys
 import subprocess
 from PySide2.QtWidgets import QProgressBar
 from ..config.settings import STYLES, SUPPORTED_FORMATS
+from .format_utils import format_size
 
-def format_size(size_bytes):
-    """Format file size to human-readable format"""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} TB"
-
-
-def get_sequence_size(file_path, base_name=None, frame_range=None, extension=None):
-    """
-    Calculate size of a file or folder
-
-    Args:
-        file_path (str): Path to the file or sequence
-        base_name (str, optional): Not used in this implementation
-        frame_range (str, optional): Used to determine if it's a sequence
-        extension (str, optional): Not used in this implementation
-
-    Returns:
-        str: Formatted size string (e.g. "1.5 GB")
-    """
-    try:
-        # If it's a sequence (has frame range), calculate folder size
-        if frame_range and "-" in str(frame_range):
-            folder_path = os.path.dirname(file_path)
-            total_size = 0
-
-            # Sum up sizes of all files in the folder
-            for f in os.listdir(folder_path):
-                file_path = os.path.join(folder_path, f)
-                if os.path.isfile(file_path):
-                    total_size += os.path.getsize(file_path)
-        else:
-            # Single file
-            if os.path.exists(file_path):
-                total_size = os.path.getsize(file_path)
-            else:
-                return "0.0 B"
-
-        # Convert to human readable format
-        if total_size == 0:
-            return "0.0 B"
-
-        size_names = ['B', 'KB', 'MB', 'GB', 'TB']
-        i = int(math.floor(math.log(total_size, 1024)))
-        p = math.pow(1024, i)
-        s = round(total_size / p, 2)
-
-        return f"{s} {size_names[i]}"
-
-    except Exception as e:
-        print(f"Error calculating size: {str(e)}")
-        return "0.0 B"
 
 def setup_status_bar():
     """Create and configure status bar"""
@@ -0,0 +1,11 @@
+# nuke_importer/utils/format_utils.py
+"""Display formatting shared by the core and the UI, kept free of Qt."""
+
+
+def format_size(size_bytes):
+    """Format file size to human-readable format"""
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if size_bytes < 1024:
+            return f"{size_bytes:.1f} {unit}"
+        size_bytes /= 1024
+    return f"{size_bytes:.1f} TB"
@@ -1,52 +1,178 @@
-# nuke_importer/utils/frame_utils.py
+# nuke_importer/utils/frame_pattern_utils.py
 import re
 import os
+from collections import namedtuple
+
+# Whole file name in one match:
+#   prefix, frame number, optional trailing version, extension
+# A frame either follows a separator or is 2+ digits that are not part of
+# a version token (v003) or a longer number. The greedy prefix finds the
+# last frame candidate first, names without one fall through to 'name'.
+_FILENAME_TOKENS = re.compile(r"""
+    ^(?:
+        (?P<prefix>.*)
+        (?P<frame>(?<=[._-])\d+|(?<![vV\d])\d{2,})
+        (?P<suffix>[._-][vV]\d+)?
+        (?=\.[^.]+$)
+    |
+        (?P<name>.*?)
+    )
+    (?P<ext>\.[^.]+)?$
+""", re.VERBOSE | re.DOTALL)
+
+# Version token that is not glued to a word (v003, _v12, .V2)
+_VERSION_TOKEN = re.compile(r'(?<![A-Za-z0-9])[vV](\d+)')
+
+# Version token with the separator in front of it, removed by strip_version
+_VERSION_WITH_SEPARATOR = re.compile(r'[._-]?(?<![A-Za-z0-9])[vV]\d+')
+
+# Frame placeholders in sequence paths (%04d, %d, ####)
+_FRAME_PLACEHOLDER = re.compile(r'%0?(\d*)d|#+')
+
+
+class FileToken(namedtuple('FileToken', ['prefix', 'frame', 'padding', 'suffix',
+                                         'version', 'extension'])):
+    """Tokenized file name: prefix, frame, padding, suffix, version and extension"""
+    __slots__ = ()
+
+    @property
+    def frame_token(self):
+        """printf style frame token with the original padding (%04d)"""
+        return f"%0{self.padding}d" if self.padding > 1 else "%d"
+
+    @property
+    def pattern_name(self):
+        """File name with the frame number replaced by its padded token"""
+        if self.frame is None:
+            return self.prefix + self.suffix + self.extension
+        return self.prefix + self.frame_token + self.suffix + self.extension
+
+    @property
+    def base_name(self):
+        """Sequence name without frame number, separators and extension"""
+        return self.prefix.rstrip('._-')
+
+    def frame_name(self, frame_number):
+        """File name of another frame of the same sequence"""
+        return f"{self.prefix}{str(frame_number).zfill(self.padding)}{self.suffix}{self.extension}"
+
+
+def split_frame(filename):
+    """
+    Split a file name around its frame number without building a token
+
+    Returns:
+        tuple: (prefix, frame digits or None, suffix, extension). Without a
+            frame number the prefix is the whole name before the extension
+    """
+    prefix, frame, suffix, name, ext = _FILENAME_TOKENS.match(filename).groups()
+    if frame is None:
+        return name, None, '', ext or ''
+    return prefix, frame, suffix or '', ext
+
+
+def tokenize_filename(filename):
+    """
+    Split a file name into prefix / frame / padding / suffix / version / extension
+
+    Args:
+        filename (str): File name without directory
+
+    Returns:
+        FileToken: frame is None (and padding 0) when the name has no frame number
+    """
+    match = _FILENAME_TOKENS.match(filename)
+    frame, ext = match.group('frame', 'ext')
+
+    version_match = _VERSION_TOKEN.search(filename)
+    version = f"v{version_match.group(1)}" if version_match else None
+
+    if frame is None:
+        return FileToken(match.group('name'), None, 0, '', version, ext or '')
+    return FileToken(match.group('prefix'), int(frame), len(frame), match.group('suffix') or '',
+                     version, ext)
+
+
+def version_number(version):
+    """Numeric value of a version token (v010 -> 10), -1 if it has none"""
+    digits = version[1:] if version[:1] in ('v', 'V') else version
+    return int(digits) if digits.isdigit() else -1
+
+
+def strip_version(name):
+    """
+    Name or path without its version tokens, shared by every version of a plate
 
+    shot_comp_v003.%04d.exr -> shot_comp.%04d.exr, /show/v002/plate -> /show//plate
+    """
+    return _VERSION_WITH_SEPARATOR.sub('', name)
+
+
+def sequence_padding(first_token, widths):
+    """
+    Padding of a sequence's frame token
+
+    Args:
+        first_token (FileToken): Token of the lowest frame
+        widths (set): Digit widths of all frames
+
+    Returns:
+        int: Width for %0Nd, 1 for unpadded %d. A padded sequence that runs
+            past its padding (0999 .. 10000) keeps the padding of its lowest
+            frame, any other mix of widths (8, 9, 10) is unpadded.
+    """
+    if len(widths) == 1:
+        return first_token.padding
+    if first_token.padding > len(str(first_token.frame)):
+        # Lowest frame has leading zeros
+        return first_token.padding
+    return 1
+
+
+def _placeholder_to_frame(match):
+    """Replace a frame placeholder with a zero frame of the same padding"""
+    if match.group(0).startswith('#'):
+        return '0' * len(match.group(0))
+    return '0' * max(1, int(match.group(1) or 1))
+
+
+def tokenize_sequence_name(name):
+    """Tokenize a file name or a sequence pattern such as plate.%04d.exr"""
+    return tokenize_filename(_FRAME_PLACEHOLDER.sub(_placeholder_to_frame, name, count=1))
 
-class FramePattern:
-    def __init__(self):
-        # Frame pattern tipleri
-        self.patterns = [
-            r'.*?[._](\d{6})\.[^.]+$',  # 6 haneli: 000001
-            r'.*?[._](\d{5})\.[^.]+$',  # 5 haneli: 00001
-            r'.*?[._](\d{4})\.[^.]+$',  # 4 haneli: 0001
-            r'.*?[._](\d{3})\.[^.]+$',  # 3 haneli: 001
-            r'.*?[._](\d{1,2})\.[^.]+$'  # 1-2 haneli: 1 veya 01
-        ]
 
+class FramePattern:
     def analyze_sequence(self, dirname, basename):
         """Dizindeki sequence dosyalarını analiz et"""
         try:
+            token = tokenize_sequence_name(basename)
+            if token.frame is None:
+                return None
+
             # Dizindeki tüm dosyaları al
             files = [f for f in os.listdir(dirname) if os.path.isfile(os.path.join(dirname, f))]
 
-            # Base name'e uyan dosyaları filtrele
-            base_pattern = re.escape(re.sub(r'\d+\.[^.]+$', '', basename))
-            matching_files = [f for f in files if re.match(f"{base_pattern}\d+\.[^.]+$", f)]
-
-            if not matching_files:
-                return None
-
             # Frame numaralarını topla
             frames = []
-            padding = None
+            widths = set()
+            first_token = None
             ext = None
 
-            for f in matching_files:
-                for pattern in self.patterns:
-                    match = re.match(pattern, f)
-                    if match:
-                        frame_num = int(match.group(1))
-                        padding = len(match.group(1))
-                        ext = os.path.splitext(f)[1]
-                        frames.append(frame_num)
-                        break
+            for f in files:
+                other = tokenize_filename(f)
+                if (other.frame is not None and other.prefix == token.prefix
+                        and other.suffix == token.suffix and other.extension == token.extension):
+                    frames.append(other.frame)
+                    widths.add(other.padding)
+                    if first_token is None or other.frame < first_token.frame:
+                        first_token = other
+                    ext = other.extension
 
             if frames:
                 return {
                     'min_frame': min(frames),
                     'max_frame': max(frames),
-                    'padding': padding,
+                    'padding': sequence_padding(first_token, widths),
                     'extension': ext,
                     'frame_count': len(frames),
                     'frames': sorted(frames)
@@ -59,15 +185,9 @@ class FramePattern:
     def get_frame_path(self, sequence_dir, basename, frame_number, padding):
         """Belirli bir frame için dosya yolunu oluştur"""
         try:
-            # Base pattern'i bul
-            base = re.sub(r'\d+\.[^.]+$', '', basename)
-            ext = os.path.splitext(basename)[1]
-
-            # Frame numarasını formatla
-            padded_num = str(frame_number).zfill(padding)
-
             # Dosya adını oluştur
-            frame_name = f"{base}{padded_num}{ext}"
+            token = tokenize_sequence_name(basename)._replace(padding=padding)
+            frame_name = token.frame_name(frame_number)
 
             # Tam yolu döndür
             return os.path.join(sequence_dir, frame_name)
@@ -7,6 +7,7 @@ import re
 def create_read_node(file_path, frame_range=None, colorspace=None,
                      localize=False, pos_x=0, pos_y=0):
     """Create a Read node with the given settings"""
+    read_node = None
     try:
         read_node = nuke.nodes.Read()
         read_node.setXYpos(pos_x, pos_y)
@@ -36,6 +37,9 @@ def create_read_node(file_path, frame_range=None, colorspace=None,
         return read_node
     except Exception as e:
         print(f"Error creating Read node: {str(e)}")
+        # Don't leave a half set up node in the script
+        if read_node is not None:
+            nuke.delete(read_node)
         return None
 
 